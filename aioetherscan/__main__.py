@@ -0,0 +1,5 @@
+import sys
+
+from aioetherscan.cli import main
+
+sys.exit(main())
@@ -0,0 +1,455 @@
+"""Command line interface for bulk export jobs, see ``python -m aioetherscan --help``."""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import deque
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Optional, Sequence, Union
+
+from aioetherscan.client import Client
+from aioetherscan.modules.block import Block
+from aioetherscan.modules.extra.daily_stats import DailyStats
+from aioetherscan.modules.extra.export import CsvSink, JsonlSink, ParquetSink, Sink
+from aioetherscan.modules.extra.generators.checkpoint import (
+    CheckpointStore,
+    SqliteCheckpointStore,
+    State,
+)
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+from aioetherscan.modules.gas_tracker import GasTracker
+from aioetherscan.modules.stats import Stats
+
+Row = dict[str, Any]
+
+_SINKS: dict[str, type[Sink]] = dict(jsonl=JsonlSink, csv=CsvSink, parquet=ParquetSink)
+_KINDS = ('normal', 'internal', 'erc20', 'erc721', 'erc1155', 'activity', 'logs')
+_RESUMABLE_KINDS = ('normal', 'internal', 'erc20', 'erc721', 'erc1155')
+# daily series methods by client module
+_DAILY_METHODS = {
+    name: module
+    for module, cls in (('block', Block), ('gas_tracker', GasTracker), ('stats', Stats))
+    for name, endpoint in cls.endpoints.items()
+    if {'start_date', 'end_date'} <= endpoint.args
+}
+_API_KEYS_ENV = 'ETHERSCAN_API_KEY'
+
+logger = logging.getLogger(__name__)
+
+
+class Progress:
+    def __init__(self, jobs: int) -> None:
+        self.jobs = jobs
+        self.done = self.skipped = self.failed = 0
+        self.rows = self.requests = 0
+        self._started_at = time.monotonic()
+
+    def report(self) -> str:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return (
+            f'{self.done + self.skipped}/{self.jobs} jobs ({self.skipped} skipped, '
+            f'{self.failed} failed), {self.rows:,} rows ({self.rows / elapsed:,.0f}/s), '
+            f'{self.requests:,} requests ({self.requests / elapsed:.1f}/s) in {elapsed:.0f}s'
+        )
+
+
+class CountingThrottler:
+    """Throttler of a client which counts its requests."""
+
+    def __init__(self, rate_limit: float, progress: Progress) -> None:
+        from asyncio_throttle import Throttler
+
+        self._throttler = Throttler(rate_limit=rate_limit, period=1.0)
+        self._progress = progress
+
+    async def __aenter__(self) -> None:
+        await self._throttler.__aenter__()
+        self._progress.requests += 1
+
+    async def __aexit__(self, *args) -> None:
+        await self._throttler.__aexit__(*args)
+
+
+class DeferredStore(CheckpointStore):
+    """Keeps generator checkpoints till the rows yielded before them are flushed, then saves
+    them together with the output position they continue from."""
+
+    def __init__(self, store: CheckpointStore, position_key: str) -> None:
+        self._store = store
+        self._position_key = position_key
+        self._pending: dict[str, State] = {}
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def load(self, key: str) -> Optional[State]:
+        return self._store.load(key)
+
+    def save(self, key: str, state: State) -> None:
+        self._pending[key] = state
+
+    def commit(self, position: tuple[int, int]) -> None:
+        """Saves pending checkpoints, ``position`` is the output part and its size."""
+        if not self._pending:
+            return
+        for key, state in self._pending.items():
+            self._store.save(key, state)
+        part, size = position
+        self._store.save(self._position_key, dict(part=part, size=size))
+        self._pending.clear()
+
+
+def truncate_output(path: str, position: Optional[State]) -> None:
+    """Cuts output of an interrupted export back to the position of its checkpoints, so rows
+    written after them are not duplicated on resume. Files of later parts are removed."""
+    part, size = (position['part'], position['size']) if position is not None else (0, 0)
+    file_path = path.format(part=part, block=0)
+    if os.path.exists(file_path):
+        os.truncate(file_path, size)
+
+    while True:
+        part += 1
+        next_path = path.format(part=part, block=0)
+        if next_path == file_path or not os.path.exists(next_path):
+            break
+        os.remove(next_path)
+
+
+def parse_block(value: str) -> Union[int, datetime]:
+    """Block number or ISO date/datetime."""
+    if value.isdigit():
+        return int(value)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid block number or date: {value!r}')
+
+
+def parse_param(value: str) -> tuple[str, str]:
+    name, sep, param = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f'invalid param {value!r}, expected name=value')
+    return name, param
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m aioetherscan')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log generators progress')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--api-key',
+        action='append',
+        dest='api_keys',
+        help=f'API key, repeat to export with a pool of keys (default: ${_API_KEYS_ENV}, '
+        f'comma separated)',
+    )
+    common.add_argument('--api-kind', default='eth')
+    common.add_argument('--network', default='main')
+    common.add_argument(
+        '--rate-limit', type=float, default=5, help='requests per second per key (default: 5)'
+    )
+    common.add_argument('--format', choices=list(_SINKS), default='jsonl')
+    common.add_argument('--checkpoint', help='SQLite file keeping progress and caches')
+    common.add_argument('--batch-size', type=int, default=1000, help='rows per file write')
+
+    export = commands.add_parser(
+        'export',
+        parents=[common],
+        help='export txs, transfers or logs of addresses',
+        description='Exports rows of every address to its own files.',
+    )
+    export.add_argument('kind', choices=_KINDS)
+    export.add_argument('addresses', nargs='*', metavar='address')
+    export.add_argument('--addresses-file', help='file with an address per line')
+    export.add_argument(
+        '-o',
+        '--output',
+        required=True,
+        help='output path, formatted with {kind}, {address} and {part}, e.g. '
+        'out/{kind}-{address}-{part}.jsonl',
+    )
+    export.add_argument('--start-block', type=parse_block, default=0, help='number or date')
+    export.add_argument(
+        '--end-block', type=parse_block, help='number or date (default: chain head at start)'
+    )
+    export.add_argument(
+        '--resume',
+        action='store_true',
+        help='skip finished addresses and continue the unfinished ones from the checkpoint',
+    )
+    export.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='addresses exported at once, at least one per API key (default: 4)',
+    )
+    export.add_argument('--blocks-limit', type=int, default=2048, help='initial window size')
+    export.add_argument('--target-rows', type=int, help='adapt window size to rows per request')
+    export.add_argument('--shards', type=int, default=1)
+    export.add_argument('--prefetch', type=int, default=0)
+    export.add_argument('--cursor', action='store_true', help='paginate dense windows')
+    export.add_argument('--open-range', action='store_true', help='scan sparse addresses')
+    export.add_argument('--max-file-size', type=int, help='rotate files after bytes written')
+    export.add_argument(
+        '--progress-interval', type=float, default=10, help='seconds between progress reports'
+    )
+    export.set_defaults(func=run_export)
+
+    daily = commands.add_parser(
+        'daily-stats',
+        parents=[common],
+        help='export a daily stats series',
+        description='Exports a daily series, a row per day.',
+    )
+    daily.add_argument('method', choices=sorted(_DAILY_METHODS))
+    daily.add_argument('--start-date', type=date.fromisoformat, required=True)
+    daily.add_argument('--end-date', type=date.fromisoformat, required=True)
+    daily.add_argument('-o', '--output', required=True)
+    daily.add_argument(
+        '--param',
+        type=parse_param,
+        action='append',
+        default=[],
+        help='extra method param, e.g. client_type=geth',
+    )
+    daily.set_defaults(func=run_daily_stats)
+    return parser
+
+
+def get_api_keys(args: argparse.Namespace) -> list[str]:
+    keys = args.api_keys or os.environ.get(_API_KEYS_ENV, '').split(',')
+    return [key.strip() for key in keys if key.strip()]
+
+
+def get_chain(args: argparse.Namespace) -> str:
+    """Prefix of the checkpoint keys, as ``Client.chain``, so a store reused for another
+    chain does not resume from its progress."""
+    return f'{args.api_kind.lower().strip()}:{args.network.lower().strip()}'
+
+
+def get_addresses(args: argparse.Namespace) -> list[str]:
+    addresses = list(args.addresses)
+    if args.addresses_file:
+        with open(args.addresses_file) as f:
+            addresses.extend(line.split('#')[0].strip() for line in f)
+    return list(dict.fromkeys(a.lower() for a in addresses if a))
+
+
+def get_rows(
+    client: Client, args: argparse.Namespace, address: str, store: Optional[CheckpointStore]
+) -> AsyncIterator[Row]:
+    generators = client.extra.generators
+    blocks = dict(start_block=args.start_block)
+    if args.end_block is not None:
+        blocks.update(end_block=args.end_block)
+
+    if args.kind == 'logs':
+        return generators.logs(address=address, blocks_limit=args.blocks_limit, **blocks)
+
+    window = dict(
+        blocks_limit=args.blocks_limit,
+        target_rows=args.target_rows,
+        cursor=args.cursor,
+        open_range=args.open_range,
+    )
+    if args.kind == 'activity':
+        return generators.account_activity(address, **blocks, **window)
+
+    parsing = dict(
+        shards=args.shards,
+        prefetch=args.prefetch,
+        checkpoint=store,
+        resume=store is not None and args.resume,
+    )
+    if args.kind == 'normal':
+        return generators.normal_txs(address, **blocks, **window, **parsing)
+    if args.kind == 'internal':
+        return generators.internal_txs(address, **blocks, **window, **parsing)
+    return generators.token_transfers(
+        address=address, token_standard=args.kind, **blocks, **window, **parsing
+    )
+
+
+async def export_address(
+    client: Client,
+    args: argparse.Namespace,
+    address: str,
+    store: Optional[CheckpointStore],
+    progress: Progress,
+) -> bool:
+    """Exports rows of the address, returns False if it has been exported before.
+
+    Generator checkpoints are saved only after the rows before them are flushed, with the
+    output size at that point. A resumed export cuts the files back to it and continues them.
+    """
+    key = f'export:{get_chain(args)}:{args.kind}:{address}:{args.start_block}:{args.end_block}'
+    if store is not None and args.resume and store.load(key) is not None:
+        return False
+
+    deferred = None
+    if store is not None and args.kind in _RESUMABLE_KINDS:
+        deferred = DeferredStore(store, f'{key}:position')
+    path = args.output.format(kind=args.kind, address=address, part='{part}', block='{block}')
+    if deferred is not None and args.resume:
+        truncate_output(path, store.load(f'{key}:position'))
+    sink = _SINKS[args.format](
+        path,
+        batch_size=args.batch_size,
+        max_file_size=args.max_file_size,
+        append=args.resume and deferred is not None,
+    )
+
+    async def commit() -> None:
+        await sink.flush()
+        if deferred is not None:
+            deferred.commit(sink.position)
+
+    async with sink:
+        finished = False
+        try:
+            async for row in get_rows(client, args, address, deferred):
+                if deferred is not None and deferred.pending:
+                    await commit()
+                await sink.write(row)
+                progress.rows += 1
+            finished = True
+        finally:
+            if not finished and deferred is not None and not deferred.pending:
+                sink.discard()  # rows of an unfinished window, exported again on resume
+            await commit()
+
+    if store is not None:
+        store.save(key, dict(rows=sink.rows_written, paths=sink.paths))
+    return True
+
+
+async def resolve_end_block(
+    client: Client, args: argparse.Namespace, store: Optional[CheckpointStore]
+) -> None:
+    """Pins a missing end block to the chain head once per run, otherwise generators scan
+    windows up to ``sys.maxsize``. The head is kept in the store for resumed runs, whose
+    checkpoint keys include the end block."""
+    if args.end_block is not None:
+        return
+    key = f'export:{get_chain(args)}:{args.kind}:head:{args.start_block}'
+    state = store.load(key) if store is not None and args.resume else None
+    if state is None:
+        state = dict(block=hex_to_int(await client.proxy.block_number()))
+        if store is not None:
+            store.save(key, state)
+    args.end_block = state['block']
+
+
+async def report_progress(progress: Progress, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        print(progress.report(), file=sys.stderr)
+
+
+async def run_export(args: argparse.Namespace) -> int:
+    keys, addresses = get_api_keys(args), get_addresses(args)
+    if not keys:
+        raise ValueError(f'No API keys, pass --api-key or set ${_API_KEYS_ENV}.')
+    if not addresses:
+        raise ValueError('No addresses, pass them as arguments or with --addresses-file.')
+    if args.resume and args.checkpoint is None:
+        raise ValueError('--resume requires --checkpoint.')
+    if args.kind == 'activity' and args.format != 'jsonl':
+        raise ValueError('Rows of activity differ by kind, export them with --format jsonl.')
+    if args.format == 'parquet' and (args.resume or args.checkpoint is not None):
+        raise ValueError(
+            'Parquet files can not be appended to, export them without --resume '
+            'and --checkpoint.'
+        )
+    if len(addresses) > 1 and '{address}' not in args.output:
+        raise ValueError('Addresses would overwrite each other, add {address} to --output.')
+
+    progress = Progress(len(addresses))
+    store = SqliteCheckpointStore(args.checkpoint) if args.checkpoint else None
+    clients = [
+        Client(
+            key,
+            args.api_kind,
+            args.network,
+            throttler=CountingThrottler(args.rate_limit, progress),
+        )
+        for key in keys
+    ]
+    queue = deque(addresses)
+
+    async def work(client: Client) -> None:
+        while queue:
+            address = queue.popleft()
+            try:
+                exported = await export_address(client, args, address, store, progress)
+            except Exception as e:  # a failed address doesn't stop the others
+                progress.failed += 1
+                logger.error(f'Export of {args.kind} of {address} failed: {e}')
+            else:
+                if exported:
+                    progress.done += 1
+                else:
+                    progress.skipped += 1
+
+    reporter = asyncio.create_task(report_progress(progress, args.progress_interval))
+    try:
+        await resolve_end_block(clients[0], args, store)
+        workers = min(max(args.concurrency, len(clients)), len(queue))
+        await asyncio.gather(*(work(clients[i % len(clients)]) for i in range(workers)))
+    finally:
+        reporter.cancel()
+        await asyncio.gather(*(client.close() for client in clients))
+        if store is not None:
+            store.close()
+
+    print(progress.report(), file=sys.stderr)
+    return 1 if progress.failed else 0
+
+
+async def run_daily_stats(args: argparse.Namespace) -> int:
+    keys = get_api_keys(args)
+    if not keys:
+        raise ValueError(f'No API keys, pass --api-key or set ${_API_KEYS_ENV}.')
+
+    progress = Progress(1)
+    store = SqliteCheckpointStore(args.checkpoint) if args.checkpoint else None
+    client = Client(
+        keys[0], args.api_kind, args.network, throttler=CountingThrottler(args.rate_limit, progress)
+    )
+    try:
+        api_method = getattr(getattr(client, _DAILY_METHODS[args.method]), args.method)
+        series = await DailyStats(client, store).fetch(
+            api_method, args.start_date, args.end_date, **dict(args.param)
+        )
+        async with _SINKS[args.format](args.output, batch_size=args.batch_size) as sink:
+            for i, day in enumerate(series.dates):
+                await sink.write(
+                    dict(date=day.isoformat(), **{k: v[i] for k, v in series.columns.items()})
+                )
+        progress.rows, progress.done = sink.rows_written, 1
+    finally:
+        await client.close()
+        if store is not None:
+            store.close()
+
+    print(progress.report(), file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+    )
+    try:
+        return asyncio.run(args.func(args))
+    except ValueError as e:
+        parser.error(str(e))
@@ -1,13 +1,10 @@
 from asyncio import AbstractEventLoop
-from typing import AsyncContextManager
-
-from aiohttp import ClientTimeout
-from aiohttp_retry import RetryOptionsBase
+from functools import cached_property
+from typing import TYPE_CHECKING, AsyncContextManager
 
 from aioetherscan.modules.account import Account
 from aioetherscan.modules.block import Block
 from aioetherscan.modules.contract import Contract
-from aioetherscan.modules.extra import ExtraModules
 from aioetherscan.modules.gas_tracker import GasTracker
 from aioetherscan.modules.logs import Logs
 from aioetherscan.modules.proxy import Proxy
@@ -16,33 +13,71 @@ from aioetherscan.modules.token import Token
 from aioetherscan.modules.transaction import Transaction
 from aioetherscan.network import Network, UrlBuilder
 
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientTimeout
+    from aiohttp_retry import RetryOptionsBase
+
+    from aioetherscan.modules.extra import ExtraModules
+
 
 class Client:
+    """Modules are built on first access, so short-lived clients pay only for what they use."""
+
     def __init__(
         self,
         api_key: str,
         api_kind: str = 'eth',
         network: str = 'main',
         loop: AbstractEventLoop = None,
-        timeout: ClientTimeout = None,
+        timeout: 'ClientTimeout' = None,
         proxy: str = None,
         throttler: AsyncContextManager = None,
-        retry_options: RetryOptionsBase = None,
+        retry_options: 'RetryOptionsBase' = None,
     ) -> None:
         self._url_builder = UrlBuilder(api_key, api_kind, network)
         self._http = Network(self._url_builder, loop, timeout, proxy, throttler, retry_options)
 
-        self.account = Account(self)
-        self.block = Block(self)
-        self.contract = Contract(self)
-        self.transaction = Transaction(self)
-        self.stats = Stats(self)
-        self.logs = Logs(self)
-        self.proxy = Proxy(self)
-        self.token = Token(self)
-        self.gas_tracker = GasTracker(self)
+    @cached_property
+    def account(self) -> Account:
+        return Account(self)
+
+    @cached_property
+    def block(self) -> Block:
+        return Block(self)
+
+    @cached_property
+    def contract(self) -> Contract:
+        return Contract(self)
+
+    @cached_property
+    def transaction(self) -> Transaction:
+        return Transaction(self)
+
+    @cached_property
+    def stats(self) -> Stats:
+        return Stats(self)
 
-        self.extra = ExtraModules(self, self._url_builder)
+    @cached_property
+    def logs(self) -> Logs:
+        return Logs(self)
+
+    @cached_property
+    def proxy(self) -> Proxy:
+        return Proxy(self)
+
+    @cached_property
+    def token(self) -> Token:
+        return Token(self)
+
+    @cached_property
+    def gas_tracker(self) -> GasTracker:
+        return GasTracker(self)
+
+    @cached_property
+    def extra(self) -> 'ExtraModules':
+        from aioetherscan.modules.extra import ExtraModules
+
+        return ExtraModules(self, self._url_builder)
 
     @property
     def currency(self) -> str:
@@ -52,6 +87,10 @@ class Client:
     def api_kind(self) -> str:
         return self._url_builder.api_kind.title()
 
+    @property
+    def chain(self) -> str:
+        return self._url_builder.chain
+
     @property
     def scaner_url(self) -> str:
         return self._url_builder.BASE_URL
@@ -1,4 +1,4 @@
-from datetime import date
+from operator import methodcaller
 from typing import Union
 
 
@@ -84,11 +84,9 @@ def check_token_standard(token_standard: str) -> str:
     return check_value(token_standard, _TOKEN_STANDARDS)
 
 
-def get_daily_stats_params(action: str, start_date: date, end_date: date, sort: str) -> dict:
-    return dict(
-        module='stats',
-        action=action,
-        startdate=start_date.isoformat(),
-        enddate=end_date.isoformat(),
-        sort=check_sort_direction(sort),
-    )
+# params of the daily stats endpoints sent with ``module='stats'``
+DAILY_STATS_PARAMS = dict(
+    start_date=('startdate', methodcaller('isoformat')),
+    end_date=('enddate', methodcaller('isoformat')),
+    sort=check_sort_direction,
+)
@@ -6,7 +6,14 @@ from aioetherscan.common import (
     check_blocktype,
     check_token_standard,
 )
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.modules.base import BaseModule, endpoint
+
+_TXS_PARAMS = dict(start_block='startblock', end_block='endblock', sort=check_sort_direction)
+_TOKEN_ACTIONS = dict(erc20='tokentx', erc721='tokennfttx', erc1155='token1155tx')
+
+
+def _get_token_action(token_standard: str) -> Optional[str]:
+    return _TOKEN_ACTIONS.get(check_token_standard(token_standard))
 
 
 class Account(BaseModule):
@@ -15,20 +22,17 @@ class Account(BaseModule):
     https://docs.etherscan.io/api-endpoints/accounts
     """
 
-    @property
-    def _module(self) -> str:
-        return 'account'
+    _module = 'account'
 
+    @endpoint('balance', dict(tag=check_tag))
     async def balance(self, address: str, tag: str = 'latest') -> str:
         """Get Ether Balance for a single Address."""
-        return await self._get(action='balance', address=address, tag=check_tag(tag))
 
+    @endpoint('balancemulti', dict(addresses=('address', ','.join), tag=check_tag))
     async def balances(self, addresses: Iterable[str], tag: str = 'latest') -> list[dict]:
         """Get Ether Balance for multiple Addresses in a single call."""
-        return await self._get(
-            action='balancemulti', address=','.join(addresses), tag=check_tag(tag)
-        )
 
+    @endpoint('txlist', _TXS_PARAMS)
     async def normal_txs(
         self,
         address: str,
@@ -39,16 +43,8 @@ class Account(BaseModule):
         offset: Optional[int] = None,
     ) -> list[dict]:
         """Get a list of 'Normal' Transactions By Address."""
-        return await self._get(
-            action='txlist',
-            address=address,
-            startblock=start_block,
-            endblock=end_block,
-            sort=check_sort_direction(sort),
-            page=page,
-            offset=offset,
-        )
 
+    @endpoint('txlistinternal', _TXS_PARAMS)
     async def internal_txs(
         self,
         address: str,
@@ -60,17 +56,16 @@ class Account(BaseModule):
         txhash: Optional[str] = None,
     ) -> list[dict]:
         """Get a list of 'Internal' Transactions by Address or Transaction Hash."""
-        return await self._get(
-            action='txlistinternal',
-            address=address,
-            startblock=start_block,
-            endblock=end_block,
-            sort=check_sort_direction(sort),
-            page=page,
-            offset=offset,
-            txhash=txhash,
-        )
 
+    @endpoint(
+        None,
+        dict(
+            _TXS_PARAMS,
+            contract_address='contractaddress',
+            token_standard=('action', _get_token_action),
+        ),
+        any_of=('address', 'contract_address'),
+    )
     async def token_transfers(
         self,
         address: Optional[str] = None,
@@ -83,23 +78,8 @@ class Account(BaseModule):
         token_standard: str = 'erc20',
     ) -> list[dict]:
         """Get a list of "ERC20 - Token Transfer Events" by Address"""
-        if not address and not contract_address:
-            raise ValueError('At least one of address or contract_address must be specified.')
-
-        token_standard = check_token_standard(token_standard)
-        actions = dict(erc20='tokentx', erc721='tokennfttx', erc1155='token1155tx')
-
-        return await self._get(
-            action=actions.get(token_standard),
-            address=address,
-            startblock=start_block,
-            endblock=end_block,
-            sort=check_sort_direction(sort),
-            page=page,
-            offset=offset,
-            contractaddress=contract_address,
-        )
 
+    @endpoint('getminedblocks', dict(blocktype=check_blocktype))
     async def mined_blocks(
         self,
         address: str,
@@ -108,14 +88,8 @@ class Account(BaseModule):
         offset: Optional[int] = None,
     ) -> list:
         """Get list of Blocks Validated by Address"""
-        return await self._get(
-            action='getminedblocks',
-            address=address,
-            blocktype=check_blocktype(blocktype),
-            page=page,
-            offset=offset,
-        )
 
+    @endpoint('txsBeaconWithdrawal', _TXS_PARAMS)
     async def beacon_chain_withdrawals(
         self,
         address: str,
@@ -126,18 +100,7 @@ class Account(BaseModule):
         offset: Optional[int] = None,
     ) -> list[dict]:
         """Get Beacon Chain Withdrawals by Address and Block Range"""
-        return await self._get(
-            action='txsBeaconWithdrawal',
-            address=address,
-            startblock=start_block,
-            endblock=end_block,
-            sort=check_sort_direction(sort),
-            page=page,
-            offset=offset,
-        )
 
+    @endpoint('balancehistory')
     async def account_balance_by_blockno(self, address: str, blockno: int) -> str:
         """Get Historical Ether Balance for a Single Address By BlockNo"""
-        return await self._get(
-            module='account', action='balancehistory', address=address, blockno=blockno
-        )
@@ -1,17 +1,198 @@
-from abc import ABC, abstractmethod
+import inspect
+from functools import lru_cache, update_wrapper
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
 
+F = TypeVar('F', bound=Callable)
 
-class BaseModule(ABC):
-    def __init__(self, client):
-        self._client = client
+Check = Callable[[Any], Any]
+# API param name of an argument, a function checking and converting its value, both of
+# them, or None for an argument which is not sent as is
+ParamMapping = Union[None, str, Check, tuple[str, Check]]
+
+
+class Param(NamedTuple):
+    """API param sent for an argument of an API method."""
+
+    arg: str
+    name: str
+    check: Optional[Check] = None
+
+
+class Endpoint(NamedTuple):
+    """Metadata of an API method, collected once instead of inspecting it on every use."""
+
+    name: str  # e.g. ``Account.normal_txs``
+    args: frozenset[str]
+    module: Optional[str] = None
+    action: Optional[str] = None  # None where an argument chooses it
+    params: tuple[Param, ...] = ()
 
     @property
-    @abstractmethod
-    def _module(self) -> str:
-        """Returns API module name."""
+    def key(self) -> str:
+        """Identifies the request in cache and checkpoint keys, e.g. ``account:txlist``,
+        the method name where the action is not fixed."""
+        if self.module is None or self.action is None:
+            return self.name
+        return f'{self.module}:{self.action}'
+
+
+class _Request(NamedTuple):
+    action: Optional[str]
+    params: dict[str, ParamMapping]
+    module: Optional[str]
+    post: Union[bool, str]
+    extra: Optional[str]
+    any_of: tuple[str, ...]
+
+
+def endpoint(
+    action: Optional[str],
+    params: Optional[dict[str, ParamMapping]] = None,
+    *,
+    module: Optional[str] = None,
+    post: Union[bool, str] = False,
+    extra: Optional[str] = None,
+    any_of: tuple[str, ...] = (),
+) -> Callable[[F], F]:
+    """Declares the request an API method sends, the method body is generated from it.
+
+    ``params`` maps arguments to API params, arguments missing there are sent under
+    their own names. ``module`` is set where it differs from the class one, ``post`` is
+    True or the argument choosing POST. Arguments mapped to None are passed to the
+    ``extra`` method returning more params. At least one of ``any_of`` arguments must
+    be passed.
+    """
+
+    def decorate(function: F) -> F:
+        function.__request__ = _Request(action, params or {}, module, post, extra, any_of)
+        return function
+
+    return decorate
+
+
+def get_endpoint(api_method: Callable) -> Endpoint:
+    """Returns metadata of a module method, other callables are inspected once."""
+    function = getattr(api_method, '__func__', api_method)
+    metadata = getattr(function, '__endpoint__', None)
+    if isinstance(metadata, Endpoint):
+        return metadata
+    return _inspect_endpoint(function)
+
+
+@lru_cache(maxsize=None)
+def _inspect_endpoint(function: Callable) -> Endpoint:
+    args = inspect.getfullargspec(function).args
+    return Endpoint(
+        getattr(function, '__qualname__', None) or getattr(function, '__name__', repr(function)),
+        frozenset(a for a in args if a != 'self'),
+    )
+
+
+def _get_params(cls_name: str, args: list[str], request: _Request) -> tuple[Param, ...]:
+    unknown = set(request.params).difference(args)
+    if unknown:
+        raise TypeError(f'Unknown arguments {sorted(unknown)} in {cls_name} endpoint params.')
+
+    params = []
+    for arg in args:
+        mapping = request.params.get(arg, arg)
+        if mapping is None:
+            continue
+        if isinstance(mapping, str):
+            params.append(Param(arg, mapping))
+        elif isinstance(mapping, tuple):
+            params.append(Param(arg, *mapping))
+        else:
+            params.append(Param(arg, arg, mapping))
+    return tuple(params)
+
+
+def _compile(
+    function: Callable, args: list[str], endpoint_: Endpoint, request: _Request, module: str
+) -> Callable:
+    """Generates the API method sending the declared request, as ``dataclasses`` does.
+
+    Checks defined in the module of the method are looked up there as in a hand written
+    method, other ones are bound to the generated method.
+    """
+    globals_, checks = function.__globals__, {}
+    kwargs = [] if endpoint_.module == module else [f'module={endpoint_.module!r}']
+    if endpoint_.action is not None:
+        kwargs.append(f'action={endpoint_.action!r}')
+    for param in endpoint_.params:
+        if param.check is None:
+            kwargs.append(f'{param.name}={param.arg}')
+            continue
+        check_name = getattr(param.check, '__name__', None)
+        if globals_.get(check_name) is not param.check:
+            check_name = f'_check_{len(checks)}'
+            checks[check_name] = param.check
+        kwargs.append(f'{param.name}={check_name}({param.arg})')
+    if request.extra is not None:
+        extra_args = ', '.join(a for a in args if request.params.get(a, a) is None)
+        kwargs.append(f'**self.{request.extra}({extra_args})')
+
+    if isinstance(request.post, str):
+        send = f'(self._post if {request.post} else self._get)'
+    else:
+        send = 'self._post' if request.post else 'self._get'
+
+    lines = [
+        f'def __create_fn__({", ".join(checks)}):',
+        f'    async def {function.__name__}({", ".join(["self", *args])}):',
+    ]
+    if request.any_of:
+        message = f'At least one of {" or ".join(request.any_of)} must be passed.'
+        lines += [
+            f'        if {" and ".join(f"not {a}" for a in request.any_of)}:',
+            f'            raise ValueError({message!r})',
+        ]
+    lines += [
+        f'        return await {send}({", ".join(kwargs)})',
+        f'    return {function.__name__}',
+    ]
+    namespace = {}
+    exec('\n'.join(lines), globals_, namespace)
+
+    method = namespace['__create_fn__'](**checks)
+    method.__defaults__ = function.__defaults__
+    return update_wrapper(method, function)
+
+
+class BaseModule:
+    _module: str  # API module name
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Collects ``endpoints`` table of the module public API methods and generates
+        them, every one of them must be declared with ``@endpoint``."""
+        super().__init_subclass__(**kwargs)
+        cls.endpoints = {}
+        for name, function in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.iscoroutinefunction(function):
+                continue
+            request = getattr(function, '__request__', None)
+            if request is None:
+                raise TypeError(f'API method {cls.__name__}.{name} is not declared with @endpoint.')
+
+            spec = inspect.getfullargspec(function)
+            if spec.varargs or spec.varkw or spec.kwonlyargs:
+                raise TypeError(f'API method {cls.__name__}.{name} takes positional args only.')
+
+            args = spec.args[1:]
+            metadata = _inspect_endpoint(function)._replace(
+                module=request.module or cls._module,
+                action=request.action,
+                params=_get_params(f'{cls.__name__}.{name}', args, request),
+            )
+            method = _compile(function, args, metadata, request, cls._module)
+            method.__endpoint__ = cls.endpoints[name] = metadata
+            setattr(cls, name, method)
+
+    def __init__(self, client):
+        self._client = client
 
     async def _get(self, **params):
-        return await self._client._http.get(params={**dict(module=self._module), **params})
+        return await self._client._http.get(params={'module': self._module, **params})
 
     async def _post(self, **params):
-        return await self._client._http.post(data={**dict(module=self._module), **params})
+        return await self._client._http.post(data={'module': self._module, **params})
@@ -1,8 +1,8 @@
 from datetime import date
 from typing import Optional
 
-from aioetherscan.common import check_closest_value, get_daily_stats_params
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.common import DAILY_STATS_PARAMS, check_closest_value
+from aioetherscan.modules.base import BaseModule, endpoint
 
 
 class Block(BaseModule):
@@ -11,60 +11,46 @@ class Block(BaseModule):
     https://docs.etherscan.io/api-endpoints/blocks
     """
 
-    @property
-    def _module(self) -> str:
-        return 'block'
+    _module = 'block'
 
+    @endpoint('getblockreward')
     async def block_reward(self, blockno: int) -> dict:
         """Get Block And Uncle Rewards by BlockNo"""
-        return await self._get(action='getblockreward', blockno=blockno)
 
+    @endpoint('getblockcountdown')
     async def est_block_countdown_time(self, blockno: int) -> dict:
         """Get Estimated Block Countdown Time by BlockNo"""
-        return await self._get(action='getblockcountdown', blockno=blockno)
 
+    @endpoint('getblocknobytime', dict(ts='timestamp', closest=check_closest_value))
     async def block_number_by_ts(self, ts: int, closest: str) -> dict:
         """Get Block Number by Timestamp"""
-        return await self._get(
-            action='getblocknobytime', timestamp=ts, closest=check_closest_value(closest)
-        )
 
+    @endpoint('dailyavgblocksize', DAILY_STATS_PARAMS, module='stats')
     async def daily_average_block_size(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Average Block Size"""
-        return await self._get(
-            **get_daily_stats_params('dailyavgblocksize', start_date, end_date, sort)
-        )
 
+    @endpoint('dailyblkcount', DAILY_STATS_PARAMS, module='stats')
     async def daily_block_count(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Block Count and Rewards"""
-        return await self._get(
-            **get_daily_stats_params('dailyblkcount', start_date, end_date, sort)
-        )
 
+    @endpoint('dailyblockrewards', DAILY_STATS_PARAMS, module='stats')
     async def daily_block_rewards(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Block Rewards"""
-        return await self._get(
-            **get_daily_stats_params('dailyblockrewards', start_date, end_date, sort)
-        )
 
+    @endpoint('dailyavgblocktime', DAILY_STATS_PARAMS, module='stats')
     async def daily_average_time_for_a_block(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Average Time for A Block to be Included in the Ethereum Blockchain"""
-        return await self._get(
-            **get_daily_stats_params('dailyavgblocktime', start_date, end_date, sort)
-        )
 
+    @endpoint('dailyuncleblkcount', DAILY_STATS_PARAMS, module='stats')
     async def daily_uncle_block_count(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Uncle Block Count and Rewards"""
-        return await self._get(
-            **get_daily_stats_params('dailyuncleblkcount', start_date, end_date, sort)
-        )
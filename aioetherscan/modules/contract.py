@@ -1,6 +1,10 @@
-from typing import Iterable
+from typing import Iterable, Optional
 
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.modules.base import BaseModule, endpoint
+
+
+def _get_flag(value: bool) -> int:
+    return 1 if value else 0
 
 
 class Contract(BaseModule):
@@ -9,22 +13,34 @@ class Contract(BaseModule):
     https://docs.etherscan.io/api-endpoints/contracts
     """
 
-    @property
-    def _module(self) -> str:
-        return 'contract'
+    _module = 'contract'
 
+    @endpoint('getabi')
     async def contract_abi(self, address: str) -> str:
         """Get Contract ABI for Verified Contract Source Codes"""
-        return await self._get(action='getabi', address=address)
 
+    @endpoint('getsourcecode')
     async def contract_source_code(self, address: str) -> list[dict]:
         """Get Contract Source Code for Verified Contract Source Codes"""
-        return await self._get(action='getsourcecode', address=address)
 
+    @endpoint('getcontractcreation', dict(addresses=('contractaddresses', ','.join)))
     async def contract_creation(self, addresses: Iterable[str]) -> list[dict]:
         """Get Contract Creator and Creation Tx Hash"""
-        return await self._get(action='getcontractcreation', contractaddresses=','.join(addresses))
 
+    @endpoint(
+        'verifysourcecode',
+        dict(
+            contract_address='contractaddress',
+            source_code='sourceCode',
+            contract_name='contractname',
+            compiler_version='compilerversion',
+            optimization_used=('optimizationUsed', _get_flag),
+            constructor_arguements='constructorArguements',
+            libraries=None,
+        ),
+        post=True,
+        extra='_parse_libraries',
+    )
     async def verify_contract_source_code(
         self,
         contract_address: str,
@@ -37,40 +53,27 @@ class Contract(BaseModule):
         libraries: dict[str, str] = None,
     ) -> str:
         """Submits a contract source code to Etherscan for verification."""
-        return await self._post(
-            module='contract',
-            action='verifysourcecode',
-            contractaddress=contract_address,
-            sourceCode=source_code,
-            contractname=contract_name,
-            compilerversion=compiler_version,
-            optimizationUsed=1 if optimization_used else 0,
-            runs=runs,
-            constructorArguements=constructor_arguements,
-            **self._parse_libraries(libraries or {}),
-        )
 
+    @endpoint('checkverifystatus')
     async def check_verification_status(self, guid: str) -> str:
         """Check Source code verification submission status"""
-        return await self._get(action='checkverifystatus', guid=guid)
 
+    @endpoint(
+        'verifyproxycontract',
+        dict(expected_implementation='expectedimplementation'),
+        post=True,
+    )
     async def verify_proxy_contract(self, address: str, expected_implementation: str = None) -> str:
         """Submits a proxy contract source code to Etherscan for verification."""
-        return await self._post(
-            module='contract',
-            action='verifyproxycontract',
-            address=address,
-            expectedimplementation=expected_implementation,
-        )
 
+    @endpoint('checkproxyverification')
     async def check_proxy_contract_verification(self, guid: str) -> str:
         """Checking Proxy Contract Verification Submission Status"""
-        return await self._get(action='checkproxyverification', guid=guid)
 
     @staticmethod
-    def _parse_libraries(libraries: dict[str, str]) -> dict[str, str]:
+    def _parse_libraries(libraries: Optional[dict[str, str]]) -> dict[str, str]:
         return dict(
             part
-            for i, (name, address) in enumerate(libraries.items(), start=1)
+            for i, (name, address) in enumerate((libraries or {}).items(), start=1)
             for part in ((f'libraryname{i}', name), (f'libraryaddress{i}', address))
         )
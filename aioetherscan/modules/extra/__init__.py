@@ -1,8 +1,20 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+from aioetherscan.modules.extra.block_time import BlockTimeIndex
+from aioetherscan.modules.extra.blocks import BlockFetcher
+from aioetherscan.modules.extra.broadcast import BroadcastQueue, NonceManager
 from aioetherscan.modules.extra.contract import ContractUtils
+from aioetherscan.modules.extra.daily_stats import DailyStats
+from aioetherscan.modules.extra.decoder import AbiStore, CalldataDecoder, EventDecoder
 from aioetherscan.modules.extra.generators.generator_utils import GeneratorUtils
+from aioetherscan.modules.extra.history import HistorySampler
 from aioetherscan.modules.extra.link import LinkUtils
+from aioetherscan.modules.extra.multicall import Multicall
+from aioetherscan.modules.extra.profiler import ActivityProfiler
+from aioetherscan.modules.extra.receipts import ReceiptFetcher
+from aioetherscan.modules.extra.subscriptions import Subscriptions
+from aioetherscan.modules.extra.watcher import ConfirmationWatcher
 from aioetherscan.url_builder import UrlBuilder
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -10,10 +22,76 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class ExtraModules:
+    """Extra modules are built on first access."""
+
     def __init__(self, client: 'Client', url_builder: UrlBuilder):
         self._client = client
         self._url_builder = url_builder
 
-        self.link = LinkUtils(self._url_builder)
-        self.contract = ContractUtils(self._client)
-        self.generators = GeneratorUtils(self._client)
+    @cached_property
+    def link(self) -> LinkUtils:
+        return LinkUtils(self._url_builder)
+
+    @cached_property
+    def contract(self) -> ContractUtils:
+        return ContractUtils(self._client)
+
+    @cached_property
+    def generators(self) -> GeneratorUtils:
+        return GeneratorUtils(self._client)
+
+    @cached_property
+    def profiler(self) -> ActivityProfiler:
+        return ActivityProfiler(self._client)
+
+    @cached_property
+    def block_time(self) -> BlockTimeIndex:
+        return BlockTimeIndex(self._client)
+
+    @cached_property
+    def daily_stats(self) -> DailyStats:
+        return DailyStats(self._client)
+
+    @cached_property
+    def history(self) -> HistorySampler:
+        return HistorySampler(self._client)
+
+    @cached_property
+    def abi(self) -> AbiStore:
+        return AbiStore(self._client)
+
+    @cached_property
+    def events(self) -> EventDecoder:
+        return EventDecoder(self.abi)
+
+    @cached_property
+    def calldata(self) -> CalldataDecoder:
+        return CalldataDecoder(self.abi)
+
+    @cached_property
+    def blocks(self) -> BlockFetcher:
+        return BlockFetcher(self._client)
+
+    @cached_property
+    def receipts(self) -> ReceiptFetcher:
+        return ReceiptFetcher(self._client)
+
+    @cached_property
+    def watcher(self) -> ConfirmationWatcher:
+        return ConfirmationWatcher(self._client)
+
+    @cached_property
+    def subscriptions(self) -> Subscriptions:
+        return Subscriptions(self._client)
+
+    @cached_property
+    def multicall(self) -> Multicall:
+        return Multicall(self._client)
+
+    @cached_property
+    def nonces(self) -> NonceManager:
+        return NonceManager(self._client)
+
+    @cached_property
+    def broadcast(self) -> BroadcastQueue:
+        return BroadcastQueue(self._client, self.nonces)
@@ -0,0 +1,345 @@
+"""Minimal ABI codec: Keccak-256, signatures and precompiled decoders and encoders of ABI
+types."""
+
+import re
+from typing import Any, Callable, NamedTuple
+
+_KECCAK_ROUND_CONSTANTS = (
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+)
+# rotation offsets of lanes indexed by x + 5 * y
+_KECCAK_ROTATIONS = (
+    (0, 1, 62, 28, 27),
+    (36, 44, 6, 55, 20),
+    (3, 10, 43, 25, 39),
+    (41, 45, 15, 21, 8),
+    (18, 2, 61, 56, 14),
+)
+_KECCAK_RATE = 136
+_MASK = (1 << 64) - 1
+
+_WORD = 32
+_ARRAY_RE = re.compile(r'^(.*)\[(\d*)\]$')
+
+
+def _rotate(lane: int, shift: int) -> int:
+    return ((lane << shift) | (lane >> (64 - shift))) & _MASK if shift else lane
+
+
+def _keccak_f(state: list[int]) -> None:
+    for round_constant in _KECCAK_ROUND_CONSTANTS:
+        c = [
+            state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20]
+            for x in range(5)
+        ]
+        d = [c[x - 1] ^ _rotate(c[(x + 1) % 5], 1) for x in range(5)]
+        b = [0] * 25
+        for y in range(5):
+            for x in range(5):
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotate(
+                    state[x + 5 * y] ^ d[x], _KECCAK_ROTATIONS[y][x]
+                )
+        for y in range(5):
+            row = b[5 * y : 5 * y + 5]
+            for x in range(5):
+                state[x + 5 * y] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+        state[0] ^= round_constant
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 as used by Ethereum, which differs from ``hashlib.sha3_256`` by padding.
+
+    Pure Python, meant for hashing signatures, not bulk data.
+    """
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b'\x00' * (-len(padded) % _KECCAK_RATE))
+    padded[-1] |= 0x80
+
+    state = [0] * 25
+    for start in range(0, len(padded), _KECCAK_RATE):
+        block = padded[start : start + _KECCAK_RATE]
+        for i in range(_KECCAK_RATE // 8):
+            state[i] ^= int.from_bytes(block[8 * i : 8 * i + 8], 'little')
+        _keccak_f(state)
+
+    return b''.join(lane.to_bytes(8, 'little') for lane in state[:4])
+
+
+def canonical_type(param: dict) -> str:
+    """Returns the type used in signatures, tuples are expanded into their components."""
+    type_ = param['type']
+    if type_.startswith('tuple'):
+        components = ','.join(canonical_type(c) for c in param['components'])
+        return f'({components}){type_[len("tuple") :]}'
+    return type_
+
+
+def signature(item: dict) -> str:
+    """Returns canonical signature of an ABI item, e.g. ``transfer(address,uint256)``."""
+    return f'{item["name"]}({",".join(canonical_type(p) for p in item["inputs"])})'
+
+
+def event_topic(item: dict) -> str:
+    return '0x' + keccak256(signature(item).encode()).hex()
+
+
+def function_selector(item: dict) -> str:
+    return '0x' + keccak256(signature(item).encode())[:4].hex()
+
+
+def param_names(params: list[dict]) -> list[str]:
+    """Unnamed params are named by their position."""
+    return [p.get('name') or f'arg{i}' for i, p in enumerate(params)]
+
+
+class Decoder(NamedTuple):
+    """Decodes a value of ``size`` bytes at the offset, dynamic values are decoded at
+    the offset their head points to."""
+
+    dynamic: bool
+    size: int
+    decode: Callable[[bytes, int], Any]
+
+
+def compile_decoder(param: dict) -> Decoder:
+    """Builds a decoder of ABI encoded values of the param type."""
+    type_ = param['type']
+
+    array = _ARRAY_RE.match(type_)
+    if array:
+        item = compile_decoder(dict(param, type=array.group(1)))
+        if array.group(2):
+            return _compile_fixed_array(item, int(array.group(2)))
+        return _compile_dynamic_array(item)
+
+    if type_ == 'tuple':
+        return compile_sequence([compile_decoder(c) for c in param['components']])
+    if type_ == 'address':
+        return Decoder(
+            False, _WORD, lambda data, offset: '0x' + data[offset + 12 : offset + 32].hex()
+        )
+    if type_ == 'bool':
+        return Decoder(False, _WORD, lambda data, offset: data[offset + 31] == 1)
+    if type_.startswith('uint'):
+        return Decoder(
+            False, _WORD, lambda data, offset: int.from_bytes(data[offset : offset + 32], 'big')
+        )
+    if type_.startswith('int'):
+        return Decoder(
+            False,
+            _WORD,
+            lambda data, offset: int.from_bytes(data[offset : offset + 32], 'big', signed=True),
+        )
+    if type_ in ('bytes', 'string'):
+        return _compile_bytes(type_ == 'string')
+    if type_.startswith('bytes'):
+        size = int(type_[len('bytes') :])
+        return Decoder(False, _WORD, lambda data, offset: '0x' + data[offset : offset + size].hex())
+    raise ValueError(f'Unsupported ABI type {type_!r}.')
+
+
+def compile_sequence(items: list[Decoder]) -> Decoder:
+    """Builds a tuple decoder, heads of dynamic items are offsets from the tuple start.
+
+    Decoders raise ValueError when the data is shorter than the heads or the lengths say.
+    """
+    heads_size = sum(_WORD if item.dynamic else item.size for item in items)
+
+    def decode(data: bytes, offset: int) -> tuple:
+        if offset + heads_size > len(data):
+            raise ValueError(f'ABI data is too short: {len(data)} bytes.')
+        values, position = [], offset
+        for item in items:
+            if item.dynamic:
+                pointer = int.from_bytes(data[position : position + _WORD], 'big')
+                values.append(item.decode(data, offset + pointer))
+                position += _WORD
+            else:
+                values.append(item.decode(data, position))
+                position += item.size
+        return tuple(values)
+
+    dynamic = any(item.dynamic for item in items)
+    return Decoder(dynamic, _WORD if dynamic else heads_size, decode)
+
+
+def _compile_fixed_array(item: Decoder, length: int) -> Decoder:
+    sequence = compile_sequence([item] * length)
+    return Decoder(
+        sequence.dynamic, sequence.size, lambda data, offset: list(sequence.decode(data, offset))
+    )
+
+
+def _compile_dynamic_array(item: Decoder) -> Decoder:
+    def decode(data: bytes, offset: int) -> list:
+        length = _read_length(data, offset)
+        if length * item.size > len(data) - offset - _WORD:
+            raise ValueError(f'ABI array length {length} exceeds the data.')
+        return list(compile_sequence([item] * length).decode(data, offset + _WORD))
+
+    return Decoder(True, _WORD, decode)
+
+
+def _compile_bytes(is_string: bool) -> Decoder:
+    def decode(data: bytes, offset: int) -> Any:
+        length = _read_length(data, offset)
+        if offset + _WORD + length > len(data):
+            raise ValueError(f'ABI bytes length {length} exceeds the data.')
+        value = data[offset + _WORD : offset + _WORD + length]
+        return value.decode(errors='replace') if is_string else '0x' + value.hex()
+
+    return Decoder(True, _WORD, decode)
+
+
+def _read_length(data: bytes, offset: int) -> int:
+    if offset + _WORD > len(data):
+        raise ValueError(f'ABI data is too short: {len(data)} bytes.')
+    return int.from_bytes(data[offset : offset + _WORD], 'big')
+
+
+def compile_topic_decoder(param: dict) -> Callable[[str], Any]:
+    """Builds a decoder of an indexed param straight from the topic hex string.
+
+    Indexed dynamic values are stored as their hashes, so the topic is returned as is.
+    """
+    type_ = param['type']
+    if type_ in ('bytes', 'string', 'tuple') or _ARRAY_RE.match(type_):
+        return lambda topic: topic
+    if type_ == 'address':
+        return lambda topic: '0x' + topic[-40:]
+    if type_ == 'bool':
+        return lambda topic: topic[-1] == '1'
+    if type_.startswith('uint'):
+        return lambda topic: int(topic, 16)
+    if type_.startswith('int'):
+        return lambda topic: int.from_bytes(bytes.fromhex(topic[2:]), 'big', signed=True)
+    if type_.startswith('bytes'):
+        size = int(type_[len('bytes') :])
+        return lambda topic: topic[: 2 + 2 * size]
+    raise ValueError(f'Unsupported ABI type {type_!r}.')
+
+
+class Encoder(NamedTuple):
+    """Encodes a value, dynamic values are placed in the tail and pointed by their head."""
+
+    dynamic: bool
+    encode: Callable[[Any], bytes]
+
+
+def compile_encoder(param: dict) -> Encoder:
+    """Builds an encoder of values of the param type, hex strings stand for bytes values."""
+    type_ = param['type']
+
+    array = _ARRAY_RE.match(type_)
+    if array:
+        item = compile_encoder(dict(param, type=array.group(1)))
+        if array.group(2):
+            return _compile_fixed_array_encoder(item, int(array.group(2)))
+        return _compile_dynamic_array_encoder(item)
+
+    if type_ == 'tuple':
+        return compile_sequence_encoder([compile_encoder(c) for c in param['components']])
+    if type_ == 'address':
+        return Encoder(False, _encode_address)
+    if type_ == 'bool':
+        return Encoder(False, lambda value: _encode_int(int(bool(value))))
+    if type_.startswith('uint'):
+        return Encoder(False, _encode_int)
+    if type_.startswith('int'):
+        return Encoder(False, lambda value: _encode_int(value, signed=True))
+    if type_ in ('bytes', 'string'):
+        if type_ == 'string':
+            return Encoder(True, lambda value: _encode_bytes(value.encode()))
+        return Encoder(True, lambda value: _encode_bytes(_hex_to_bytes(value)))
+    if type_.startswith('bytes'):
+        return Encoder(False, lambda value: _hex_to_bytes(value).ljust(_WORD, b'\x00'))
+    raise ValueError(f'Unsupported ABI type {type_!r}.')
+
+
+def compile_sequence_encoder(items: list[Encoder]) -> Encoder:
+    """Builds a tuple encoder, heads of dynamic items are offsets from the tuple start."""
+
+    def encode(values: Any) -> bytes:
+        values = list(values)
+        if len(values) != len(items):
+            raise ValueError(f'Expected {len(items)} values, got {len(values)}.')
+
+        encoded = [(item.dynamic, item.encode(value)) for item, value in zip(items, values)]
+        offset = sum(_WORD if dynamic else len(data) for dynamic, data in encoded)
+        heads, tails = [], []
+        for dynamic, data in encoded:
+            if dynamic:
+                heads.append(_encode_int(offset))
+                tails.append(data)
+                offset += len(data)
+            else:
+                heads.append(data)
+        return b''.join(heads + tails)
+
+    return Encoder(any(item.dynamic for item in items), encode)
+
+
+def encode_call(item: dict, args: Any) -> str:
+    """Returns calldata of an ABI function call: selector followed by encoded args."""
+    encoder = compile_sequence_encoder([compile_encoder(p) for p in item['inputs']])
+    return function_selector(item) + encoder.encode(args).hex()
+
+
+def _compile_fixed_array_encoder(item: Encoder, length: int) -> Encoder:
+    return compile_sequence_encoder([item] * length)
+
+
+def _compile_dynamic_array_encoder(item: Encoder) -> Encoder:
+    def encode(values: Any) -> bytes:
+        values = list(values)
+        return _encode_int(len(values)) + compile_sequence_encoder([item] * len(values)).encode(
+            values
+        )
+
+    return Encoder(True, encode)
+
+
+def _encode_int(value: int, signed: bool = False) -> bytes:
+    try:
+        return value.to_bytes(_WORD, 'big', signed=signed)
+    except OverflowError:
+        raise ValueError(f'Value {value!r} does not fit in 256 bits.')
+
+
+def _encode_address(value: str) -> bytes:
+    address = _hex_to_bytes(value)
+    if len(address) != 20:
+        raise ValueError(f'Invalid address {value!r}.')
+    return address.rjust(_WORD, b'\x00')
+
+
+def _encode_bytes(data: bytes) -> bytes:
+    return _encode_int(len(data)) + data.ljust(-(-len(data) // _WORD) * _WORD, b'\x00')
+
+
+def _hex_to_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith('0x') else value)
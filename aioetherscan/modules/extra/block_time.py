@@ -0,0 +1,161 @@
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from aioetherscan.common import check_closest_value
+from aioetherscan.modules.extra.generators.checkpoint import CheckpointStore
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Timestamp = Union[int, datetime]
+
+
+def to_timestamp(value: Timestamp) -> int:
+    """Naive datetimes are treated as UTC."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return value
+
+
+class BlockTimeIndex:
+    """Resolves timestamps to blocks with interpolation search over known anchors.
+
+    Every fetched ``(block, timestamp)`` pair is kept as an anchor, so a new timestamp
+    lying between two adjacent anchors costs no calls and the others usually take a few
+    ``proxy.block_by_number`` calls. Search falls back to bisection when interpolation
+    does not halve the range. Anchors are saved to ``store`` under ``key``, use a key
+    per chain when the store is shared.
+    """
+
+    def __init__(
+        self, client: 'Client', store: Optional[CheckpointStore] = None, key: str = 'block_time'
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._key = key
+
+        self._blocks: list[int] = []
+        self._timestamps: list[int] = []
+        self._loaded = False
+
+        self._logger = logging.getLogger(__name__)
+
+    async def get_block(self, timestamp: Timestamp, closest: str = 'before') -> int:
+        """Returns the last block mined at or before the timestamp or the first one at
+        or after it, depending on ``closest``."""
+        timestamp, closest = to_timestamp(timestamp), check_closest_value(closest)
+        await self._ensure_bounds(timestamp)
+
+        search = bisect_right if closest == 'before' else bisect_left
+        index = search(self._timestamps, timestamp)
+        if index == 0:
+            if closest == 'before':
+                raise ValueError(f'No blocks mined before {timestamp}.')
+            return self._blocks[0]
+        if index == len(self._blocks):
+            if closest == 'after':
+                raise ValueError(f'No blocks mined after {timestamp} yet.')
+            return self._blocks[-1]
+
+        fetched = len(self._blocks)
+        block = await self._search(timestamp, index - 1, index, closest)
+        if len(self._blocks) > fetched:
+            self._save()
+        return block
+
+    async def get_blocks(
+        self, timestamps: Iterable[Timestamp], closest: str = 'before'
+    ) -> list[int]:
+        """Resolves timestamps in ascending order, so each search narrows the next ones."""
+        timestamps = [to_timestamp(t) for t in timestamps]
+        blocks = {}
+        for timestamp in sorted(set(timestamps)):
+            blocks[timestamp] = await self.get_block(timestamp, closest)
+        return [blocks[t] for t in timestamps]
+
+    async def estimate_timestamp(self, block: int) -> int:
+        """Interpolates block timestamp between known anchors without extra calls, blocks
+        after the latest one are extrapolated with the average block time."""
+        await self._ensure_bounds()
+
+        index = bisect_left(self._blocks, block)
+        if index < len(self._blocks) and self._blocks[index] == block:
+            return self._timestamps[index]
+        if index == 0:
+            raise ValueError(f'Block {block} is before the first known block.')
+
+        if index == len(self._blocks):
+            index -= 1
+        return round(self._interpolate_timestamp(index - 1, index, block))
+
+    async def _search(self, timestamp: int, low: int, high: int, closest: str) -> int:
+        """Narrows ``low`` (before the timestamp) and ``high`` (after it) anchors till
+        they are adjacent."""
+        low_block, high_block = self._blocks[low], self._blocks[high]
+        low_ts, high_ts = self._timestamps[low], self._timestamps[high]
+        bisect_next = False
+        while high_block - low_block > 1:
+            if bisect_next:
+                block = (low_block + high_block) // 2
+            else:
+                ratio = (timestamp - low_ts) / (high_ts - low_ts) if high_ts > low_ts else 0.5
+                block = low_block + round(ratio * (high_block - low_block))
+                block = min(max(block, low_block + 1), high_block - 1)
+
+            _, block_ts = await self._fetch_anchor(block)
+            size = high_block - low_block
+            if block_ts > timestamp or (closest == 'after' and block_ts == timestamp):
+                high_block, high_ts = block, block_ts
+            else:
+                low_block, low_ts = block, block_ts
+            bisect_next = high_block - low_block > size // 2
+
+        return low_block if closest == 'before' else high_block
+
+    def _interpolate_timestamp(self, low: int, high: int, block: int) -> float:
+        low_block, high_block = self._blocks[low], self._blocks[high]
+        low_ts, high_ts = self._timestamps[low], self._timestamps[high]
+        if high_block == low_block:
+            return low_ts
+        return low_ts + (block - low_block) * (high_ts - low_ts) / (high_block - low_block)
+
+    async def _ensure_bounds(self, timestamp: Optional[int] = None) -> None:
+        self._load()
+        if not self._blocks or self._blocks[0] != 0:
+            await self._fetch_anchor(0)
+        # the head is refetched only for timestamps after the last known block
+        if len(self._blocks) < 2 or (timestamp is not None and timestamp >= self._timestamps[-1]):
+            await self._fetch_anchor('latest')
+            self._save()
+
+    async def _fetch_anchor(self, tag: Union[int, str]) -> tuple[int, int]:
+        block = await self._client.proxy.block_by_number(full=False, tag=tag)
+        number, timestamp = hex_to_int(block['number']), hex_to_int(block['timestamp'])
+        self._add_anchor(number, timestamp)
+        self._logger.debug(f'Fetched block {number:,} timestamp {timestamp}')
+        return number, timestamp
+
+    def _add_anchor(self, block: int, timestamp: int) -> None:
+        index = bisect_left(self._blocks, block)
+        if index < len(self._blocks) and self._blocks[index] == block:
+            return
+        self._blocks.insert(index, block)
+        self._timestamps.insert(index, timestamp)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        state = self._store.load(self._key) if self._store is not None else None
+        if state:
+            for block, timestamp in state['anchors']:
+                self._add_anchor(block, timestamp)
+
+    def _save(self) -> None:
+        if self._store is not None:
+            self._store.save(self._key, dict(anchors=list(zip(self._blocks, self._timestamps))))
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+import threading
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, BinaryIO, Optional
+
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Block = dict[str, Any]
+
+_BLOCK_INT_FIELDS = (
+    'baseFeePerGas',
+    'blobGasUsed',
+    'difficulty',
+    'excessBlobGas',
+    'gasLimit',
+    'gasUsed',
+    'number',
+    'size',
+    'timestamp',
+    'totalDifficulty',
+)
+_TX_INT_FIELDS = (
+    'blockNumber',
+    'chainId',
+    'gas',
+    'gasPrice',
+    'maxFeePerBlobGas',
+    'maxFeePerGas',
+    'maxPriorityFeePerGas',
+    'nonce',
+    'transactionIndex',
+    'type',
+    'v',
+    'value',
+)
+
+
+def decode_block(block: Block) -> Block:
+    """Converts numeric hex fields of the block and its transaction objects to ints."""
+    block = _decode_fields(block, _BLOCK_INT_FIELDS)
+    transactions = block.get('transactions')
+    if transactions and isinstance(transactions[0], dict):
+        block['transactions'] = [_decode_fields(tx, _TX_INT_FIELDS) for tx in transactions]
+    return block
+
+
+def _decode_fields(row: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    row = dict(row)
+    for field in fields:
+        value = row.get(field)
+        if isinstance(value, str):
+            row[field] = hex_to_int(value)
+    return row
+
+
+class FileBlockStore:
+    """Append-only file of decoded blocks, one JSON per line prefixed by its number and
+    mode, so the offsets index is built without parsing blocks.
+
+    An incomplete last line left by an interrupted write is truncated on open. Reads and
+    appends are thread safe, so ``BlockFetcher`` runs them off the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._offsets: dict[tuple[int, bool], int] = {}
+        self._reader: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def __contains__(self, key: tuple[int, bool]) -> bool:
+        return key in self._offsets
+
+    def get(self, number: int, full: bool) -> Optional[Block]:
+        offset = self._offsets.get((number, full))
+        if offset is None:
+            return None
+        with self._lock:
+            if self._reader is None:
+                self._reader = open(self._path, 'rb')
+            self._reader.seek(offset)
+            line = self._reader.readline()
+        _, _, block = line.split(b'\t', 2)
+        return json.loads(block)
+
+    def append(self, blocks: list[Block], full: bool) -> None:
+        blocks = [b for b in blocks if (b['number'], full) not in self._offsets]
+        if not blocks:
+            return
+        offsets = {}
+        with self._lock, open(self._path, 'ab') as f:
+            for block in blocks:
+                offsets[block['number'], full] = f.tell()
+                f.write(f'{block["number"]}\t{int(full)}\t{json.dumps(block)}\n'.encode())
+        # indexed once written, so concurrent readers never see a partial line
+        self._offsets.update(offsets)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self._path):
+            return
+        with open(self._path, 'r+b') as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    f.truncate(offset)
+                    break
+                number, full, _ = line.split(b'\t', 2)
+                self._offsets[int(number), full == b'1'] = offset
+                offset += len(line)
+
+
+class BlockFetcher:
+    """Fetches blocks ranges concurrently and yields them decoded in blocks order.
+
+    At most ``concurrency`` blocks are requested at once under the client's rate limit.
+    Blocks at least ``confirmations`` deep are saved to ``store`` and served from it later.
+    """
+
+    _DEFAULT_CONCURRENCY: int = 8
+    _DEFAULT_CONFIRMATIONS: int = 64
+    _FLUSH_SIZE: int = 100
+
+    def __init__(
+        self,
+        client: 'Client',
+        store: Optional[FileBlockStore] = None,
+        confirmations: int = _DEFAULT_CONFIRMATIONS,
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._confirmations = confirmations
+
+    async def fetch(
+        self,
+        start_block: int,
+        end_block: int,
+        full: bool = False,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[Block]:
+        """Yields blocks headers or, with ``full``, blocks with transaction objects."""
+        if concurrency < 1:
+            raise ValueError(f'Invalid concurrency {concurrency!r}, must be positive.')
+
+        finalized_block = await self._get_finalized_block()
+        numbers = iter(range(start_block, end_block + 1))
+        pending = deque(self._start(n, full) for n in islice(numbers, concurrency))
+        finalized = []
+        try:
+            while pending:
+                block = await pending.popleft()
+                next_number = next(numbers, None)
+                if next_number is not None:
+                    pending.append(self._start(next_number, full))
+
+                if self._store is not None and block['number'] <= finalized_block:
+                    finalized.append(block)
+                    if len(finalized) >= self._FLUSH_SIZE:
+                        await asyncio.to_thread(self._store.append, finalized, full)
+                        finalized = []
+                yield block
+        finally:
+            for task in pending:
+                task.cancel()
+            if finalized:
+                await asyncio.to_thread(self._store.append, finalized, full)
+
+    def _start(self, number: int, full: bool) -> 'asyncio.Future[Block]':
+        return asyncio.ensure_future(self._get_block(number, full))
+
+    async def _get_block(self, number: int, full: bool) -> Block:
+        if self._store is not None:
+            block = await asyncio.to_thread(self._store.get, number, full)
+            if block is not None:
+                return block
+        block = await self._client.proxy.block_by_number(full=full, tag=number)
+        if block is None:
+            raise ValueError(f'Block {number:,} has not been mined yet.')
+        return decode_block(block)
+
+    async def _get_finalized_block(self) -> int:
+        if self._store is None:
+            return -1
+        return hex_to_int(await self._client.proxy.block_number()) - self._confirmations
@@ -0,0 +1,173 @@
+import asyncio
+import heapq
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Callable
+
+from aioetherscan.exceptions import EtherscanClientProxyError
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+# signs the tx with the given nonce, returns raw tx hex
+Signer = Callable[[int], str]
+
+
+class NonceManager:
+    """Hands out nonces of senders locally, requesting ``eth_getTransactionCount`` once per
+    address, so sending a tx costs one API call instead of two.
+
+    Nonces of txs which failed to broadcast are released and handed out again first, so
+    they don't leave gaps blocking later txs. ``resync`` catches up with txs sent elsewhere.
+    """
+
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+        self._next: dict[str, int] = {}
+        self._released: dict[str, list[int]] = {}  # heaps
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, address: str) -> int:
+        address = address.lower()
+        async with self._get_lock(address):
+            if address not in self._next:
+                await self._sync(address)
+            released = self._released[address]
+            if released:
+                return heapq.heappop(released)
+            nonce = self._next[address]
+            self._next[address] += 1
+            return nonce
+
+    def release(self, address: str, nonce: int) -> None:
+        """Returns a nonce which has not been used by a broadcasted tx."""
+        address = address.lower()
+        if address not in self._next or nonce >= self._next[address]:
+            return
+        if nonce == self._next[address] - 1:
+            self._next[address] -= 1
+        else:
+            heapq.heappush(self._released[address], nonce)
+
+    async def resync(self, address: str) -> None:
+        """Skips nonces used by txs the manager doesn't know about."""
+        address = address.lower()
+        async with self._get_lock(address):
+            await self._sync(address)
+
+    def reset(self, address: str) -> None:
+        """Forgets the address state, the next nonce is requested from the API again."""
+        address = address.lower()
+        self._next.pop(address, None)
+        self._released.pop(address, None)
+
+    async def _sync(self, address: str) -> None:
+        count = hex_to_int(await self._client.proxy.tx_count(address, 'pending'))
+        self._next[address] = max(self._next.get(address, 0), count)
+        released = [n for n in self._released.get(address, []) if n >= count]
+        heapq.heapify(released)
+        self._released[address] = released
+
+    def _get_lock(self, address: str) -> asyncio.Lock:
+        if address not in self._locks:
+            self._locks[address] = asyncio.Lock()
+        return self._locks[address]
+
+
+class BroadcastQueue:
+    """Broadcasts txs signed with nonces of ``NonceManager`` by up to ``concurrency``
+    workers sharing the client's rate limit.
+
+    Txs of a sender may reach the node out of nonce order, which holds them till the gap is
+    filled. A tx rejected for a used nonce is signed again with a fresh one after resync, up
+    to ``retries`` times. Workers stop when the queue is drained.
+    """
+
+    _DEFAULT_CONCURRENCY: int = 4
+    _DEFAULT_RETRIES: int = 3
+    _NONCE_ERRORS: tuple[str, ...] = ('nonce too low', 'replacement transaction underpriced')
+
+    def __init__(
+        self,
+        client: 'Client',
+        nonces: NonceManager,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        retries: int = _DEFAULT_RETRIES,
+    ) -> None:
+        self._client = client
+        self._nonces = nonces
+        self._concurrency = concurrency
+        self._retries = retries
+
+        self._queue: deque[tuple[str, Signer, 'asyncio.Future[str]']] = deque()
+        self._workers: set[asyncio.Task] = set()
+
+        self._logger = logging.getLogger(__name__)
+
+    def submit(self, address: str, sign: Signer) -> 'asyncio.Future[str]':
+        """Queues a tx of ``address``, returns a future resolved with its hash."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((address, sign, future))
+        if len(self._workers) < self._concurrency:
+            worker = asyncio.create_task(self._work())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        return future
+
+    async def send(self, address: str, sign: Signer) -> str:
+        return await self.submit(address, sign)
+
+    async def close(self) -> None:
+        for worker in list(self._workers):
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        while self._queue:
+            _, _, future = self._queue.popleft()
+            future.cancel()
+
+    async def _work(self) -> None:
+        try:
+            await self._drain()
+        finally:
+            # a worker leaving the drained queue must not be counted by a submit coming
+            # before its done callbacks run
+            self._workers.discard(asyncio.current_task())
+
+    async def _drain(self) -> None:
+        while self._queue:
+            address, sign, future = self._queue.popleft()
+            if future.done():
+                continue
+            try:
+                txhash = await self._broadcast(address, sign)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(txhash)
+
+    async def _broadcast(self, address: str, sign: Signer) -> str:
+        for attempt in range(self._retries + 1):
+            nonce = await self._nonces.get(address)
+            try:
+                return await self._client.proxy.send_raw_tx(sign(nonce))
+            except EtherscanClientProxyError as e:
+                if not self._is_nonce_error(e):
+                    self._nonces.release(address, nonce)
+                    raise
+                if attempt == self._retries:
+                    raise
+                self._logger.info(f'Nonce {nonce} of {address} has been used, resyncing: {e}')
+                await self._nonces.resync(address)
+            except BaseException:
+                self._nonces.release(address, nonce)
+                raise
+
+    def _is_nonce_error(self, error: EtherscanClientProxyError) -> bool:
+        message = str(error.message).lower()
+        return any(e in message for e in self._NONCE_ERRORS)
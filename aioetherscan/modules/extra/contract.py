@@ -1,4 +1,6 @@
-from typing import Optional
+import asyncio
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, NamedTuple, Optional
 from typing import TYPE_CHECKING
 
 from aioetherscan.exceptions import EtherscanClientApiError
@@ -7,11 +9,22 @@ if TYPE_CHECKING:  # pragma: no cover
     from aioetherscan import Client
 
 
+class AddressInfo(NamedTuple):
+    address: str
+    is_contract: bool
+    creator: Optional[str] = None
+    tx_hash: Optional[str] = None
+
+
 class ContractUtils:
     """Helper methods which use the combination of documented APIs."""
 
+    _CREATION_BATCH_SIZE: int = 5
+    _DEFAULT_CONCURRENCY: int = 4
+
     def __init__(self, client: 'Client'):
         self._client = client
+        self._addresses: dict[str, AddressInfo] = {}
 
     async def is_contract(self, address: str) -> bool:
         try:
@@ -47,3 +60,75 @@ class ContractUtils:
                     raise
 
         return next((i['from'].lower() for i in response), None)
+
+    async def classify_addresses(
+        self, addresses: Iterable[str], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> AsyncIterator[AddressInfo]:
+        """Tells contracts from EOAs and finds contracts creators in bulk.
+
+        Addresses are looked up by batches of ``contract_creation``, addresses missing in
+        its response (EOAs and contracts without creation info, e.g. genesis ones) are
+        checked with ``proxy.code``. At most ``concurrency`` batches are in flight, results
+        are yielded as batches finish and cached, EOAs included.
+        """
+        if concurrency < 1:
+            raise ValueError(f'Invalid concurrency {concurrency!r}, must be positive.')
+
+        pending = set()
+        try:
+            for batch in self._get_batches(addresses):
+                pending.add(asyncio.ensure_future(self._classify_batch(batch)))
+                if len(pending) < concurrency:
+                    continue
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for info in task.result():
+                        yield info
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for info in task.result():
+                        yield info
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_contract_creators(
+        self, addresses: Iterable[str], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> dict[str, Optional[str]]:
+        """Returns creators of contracts found among addresses, EOAs are skipped."""
+        return {
+            info.address: info.creator
+            async for info in self.classify_addresses(addresses, concurrency)
+            if info.is_contract
+        }
+
+    def _get_batches(self, addresses: Iterable[str]) -> Iterator[list[str]]:
+        unique = iter(dict.fromkeys(address.lower() for address in addresses))
+        while batch := list(islice(unique, self._CREATION_BATCH_SIZE)):
+            yield batch
+
+    async def _classify_batch(self, batch: list[str]) -> list[AddressInfo]:
+        missing = [address for address in batch if address not in self._addresses]
+        if missing:
+            for row in await self._get_contracts_creation(missing):
+                address = row['contractAddress'].lower()
+                self._addresses[address] = AddressInfo(
+                    address, True, row['contractCreator'].lower(), row['txHash']
+                )
+
+            unknown = [address for address in missing if address not in self._addresses]
+            codes = await asyncio.gather(*(self._client.proxy.code(a) for a in unknown))
+            for address, code in zip(unknown, codes):
+                self._addresses[address] = AddressInfo(address, code not in ('0x', '0x0', ''))
+
+        return [self._addresses[address] for address in batch]
+
+    async def _get_contracts_creation(self, addresses: list[str]) -> list[dict]:
+        try:
+            return await self._client.contract.contract_creation(addresses)
+        except EtherscanClientApiError as e:
+            if e.message == 'No data found':
+                return []
+            raise
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Optional
+
+from aioetherscan.modules.base import Endpoint, get_endpoint
+from aioetherscan.modules.extra.generators.checkpoint import CheckpointStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Row = Optional[dict[str, Any]]
+
+
+class DailySeries(NamedTuple):
+    """One value per day in every column, None for days without data."""
+
+    dates: list[date]
+    columns: dict[str, list]
+
+
+def date_range(start_date: date, end_date: date) -> Iterator[date]:
+    for days in range((end_date - start_date).days + 1):
+        yield start_date + timedelta(days=days)
+
+
+class DailyStats:
+    """Fetches daily series (``daily_transaction_count``, ``daily_average_gas_price``, etc.)
+    by concurrent chunks and caches finished days.
+
+    Days before today are cached for good, days without data once they are settled, so a
+    refresh only requests the missing days. The cache is kept in ``store`` when it is
+    passed.
+    """
+
+    _CHUNK_DAYS: int = 90
+    _SETTLE_DAYS: int = 2
+    _DATE_FIELD: str = 'UTCDate'
+    # endpoints whose rows are dated by another field, by endpoint keys
+    _DATE_FIELDS: dict[str, str] = {'stats:chainsize': 'chainTimeStamp'}
+
+    def __init__(self, client: 'Client', store: Optional[CheckpointStore] = None) -> None:
+        self._client = client
+        self._store = store
+        self._cache: dict[str, dict[str, Row]] = {}
+
+        self._logger = logging.getLogger(__name__)
+
+    async def fetch(
+        self, api_method: Callable, start_date: date, end_date: date, **params
+    ) -> DailySeries:
+        """Returns the series of ``api_method`` for the dates range, ``params`` are passed
+        to it as is, e.g. ``client_type`` and ``sync_mode`` for ``eth_nodes_size``."""
+        if start_date > end_date:
+            raise ValueError(f'Invalid dates range {start_date}..{end_date}.')
+
+        endpoint = get_endpoint(api_method)
+        key = self._get_key(endpoint, params)
+        date_field = self._DATE_FIELDS.get(endpoint.key, self._DATE_FIELD)
+        days = self._load(key)
+        dates = list(date_range(start_date, end_date))
+        chunks = list(self._get_chunks([d for d in dates if d.isoformat() not in days]))
+
+        fetched = {}
+        results = await asyncio.gather(
+            *(api_method(start_date=s, end_date=e, sort='asc', **params) for s, e in chunks)
+        )
+        for rows in results:
+            fetched.update((row[date_field], row) for row in rows)
+
+        if chunks:
+            self._logger.debug(f'Fetched {len(fetched):,} days of {key} in {len(chunks)} chunks')
+            self._update_cache(key, days, chunks, fetched)
+
+        return self._to_columns(
+            dates,
+            [fetched.get(d.isoformat()) or days.get(d.isoformat()) for d in dates],
+            date_field,
+        )
+
+    def _get_chunks(self, missing: list[date]) -> Iterator[tuple[date, date]]:
+        """Splits missing days into runs of consecutive days not longer than a chunk."""
+        chunk_start = chunk_end = None
+        for day in missing:
+            if (
+                chunk_start is not None
+                and day == chunk_end + timedelta(days=1)
+                and (day - chunk_start).days < self._CHUNK_DAYS
+            ):
+                chunk_end = day
+                continue
+            if chunk_start is not None:
+                yield chunk_start, chunk_end
+            chunk_start = chunk_end = day
+        if chunk_start is not None:
+            yield chunk_start, chunk_end
+
+    def _update_cache(
+        self,
+        key: str,
+        days: dict[str, Row],
+        chunks: list[tuple[date, date]],
+        fetched: dict[str, dict],
+    ) -> None:
+        today = self._today()
+        settled = today - timedelta(days=self._SETTLE_DAYS)
+        for chunk in chunks:
+            for day in date_range(*chunk):
+                row = fetched.get(day.isoformat())
+                if (row is not None and day < today) or day < settled:
+                    days[day.isoformat()] = row
+        self._save(key, days)
+
+    @staticmethod
+    def _to_columns(dates: list[date], rows: list[Row], date_field: str) -> DailySeries:
+        fields = dict.fromkeys(k for row in rows if row for k in row if k != date_field)
+        columns = {field: [row.get(field) if row else None for row in rows] for field in fields}
+        return DailySeries(dates, columns)
+
+    @staticmethod
+    def _get_key(endpoint: Endpoint, params: dict[str, Any]) -> str:
+        return f'{endpoint.key}:{json.dumps(params, sort_keys=True, default=str)}'
+
+    @staticmethod
+    def _today() -> date:
+        return datetime.now(timezone.utc).date()
+
+    def _load(self, key: str) -> dict[str, Row]:
+        if key not in self._cache:
+            state = self._store.load(key) if self._store is not None else None
+            self._cache[key] = state['days'] if state else {}
+        return self._cache[key]
+
+    def _save(self, key: str, days: dict[str, Row]) -> None:
+        if self._store is not None:
+            self._store.save(key, dict(days=days))
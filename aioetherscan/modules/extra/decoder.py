@@ -0,0 +1,266 @@
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Optional
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.abi import (
+    compile_decoder,
+    compile_sequence,
+    compile_topic_decoder,
+    event_topic,
+    function_selector,
+    param_names,
+    signature,
+)
+from aioetherscan.modules.extra.generators.checkpoint import CheckpointStore
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Abi = list[dict[str, Any]]
+Columns = dict[str, list]
+
+_LOG_FIELDS: tuple[tuple[str, Callable[[str], Any]], ...] = (
+    ('address', str.lower),
+    ('blockNumber', hex_to_int),
+    ('logIndex', hex_to_int),
+    ('transactionHash', str),
+)
+
+
+class AbiStore:
+    """Fetches verified contracts ABIs lazily and caches them, unverified contracts
+    included. The cache is kept in ``store`` when it is passed."""
+
+    def __init__(self, client: 'Client', store: Optional[CheckpointStore] = None) -> None:
+        self._client = client
+        self._store = store
+        self._abis: dict[str, Optional[Abi]] = {}
+
+    async def get(self, address: str) -> Optional[Abi]:
+        """Returns parsed ABI or None for unverified contracts."""
+        address = address.lower()
+        if address not in self._abis:
+            state = self._store.load(self._get_key(address)) if self._store is not None else None
+            if state is None:
+                state = dict(abi=await self._fetch(address))
+                if self._store is not None:
+                    self._store.save(self._get_key(address), state)
+            self._abis[address] = state['abi']
+        return self._abis[address]
+
+    async def get_many(self, addresses: Iterable[str]) -> dict[str, Optional[Abi]]:
+        addresses = list(dict.fromkeys(a.lower() for a in addresses))
+        abis = await asyncio.gather(*(self.get(address) for address in addresses))
+        return dict(zip(addresses, abis))
+
+    async def _fetch(self, address: str) -> Optional[Abi]:
+        try:
+            response = await self._client.contract.contract_abi(address=address)
+        except EtherscanClientApiError as e:
+            if e.message.upper() == 'NOTOK' and 'not verified' in str(e.result).lower():
+                return None
+            raise
+        return json.loads(response)
+
+    @staticmethod
+    def _get_key(address: str) -> str:
+        return f'abi:{address}'
+
+
+class Event:
+    """Precompiled decoder of an ABI event into columns named after its params.
+
+    Params named as log fields (e.g. ``address``) get ``_`` suffix.
+    """
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        inputs = item['inputs']
+        log_fields = {name for name, _ in _LOG_FIELDS}
+        names = [f'{n}_' if n in log_fields else n for n in param_names(inputs)]
+
+        self.name = item['name']
+        self.topic = event_topic(item)
+        self.signature = '{}({})'.format(
+            self.name,
+            ', '.join(
+                f'{p["type"]}{" indexed" if p.get("indexed") else ""} {n}'
+                for p, n in zip(inputs, names)
+            ),
+        )
+        self.indexed = [
+            (n, compile_topic_decoder(p)) for p, n in zip(inputs, names) if p.get('indexed')
+        ]
+        data_params = [(p, n) for p, n in zip(inputs, names) if not p.get('indexed')]
+        self.data_names = [n for _, n in data_params]
+        self._data_decoder = compile_sequence([compile_decoder(p) for p, _ in data_params])
+        self.topics_count = len(self.indexed) + 1
+        self.fields = [n for n, _ in self.indexed] + self.data_names
+
+    def decode(self, log: dict[str, Any]) -> list:
+        """Returns values of the params, raises ValueError for malformed topics or data."""
+        values = [decode(topic) for (_, decode), topic in zip(self.indexed, log['topics'][1:])]
+        values.extend(self.decode_data(log['data']))
+        return values
+
+    def decode_data(self, data: str) -> tuple:
+        if not self.data_names:
+            return ()
+        return self._data_decoder.decode(bytes.fromhex(data[2:]), 0)
+
+
+class EventDecoder:
+    """Decodes pages of ``Logs.get_logs`` rows into typed columns in one pass.
+
+    Events are indexed by ``(topic0, topics count)``, so ERC-20 and ERC-721 ``Transfer``
+    are told apart. ABIs of unknown emitters are fetched via ``AbiStore`` once.
+    """
+
+    def __init__(self, abi_store: AbiStore) -> None:
+        self._abi_store = abi_store
+        self._events: dict[tuple[str, int], Event] = {}
+        self._loaded: set[str] = set()
+
+        self._logger = logging.getLogger(__name__)
+
+    def register(self, abi: Abi) -> None:
+        for item in abi:
+            if item.get('type') == 'event' and not item.get('anonymous'):
+                event = Event(item)
+                self._events.setdefault((event.topic, event.topics_count), event)
+
+    async def load(self, addresses: Iterable[str]) -> None:
+        """Registers events of the contracts ABIs which have not been loaded yet."""
+        addresses = {a.lower() for a in addresses} - self._loaded
+        for abi in (await self._abi_store.get_many(addresses)).values():
+            if abi:
+                self.register(abi)
+        self._loaded |= addresses
+
+    async def decode_logs(self, logs: list[dict[str, Any]]) -> dict[str, Columns]:
+        """Loads ABIs of emitters of unknown events, then decodes the logs."""
+        await self.load(
+            log['address'] for log in logs if log['topics'] and self._get_event(log) is None
+        )
+        return self.decode_batch(logs)
+
+    def decode_batch(self, logs: Iterable[dict[str, Any]]) -> dict[str, Columns]:
+        """Returns columns by event signature, logs of unknown events and logs which don't
+        match their event layout are skipped."""
+        columns: dict[str, Columns] = {}
+        skipped = malformed = 0
+        for log in logs:
+            event = self._get_event(log) if log['topics'] else None
+            if event is None:
+                skipped += 1
+                continue
+            try:
+                values = event.decode(log)
+            except ValueError:
+                malformed += 1
+                continue
+
+            event_columns = columns.get(event.signature)
+            if event_columns is None:
+                event_columns = columns[event.signature] = {
+                    name: [] for name in [n for n, _ in _LOG_FIELDS] + event.fields
+                }
+
+            for name, convert in _LOG_FIELDS:
+                event_columns[name].append(convert(log[name]))
+            for name, value in zip(event.fields, values):
+                event_columns[name].append(value)
+
+        if skipped:
+            self._logger.debug(f'Skipped {skipped:,} logs of unknown events')
+        if malformed:
+            self._logger.info(f'Skipped {malformed:,} logs not matching their event ABI')
+        return columns
+
+    def _get_event(self, log: dict[str, Any]) -> Optional[Event]:
+        return self._events.get((log['topics'][0], len(log['topics'])))
+
+
+class Function:
+    """Precompiled decoder of an ABI function arguments."""
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        self.name = item['name']
+        self.selector = function_selector(item)
+        self.signature = signature(item)
+        self.arg_names = param_names(item['inputs'])
+        self._decoder = compile_sequence([compile_decoder(p) for p in item['inputs']])
+
+    def decode_args(self, calldata: str) -> dict[str, Any]:
+        return dict(zip(self.arg_names, self._decoder.decode(bytes.fromhex(calldata[10:]), 0)))
+
+
+class CalldataDecoder:
+    """Decodes transactions ``input`` by the 4-byte selector index of known ABIs.
+
+    Functions are looked up by selector in O(1), ABIs of called contracts with unknown
+    selectors are fetched via ``AbiStore`` once.
+    """
+
+    _BATCH_SIZE: int = 1_000
+
+    def __init__(self, abi_store: AbiStore) -> None:
+        self._abi_store = abi_store
+        self._functions: dict[str, Function] = {}
+        self._loaded: set[str] = set()
+
+    def register(self, abi: Abi) -> None:
+        for item in abi:
+            if item.get('type') == 'function':
+                function = Function(item)
+                self._functions.setdefault(function.selector, function)
+
+    async def load(self, addresses: Iterable[str]) -> None:
+        """Registers functions of the contracts ABIs which have not been loaded yet."""
+        addresses = {a.lower() for a in addresses} - self._loaded
+        for abi in (await self._abi_store.get_many(addresses)).values():
+            if abi:
+                self.register(abi)
+        self._loaded |= addresses
+
+    def decode_batch(
+        self, inputs: Iterable[str]
+    ) -> tuple[list[Optional[str]], list[Optional[dict[str, Any]]]]:
+        """Returns methods and args columns, None for unknown selectors and malformed
+        calldata."""
+        methods, args = [], []
+        for calldata in inputs:
+            function = self._functions.get(calldata[:10]) if len(calldata) >= 10 else None
+            try:
+                decoded = function.decode_args(calldata) if function else None
+            except ValueError:
+                decoded = None
+            methods.append(function.name if decoded is not None else None)
+            args.append(decoded)
+        return methods, args
+
+    async def enrich(self, txs: AsyncIterator[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """Adds ``method`` and ``args`` fields to txs, which are decoded by batches."""
+        batch = []
+        async for tx in txs:
+            batch.append(tx)
+            if len(batch) >= self._BATCH_SIZE:
+                for tx_ in await self.enrich_batch(batch):
+                    yield tx_
+                batch = []
+        for tx in await self.enrich_batch(batch):
+            yield tx
+
+    async def enrich_batch(self, txs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Adds ``method`` and ``args`` fields to the txs in place, returns them."""
+        await self.load(
+            tx['to']
+            for tx in txs
+            if tx.get('to') and tx['input'][:10] not in self._functions and len(tx['input']) >= 10
+        )
+        methods, args = self.decode_batch(tx['input'] for tx in txs)
+        for tx, method, tx_args in zip(txs, methods, args):
+            tx['method'], tx['args'] = method, tx_args
+        return txs
@@ -0,0 +1,237 @@
+import asyncio
+import csv
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterable, Optional
+
+from aioetherscan.modules.extra.generators.helpers import parse_int
+
+Row = dict[str, Any]
+
+
+class Sink(ABC):
+    """Buffered file sink which writes rows in batches off the event loop.
+
+    At most two batches live in memory: the one being filled and the one being written
+    by a worker thread, so producers are naturally throttled by the disk.
+
+    Output may be rotated by file size and/or by block range, ``path`` is a format string
+    which receives ``part`` (sequential file number) and ``block`` (first block of the
+    current blocks range, ``0`` when rotation by blocks is disabled). With ``append``
+    existing files are appended to, e.g. to continue an export resumed from a checkpoint,
+    files already filled up to ``max_file_size`` are skipped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        max_file_size: Optional[int] = None,
+        blocks_per_file: Optional[int] = None,
+        append: bool = False,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f'Invalid batch_size {batch_size!r}, must be positive.')
+        if (max_file_size or blocks_per_file) and path.format(part=0, block=0) == path.format(
+            part=1, block=1
+        ):
+            raise ValueError(
+                f'Path {path!r} must contain {{part}} or {{block}} placeholder for rotation.'
+            )
+
+        self._path = path
+        self._batch_size = batch_size
+        self._max_file_size = max_file_size
+        self._blocks_per_file = blocks_per_file
+        self._mode = 'a' if append else 'w'
+
+        self._buffer: list[Row] = []
+        self._pending: Optional[asyncio.Task] = None
+
+        self._part = 0
+        self._block = 0
+        self._file_path: Optional[str] = None
+        self.paths: list[str] = []
+        self.rows_written = 0
+
+        self._logger = logging.getLogger(__name__)
+
+    async def write(self, row: Row) -> None:
+        if self._blocks_per_file:
+            block = parse_int(row['blockNumber']) // self._blocks_per_file * self._blocks_per_file
+            if block != self._block:
+                await self._rotate(block)
+
+        self._buffer.append(row)
+        if len(self._buffer) >= self._batch_size:
+            await self.flush(wait=False)
+
+    async def flush(self, wait: bool = True) -> None:
+        if self._pending is not None:
+            await self._pending
+            self._pending = None
+
+        if self._buffer:
+            rows, self._buffer = self._buffer, []
+            self._pending = asyncio.ensure_future(asyncio.to_thread(self._write_batch, rows))
+
+        if wait and self._pending is not None:
+            await self._pending
+            self._pending = None
+
+    def discard(self) -> None:
+        """Drops rows which have not been flushed yet."""
+        self._buffer.clear()
+
+    @property
+    def position(self) -> tuple[int, int]:
+        """Returns the part number and the size of the current file, valid after ``flush``."""
+        if self._file_path is None:
+            return self._part, 0
+        return self._part, os.path.getsize(self._file_path)
+
+    async def close(self) -> None:
+        await self.flush()
+        await asyncio.to_thread(self._close_current)
+
+    async def __aenter__(self) -> 'Sink':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _rotate(self, block: int) -> None:
+        await self.flush()
+        await asyncio.to_thread(self._close_current)
+        self._block = block
+
+    def _write_batch(self, rows: list[Row]) -> None:
+        if self._file_path is None:
+            self._file_path = self._next_path()
+            self._logger.debug(f'Opening {self._file_path!r}')
+            self._open(self._file_path)
+            self.paths.append(self._file_path)
+
+        self._write_rows(rows)
+        self.rows_written += len(rows)
+
+        if self._max_file_size and os.path.getsize(self._file_path) >= self._max_file_size:
+            self._close_current()
+
+    def _next_path(self) -> str:
+        path = self._path.format(part=self._part, block=self._block)
+        while self._mode == 'a' and self._max_file_size:
+            if not os.path.exists(path) or os.path.getsize(path) < self._max_file_size:
+                break
+            next_path = self._path.format(part=self._part + 1, block=self._block)
+            if next_path == path:
+                break
+            self.paths.append(path)
+            self._part += 1
+            path = next_path
+        return path
+
+    def _close_current(self) -> None:
+        if self._file_path is not None:
+            self._logger.debug(f'Closing {self._file_path!r}')
+            self._close()
+            self._file_path = None
+            self._part += 1
+
+    @abstractmethod
+    def _open(self, path: str) -> None:
+        """Opens a new output file."""
+
+    @abstractmethod
+    def _write_rows(self, rows: list[Row]) -> None:
+        """Writes a batch of rows to the current file."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Closes the current file."""
+
+
+class JsonlSink(Sink):
+    def _open(self, path: str) -> None:
+        self._file = open(path, self._mode, encoding='utf-8')
+
+    def _write_rows(self, rows: list[Row]) -> None:
+        self._file.writelines(json.dumps(row) + '\n' for row in rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class CsvSink(Sink):
+    """CSV sink, columns are taken from ``fields`` or from the first row of every file."""
+
+    def __init__(self, path: str, fields: Optional[list[str]] = None, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self._fields = fields
+
+    def _open(self, path: str) -> None:
+        self._file = open(path, self._mode, encoding='utf-8', newline='')
+        self._writer = None
+
+    def _write_rows(self, rows: list[Row]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=self._fields or list(rows[0]), extrasaction='ignore'
+            )
+            if not self._file.tell():
+                self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(Sink):
+    """Parquet sink, every batch is written as a separate row group.
+
+    Requires ``pyarrow`` (``pip install aioetherscan[parquet]``).
+    """
+
+    def __init__(self, path: str, **kwargs) -> None:
+        if kwargs.get('append'):
+            raise ValueError('ParquetSink does not support appending to existing files.')
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                'ParquetSink requires pyarrow, install it with `pip install pyarrow`.'
+            ) from None
+
+        super().__init__(path, **kwargs)
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._schema = None
+
+    def _open(self, path: str) -> None:
+        self._writer = None
+        self._writer_path = path
+
+    def _write_rows(self, rows: list[Row]) -> None:
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        if self._schema is None:
+            self._schema = table.schema
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._writer_path, self._schema)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def export(rows: AsyncIterable[Row], sink: Sink) -> int:
+    """Streams rows from any generator or paged endpoint to the sink, returns rows count."""
+    async with sink:
+        async for row in rows:
+            await sink.write(row)
+    return sink.rows_written
@@ -0,0 +1,52 @@
+import asyncio
+import contextlib
+from typing import AsyncIterator, Generic, TypeVar
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+class _Error:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class BackgroundIterator(Generic[T]):
+    """Drains the source iterator in a background task into a bounded queue.
+
+    The producer runs ahead of the consumer by at most ``depth`` items,
+    exceptions are re-raised on the consumer side in order.
+    """
+
+    def __init__(self, iterator: AsyncIterator[T], depth: int) -> None:
+        self._iterator = iterator
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        self._task = asyncio.ensure_future(self._produce())
+
+    async def _produce(self) -> None:
+        try:
+            async for item in self._iterator:
+                await self._queue.put(item)
+        except Exception as e:
+            await self._queue.put(_Error(e))
+        else:
+            await self._queue.put(_DONE)
+
+    def __aiter__(self) -> 'BackgroundIterator[T]':
+        return self
+
+    async def __anext__(self) -> T:
+        item = await self._queue.get()
+        if item is _DONE:
+            raise StopAsyncIteration
+        if isinstance(item, _Error):
+            raise item.exc
+        return item
+
+    async def aclose(self) -> None:
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        if hasattr(self._iterator, 'aclose'):
+            await self._iterator.aclose()
@@ -1,16 +1,43 @@
 import logging
-from typing import AsyncIterator, Any, Iterable
+from math import isqrt
+from typing import AsyncIterator, Any, Awaitable, Iterable, NamedTuple, Optional
 from typing import Callable
 
 from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.generators.background import BackgroundIterator
 from aioetherscan.modules.extra.generators.blocks_range import BlocksRange
-from aioetherscan.modules.extra.generators.helpers import get_max_block_number, drop_block
+from aioetherscan.modules.extra.generators.checkpoint import Checkpoint, State
+from aioetherscan.modules.extra.generators.helpers import (
+    get_max_block_number,
+    drop_block,
+    tx_block_number,
+)
 
 Transfer = dict[str, Any]
+# completes the transfers of a window, e.g. with decoded input
+Enrich = Callable[[list[Transfer]], Awaitable[list[Transfer]]]
+
+
+class Window(NamedTuple):
+    next_block: int
+    transfers: list[Transfer]
 
 
 class BlocksParser:
+    """Fetches transfers window by window.
+
+    With ``prefetch`` the next windows are fetched in background while the transfers of
+    the current one are being consumed, at most ``prefetch`` windows are buffered.
+
+    By default, when a page is full, the transfers of its last block are dropped and
+    the block is fetched again with the next window. In ``cursor`` mode the rest of
+    that block is fetched by pages instead, so no transfer is downloaded twice, and a
+    single block window which fails is fetched by smaller pages before giving up.
+    """
+
     _OFFSET: int = 10_000
+    _BLOCK_PAGE_OFFSET: int = 1_000
+    _MAX_TAIL_PAGES: int = 10
 
     def __init__(
         self,
@@ -20,29 +47,84 @@ class BlocksParser:
         end_block: int,
         blocks_limit: int,
         blocks_limit_divider: int,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+        resume: bool = False,
+        prefetch: int = 0,
+        open_range: bool = False,
     ) -> None:
         self._api_method = api_method
         self._request_params = request_params
+        self._cursor = cursor
+        self._checkpoint = checkpoint
+        self._prefetch = prefetch
 
-        self._blocks_range = BlocksRange(start_block, end_block, blocks_limit, blocks_limit_divider)
+        self._blocks_range = BlocksRange(
+            start_block, end_block, blocks_limit, blocks_limit_divider, target_rows, open_range
+        )
 
         self._logger = logging.getLogger(__name__)
         self._total_txs = 0
 
-    async def txs_generator(self) -> AsyncIterator[Transfer]:
-        while self._blocks_range.blocks_left:
+        if checkpoint is not None and resume:
+            self._resume(checkpoint)
+
+    async def txs_generator(self, enrich: Optional[Enrich] = None) -> AsyncIterator[Transfer]:
+        """Yields transfers window by window, ``enrich`` is applied to every window before
+        its transfers are yielded, so the checkpoint saved after them covers enriched rows."""
+        windows = self.windows_generator()
+        if self._prefetch > 0:
+            windows = BackgroundIterator(windows, self._prefetch)
+
+        try:
+            async for window in windows:
+                transfers = window.transfers
+                if enrich is not None and transfers:
+                    transfers = await enrich(transfers)
+                for transfer in transfers:
+                    yield transfer
+
+                if self._checkpoint is not None:
+                    self._checkpoint.save(self.get_state(window))
+        finally:
+            await windows.aclose()
+
+    def get_state(self, window: Window) -> State:
+        return dict(
+            current_block=window.next_block,
+            total_txs=self._total_txs,
+            **self._blocks_range.limit.get_state(),
+        )
+
+    def _resume(self, checkpoint: Checkpoint) -> None:
+        state = checkpoint.load()
+        if state is None:
+            self._logger.info(f'No checkpoint {checkpoint.key!r} found, starting from scratch')
+            return
+
+        self._logger.info(f'Resuming from checkpoint {checkpoint.key!r}: {state}')
+        self._blocks_range.current_block = state['current_block']
+        self._blocks_range.limit.set_state(state)
+        self._total_txs = state['total_txs']
+
+    async def windows_generator(self) -> AsyncIterator[Window]:
+        while self._blocks_range.blocks_left > 0:
             try:
                 blocks_range = self._blocks_range.get_blocks_range()
-                last_seen_block, transfers = await self._fetch_blocks_range(blocks_range)
+                last_seen_block, transfers = await self._fetch_window(blocks_range)
             except EtherscanClientApiError as e:
                 self._logger.error(f'Error: {e}')
                 self._blocks_range.limit.reduce()
             else:
+                transfers = list(transfers)
                 self._blocks_range.current_block = last_seen_block + 1
                 self._blocks_range.limit.restore()
+                self._blocks_range.limit.observe(
+                    len(transfers), last_seen_block - blocks_range.start + 1
+                )
 
-                for transfer in transfers:
-                    yield transfer
+                yield Window(self._blocks_range.current_block, transfers)
 
                 self._logger.info(
                     f'[{self._blocks_range.blocks_done / self._blocks_range.size:.2%}] '
@@ -50,6 +132,17 @@ class BlocksParser:
                     f'({self._blocks_range.blocks_left:,} blocks left)'
                 )
 
+    async def _fetch_window(self, blocks_range: range) -> tuple[int, Iterable[Transfer]]:
+        try:
+            return await self._fetch_blocks_range(blocks_range)
+        except EtherscanClientApiError:
+            if not self._cursor or blocks_range.start != blocks_range.stop:
+                raise
+            self._logger.warning(f'Fetching block {blocks_range.stop:,} by pages')
+            return blocks_range.stop, await self._fetch_block_pages(
+                blocks_range.stop, self._BLOCK_PAGE_OFFSET
+            )
+
     def _make_request_params(self, blocks_range: range) -> Transfer:
         current_params = dict(
             start_block=blocks_range.start,
@@ -80,11 +173,65 @@ class BlocksParser:
 
             transfers_max_block = get_max_block_number(transfers)
 
-            if transfers_count == self._OFFSET:
+            if transfers_count == self._OFFSET and self._cursor:
+                fetched = sum(1 for t in transfers if tx_block_number(t) == transfers_max_block)
+                self._logger.debug(
+                    f'Probably not all txs have been fetched, fetching the rest of the block '
+                    f'{transfers_max_block:,} after {fetched:,} txs'
+                )
+                tail = await self._fetch_block_tail(transfers_max_block, fetched)
+                return transfers_max_block, transfers + tail
+            elif transfers_count == self._OFFSET:
                 self._logger.debug(
                     f'Probably not all txs have been fetched, dropping txs with the last block {transfers_max_block:,}'
                 )
                 return transfers_max_block - 1, drop_block(transfers, transfers_max_block)
             else:
                 self._logger.debug('All txs have been fetched')
-                return transfers_max_block, transfers
+                return blocks_range.stop if self._cursor else transfers_max_block, transfers
+
+    async def _fetch_block_tail(self, block: int, fetched: int) -> list[Transfer]:
+        if fetched >= self._OFFSET:
+            self._logger.warning(
+                f'Block {block:,} has more than {self._OFFSET:,} txs, the rest are skipped'
+            )
+            return []
+
+        offset = self._get_tail_offset(fetched)
+        if offset is None:
+            self._logger.debug(f'No suitable page size for {fetched:,} txs, fetching whole block')
+            return (await self._fetch_block_pages(block, self._OFFSET))[fetched:]
+        return await self._fetch_block_pages(block, offset, fetched // offset + 1)
+
+    def _get_tail_offset(self, fetched: int) -> Optional[int]:
+        """Returns the biggest page size which starts right after the fetched txs."""
+        divisors = (
+            d for i in range(1, isqrt(fetched) + 1) if fetched % i == 0 for d in (i, fetched // i)
+        )
+        offset = max(d for d in divisors if d <= self._OFFSET - fetched)
+        if (self._OFFSET - fetched) / offset > self._MAX_TAIL_PAGES:
+            return None
+        return offset
+
+    async def _fetch_block_pages(self, block: int, offset: int, page: int = 1) -> list[Transfer]:
+        transfers = []
+        while page * offset <= self._OFFSET:
+            params = self._request_params | dict(
+                start_block=block, end_block=block, page=page, offset=offset
+            )
+            try:
+                rows = await self._api_method(**params)
+            except EtherscanClientApiError as e:
+                if e.message == 'No transactions found':
+                    return transfers
+                raise
+
+            transfers.extend(rows)
+            if len(rows) < offset:
+                return transfers
+            page += 1
+
+        self._logger.warning(
+            f'Block {block:,} has too many txs to be fetched by pages, the rest are skipped'
+        )
+        return transfers
@@ -1,4 +1,6 @@
 import logging
+import sys
+from typing import Optional
 
 
 class Limit:
@@ -24,17 +26,160 @@ class Limit:
     def restore(self) -> None:
         self._limit = self._initial_limit
 
+    def observe(self, rows: int, blocks: int) -> None:
+        """Called with the rows count fetched from the blocks after every successful request."""
+
+    def get_state(self) -> dict:
+        return dict(limit=self._limit)
+
+    def set_state(self, state: dict) -> None:
+        self._limit = state['limit']
+
+
+class AdaptiveLimit(Limit):
+    """Sizes the next window to get about ``target_rows`` rows per request.
+
+    Transactions density (rows per block) is estimated by exponential moving average over
+    recent windows, so the window grows on sparse ranges and shrinks before the API
+    rows cap is hit. Window may grow at most ``_MAX_GROWTH`` times per request.
+
+    The learned ``density`` is kept in generator checkpoints, so a resumed run starts
+    from it. An initial ``density`` is accepted only by the limit classes themselves.
+    """
+
+    _SMOOTHING: float = 0.5
+    _MAX_GROWTH: int = 4
+
+    def __init__(
+        self,
+        limit: int,
+        blocks_range_divider: int,
+        target_rows: int,
+        density: Optional[float] = None,
+    ) -> None:
+        super().__init__(limit, blocks_range_divider)
+        if target_rows < 1:
+            raise ValueError(f'Invalid target_rows {target_rows!r}, must be positive.')
+
+        self._target_rows = target_rows
+        self.density = density
+        if density is not None:
+            self._limit = self._limit_for(density, self._initial_limit)
+
+    def reduce(self) -> None:
+        super().reduce()
+        if self.density is not None:
+            self.density *= self._blocks_range_divider
+
+    def restore(self) -> None:
+        pass
+
+    def observe(self, rows: int, blocks: int) -> None:
+        if blocks < 1:
+            return
+
+        density = rows / blocks
+        if self.density is not None:
+            density = self._SMOOTHING * density + (1 - self._SMOOTHING) * self.density
+        self.density = density
+
+        new_limit = self._limit_for(density, self._limit)
+        self._logger.debug(
+            f'Density is {density:.4f} rows per block, '
+            f'changing limit from {self._limit:,} to {new_limit:,}'
+        )
+        self._limit = new_limit
+
+    def get_state(self) -> dict:
+        return super().get_state() | dict(density=self.density)
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.density = state.get('density', self.density)
+
+    def _limit_for(self, density: float, current_limit: int) -> int:
+        max_limit = current_limit * self._MAX_GROWTH
+        if density == 0:
+            return max_limit
+        return max(1, min(max_limit, int(self._target_rows / density)))
+
+
+class OpenRangeLimit(AdaptiveLimit):
+    """Requests the whole remaining range while the address looks sparse.
+
+    Every open request returns either all the remaining rows or a full page, after which
+    the range continues from the last complete block. The limit switches to adaptive
+    windows when an open request fails or when the estimated window gets below
+    ``_OPEN_GROWTH`` initial limits, and back to open range when it grows over it.
+    """
+
+    _OPEN_GROWTH: int = 64
+    _DEFAULT_TARGET_ROWS: int = 5_000
+
+    def __init__(
+        self,
+        limit: int,
+        blocks_range_divider: int,
+        target_rows: Optional[int] = None,
+        density: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            limit, blocks_range_divider, target_rows or self._DEFAULT_TARGET_ROWS, density
+        )
+        if density:
+            self._limit = self._open_limit_for(density)
+        self.is_open = density is None or self._is_sparse()
+
+    def get(self) -> int:
+        if self.is_open:
+            self._logger.debug('Limit is open')
+            return sys.maxsize
+        return super().get()
+
+    def reduce(self) -> None:
+        if self.is_open:
+            self._logger.debug('Open range request failed, switching to windows')
+            self.is_open = False
+        else:
+            super().reduce()
+
+    def observe(self, rows: int, blocks: int) -> None:
+        was_open = self.is_open
+        super().observe(rows, blocks)
+        if was_open and self.density:
+            self._limit = self._open_limit_for(self.density)
+        self.is_open = self._is_sparse()
+
+    def get_state(self) -> dict:
+        return super().get_state() | dict(is_open=self.is_open)
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.is_open = state.get('is_open', self.is_open)
+
+    def _open_limit_for(self, density: float) -> int:
+        return max(1, int(self._target_rows / density))
+
+    def _is_sparse(self) -> bool:
+        return self._limit >= self._initial_limit * self._OPEN_GROWTH
+
 
 class BlocksRange:
     def __init__(
-        self, start_block: int, end_block: int, blocks_limit: int, blocks_limit_divider: int
+        self,
+        start_block: int,
+        end_block: int,
+        blocks_limit: int,
+        blocks_limit_divider: int,
+        target_rows: Optional[int] = None,
+        open_range: bool = False,
     ) -> None:
         self.start_block = start_block
         self.end_block = end_block
 
         self._current_block = start_block
 
-        self.limit = Limit(blocks_limit, blocks_limit_divider)
+        self.limit = self._get_limit(blocks_limit, blocks_limit_divider, target_rows, open_range)
 
         self._logger = logging.getLogger(__name__)
 
@@ -42,13 +187,26 @@ class BlocksRange:
             f'Initial blocks range: {self.start_block:,}..{self.end_block:,} ({self.size:,})'
         )
 
+    @staticmethod
+    def _get_limit(
+        blocks_limit: int,
+        blocks_limit_divider: int,
+        target_rows: Optional[int],
+        open_range: bool,
+    ) -> Limit:
+        if open_range:
+            return OpenRangeLimit(blocks_limit, blocks_limit_divider, target_rows)
+        if target_rows is not None:
+            return AdaptiveLimit(blocks_limit, blocks_limit_divider, target_rows)
+        return Limit(blocks_limit, blocks_limit_divider)
+
     @property
     def current_block(self) -> int:
         return self._current_block
 
     @current_block.setter
     def current_block(self, value: int) -> None:
-        block = min(value, self.end_block)
+        block = min(value, self.end_block + 1)
         self._logger.info(f'Current block is changed from {self._current_block:,} to {block:,}')
         self._current_block = block
 
@@ -67,7 +225,7 @@ class BlocksRange:
 
     @property
     def blocks_left(self) -> int:
-        return self.end_block - self.current_block
+        return self.end_block - self.current_block + 1
 
     @property
     def size(self) -> int:
@@ -0,0 +1,112 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+State = dict[str, Any]
+
+
+class CheckpointStore(ABC):
+    """Persists the parser state by key. Stores may be used from worker threads."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[State]:
+        """Returns saved state or None."""
+
+    @abstractmethod
+    def save(self, key: str, state: State) -> None:
+        """Saves the state, overwriting the previous one."""
+
+    def save_many(self, states: dict[str, State]) -> None:
+        """Saves several states at once."""
+        for key, state in states.items():
+            self.save(key, state)
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    def __init__(self) -> None:
+        self._states: dict[str, State] = {}
+
+    def load(self, key: str) -> Optional[State]:
+        return self._states.get(key)
+
+    def save(self, key: str, state: State) -> None:
+        self._states[key] = state
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keeps all states in a JSON file, which is replaced atomically on every save, so
+    many states are better saved with one ``save_many()`` call."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[State]:
+        return self._read().get(key)
+
+    def save(self, key: str, state: State) -> None:
+        self.save_many({key: state})
+
+    def save_many(self, states: dict[str, State]) -> None:
+        with self._lock:
+            saved = self._read()
+            saved.update(states)
+
+            tmp_path = f'{self._path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, self._path)
+
+    def _read(self) -> dict[str, State]:
+        try:
+            with open(self._path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    def __init__(self, path: str) -> None:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, state TEXT NOT NULL)'
+            )
+
+    def load(self, key: str) -> Optional[State]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT state FROM checkpoints WHERE key = ?', (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, state: State) -> None:
+        self.save_many({key: state})
+
+    def save_many(self, states: dict[str, State]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO checkpoints (key, state) VALUES (?, ?)',
+                [(key, json.dumps(state)) for key, state in states.items()],
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class Checkpoint:
+    """Binds a store to the key of a single generator run."""
+
+    def __init__(self, store: CheckpointStore, key: str) -> None:
+        self._store = store
+        self.key = key
+
+    def load(self) -> Optional[State]:
+        return self._store.load(self.key)
+
+    def save(self, state: State) -> None:
+        self._store.save(self.key, state)
@@ -1,13 +1,21 @@
-import inspect
+import json
 import sys
+from datetime import datetime
 from itertools import count
-from typing import Callable, Any, Optional, TYPE_CHECKING, AsyncIterator
+from typing import Callable, Any, Optional, TYPE_CHECKING, AsyncIterator, Union
 
 from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.base import get_endpoint
 from aioetherscan.modules.extra.generators.blocks_parser import BlocksParser, Transfer
+from aioetherscan.modules.extra.generators.checkpoint import Checkpoint, CheckpointStore
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+from aioetherscan.modules.extra.generators.logs_parser import LogsParser
+from aioetherscan.modules.extra.generators.merge import merge_streams
+from aioetherscan.modules.extra.generators.sharded_parser import ShardedBlocksParser
 
 if TYPE_CHECKING:  # pragma: no cover
     from aioetherscan import Client
+    from aioetherscan.modules.logs import Topics, TopicOperators
 
 
 class GeneratorUtils:
@@ -15,6 +23,9 @@ class GeneratorUtils:
     _DEFAULT_END_BLOCK: int = sys.maxsize
     _DEFAULT_BLOCKS_LIMIT: int = 2048
     _DEFAULT_BLOCKS_LIMIT_DIVIDER: int = 2
+    _DEFAULT_SHARDS: int = 1
+    _DEFAULT_PREFETCH: int = 0
+    _ACTIVITY_KINDS: tuple[str, ...] = ('normal', 'internal', 'erc20', 'erc721', 'erc1155')
 
     def __init__(self, client: 'Client') -> None:
         self._client = client
@@ -23,10 +34,18 @@ class GeneratorUtils:
         self,
         contract_address: str = None,
         address: str = None,
-        start_block: int = _DEFAULT_START_BLOCK,
-        end_block: int = _DEFAULT_END_BLOCK,
+        start_block: Union[int, datetime] = _DEFAULT_START_BLOCK,
+        end_block: Union[int, datetime] = _DEFAULT_END_BLOCK,
         blocks_limit: int = _DEFAULT_BLOCKS_LIMIT,
         blocks_limit_divider: int = _DEFAULT_BLOCKS_LIMIT_DIVIDER,
+        shards: int = _DEFAULT_SHARDS,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume: bool = False,
+        prefetch: int = _DEFAULT_PREFETCH,
+        open_range: bool = False,
+        token_standard: str = 'erc20',
     ) -> AsyncIterator[Transfer]:
         parser_params = self._get_parser_params(self._client.account.token_transfers, locals())
         async for transfer in self._parse_by_blocks(**parser_params):
@@ -35,10 +54,18 @@ class GeneratorUtils:
     async def normal_txs(
         self,
         address: str,
-        start_block: int = _DEFAULT_START_BLOCK,
-        end_block: int = _DEFAULT_END_BLOCK,
+        start_block: Union[int, datetime] = _DEFAULT_START_BLOCK,
+        end_block: Union[int, datetime] = _DEFAULT_END_BLOCK,
         blocks_limit: int = _DEFAULT_BLOCKS_LIMIT,
         blocks_limit_divider: int = _DEFAULT_BLOCKS_LIMIT_DIVIDER,
+        shards: int = _DEFAULT_SHARDS,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume: bool = False,
+        prefetch: int = _DEFAULT_PREFETCH,
+        open_range: bool = False,
+        decode_input: bool = False,
     ) -> AsyncIterator[Transfer]:
         parser_params = self._get_parser_params(self._client.account.normal_txs, locals())
         async for transfer in self._parse_by_blocks(**parser_params):
@@ -47,11 +74,18 @@ class GeneratorUtils:
     async def internal_txs(
         self,
         address: str,
-        start_block: int = _DEFAULT_START_BLOCK,
-        end_block: int = _DEFAULT_END_BLOCK,
+        start_block: Union[int, datetime] = _DEFAULT_START_BLOCK,
+        end_block: Union[int, datetime] = _DEFAULT_END_BLOCK,
         blocks_limit: int = _DEFAULT_BLOCKS_LIMIT,
         blocks_limit_divider: int = _DEFAULT_BLOCKS_LIMIT_DIVIDER,
         txhash: Optional[str] = None,
+        shards: int = _DEFAULT_SHARDS,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume: bool = False,
+        prefetch: int = _DEFAULT_PREFETCH,
+        open_range: bool = False,
     ) -> AsyncIterator[Transfer]:
         parser_params = self._get_parser_params(self._client.account.internal_txs, locals())
         async for transfer in self._parse_by_blocks(**parser_params):
@@ -64,25 +98,139 @@ class GeneratorUtils:
         async for transfer in self._parse_by_pages(**parser_params):
             yield transfer
 
+    async def account_activity(
+        self,
+        address: str,
+        start_block: Union[int, datetime] = _DEFAULT_START_BLOCK,
+        end_block: Union[int, datetime] = _DEFAULT_END_BLOCK,
+        kinds: tuple[str, ...] = _ACTIVITY_KINDS,
+        blocks_limit: int = _DEFAULT_BLOCKS_LIMIT,
+        blocks_limit_divider: int = _DEFAULT_BLOCKS_LIMIT_DIVIDER,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        open_range: bool = False,
+    ) -> AsyncIterator[Transfer]:
+        """Runs txs and token transfers generators concurrently and merges them in order.
+
+        Rows are ordered by ``(blockNumber, transactionIndex, logIndex)`` and tagged
+        with their kind, one of ``normal``, ``internal``, ``erc20``, ``erc721``, ``erc1155``.
+        """
+        unknown_kinds = set(kinds) - set(self._ACTIVITY_KINDS)
+        if not kinds or unknown_kinds:
+            raise ValueError(f'Invalid kinds {kinds!r}, only {self._ACTIVITY_KINDS} are supported.')
+
+        start_block, end_block = await self._resolve_blocks(start_block, end_block)
+        params = dict(
+            address=address,
+            start_block=start_block,
+            end_block=end_block,
+            blocks_limit=blocks_limit,
+            blocks_limit_divider=blocks_limit_divider,
+            target_rows=target_rows,
+            cursor=cursor,
+            open_range=open_range,
+        )
+        streams = {kind: self._get_activity_stream(kind, params) for kind in kinds}
+        async for row in merge_streams(streams):
+            yield row
+
+    def _get_activity_stream(self, kind: str, params: dict[str, Any]) -> AsyncIterator[Transfer]:
+        if kind == 'normal':
+            return self.normal_txs(**params)
+        if kind == 'internal':
+            return self.internal_txs(**params)
+        return self.token_transfers(token_standard=kind, **params)
+
+    async def logs(
+        self,
+        address: Optional[str] = None,
+        topics: Optional['Topics'] = None,
+        operators: Optional['TopicOperators'] = None,
+        start_block: Union[int, datetime] = _DEFAULT_START_BLOCK,
+        end_block: Optional[Union[int, datetime]] = None,
+        blocks_limit: int = _DEFAULT_BLOCKS_LIMIT,
+    ) -> AsyncIterator[Transfer]:
+        """Logs up to ``end_block`` or, by default, the chain head at the start."""
+        if address is None and topics is None:
+            raise ValueError('Either address or topics must be passed.')
+
+        parser_params = self._get_parser_params(self._client.logs.get_logs, locals())
+        async for log in self._parse_logs(**parser_params):
+            yield log
+
+    async def pages(self, api_method: Callable, **request_params) -> AsyncIterator[Transfer]:
+        async for row in self._parse_by_pages(api_method, request_params):
+            yield row
+
     async def _parse_by_blocks(
         self,
         api_method: Callable,
         request_params: dict[str, Any],
-        start_block: int,
-        end_block: int,
+        start_block: Union[int, datetime],
+        end_block: Union[int, datetime],
         blocks_limit: int,
         blocks_limit_divider: int,
+        shards: int = _DEFAULT_SHARDS,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume: bool = False,
+        prefetch: int = _DEFAULT_PREFETCH,
+        open_range: bool = False,
+        decode_input: bool = False,
     ) -> AsyncIterator[Transfer]:
+        start_block, end_block = await self._resolve_blocks(start_block, end_block)
         blocks_parser = self._get_blocks_parser(
-            api_method, request_params, start_block, end_block, blocks_limit, blocks_limit_divider
+            api_method,
+            request_params,
+            start_block,
+            end_block,
+            blocks_limit,
+            blocks_limit_divider,
+            shards,
+            target_rows,
+            cursor,
+            self._get_checkpoint(checkpoint, api_method, request_params, start_block, end_block),
+            resume,
+            prefetch,
+            open_range,
         )
-        async for tx in blocks_parser.txs_generator():
+        enrich = self._client.extra.calldata.enrich_batch if decode_input else None
+        async for tx in blocks_parser.txs_generator(enrich):
             yield tx
 
+    async def _parse_logs(
+        self,
+        api_method: Callable,
+        request_params: dict[str, Any],
+        start_block: Union[int, datetime],
+        end_block: Optional[Union[int, datetime]],
+        blocks_limit: int,
+    ) -> AsyncIterator[Transfer]:
+        if end_block is None:  # windows past the head are empty, the parser would never stop
+            end_block = hex_to_int(await self._client.proxy.block_number())
+        start_block, end_block = await self._resolve_blocks(start_block, end_block)
+        logs_parser = LogsParser(api_method, request_params, start_block, end_block, blocks_limit)
+        async for log in logs_parser.logs_generator():
+            yield log
+
+    async def _resolve_blocks(
+        self, start_block: Union[int, datetime], end_block: Union[int, datetime]
+    ) -> tuple[int, int]:
+        """Datetime bounds are resolved to the first block after the start and the last one
+        before the end."""
+        if isinstance(start_block, datetime):
+            start_block = await self._client.extra.block_time.get_block(start_block, 'after')
+        if isinstance(end_block, datetime):
+            end_block = await self._client.extra.block_time.get_block(end_block, 'before')
+        return start_block, end_block
+
     @staticmethod
     async def _parse_by_pages(
         api_method: Callable, request_params: dict[str, Any]
     ) -> AsyncIterator[Transfer]:
+        """Stops on a "no transactions" error, an empty page or one shorter than ``offset``."""
+        offset = request_params.get('offset')
         page = count(1)
         while True:
             request_params['page'] = next(page)
@@ -95,6 +243,8 @@ class GeneratorUtils:
             else:
                 for row in result:
                     yield row
+                if not result or offset is not None and len(result) < offset:
+                    return
 
     @staticmethod
     def _without_keys(params: dict, excluded_keys: tuple[str, ...] = ('self',)) -> dict:
@@ -111,10 +261,10 @@ class GeneratorUtils:
         )
 
     def _get_request_params(self, api_method: Callable, params: dict[str, Any]) -> dict[str, Any]:
-        api_method_params = inspect.getfullargspec(api_method).args
+        api_method_params = get_endpoint(api_method).args
         return self._without_keys(
             {k: v for k, v in params.items() if k in api_method_params},
-            ('self', 'start_block', 'end_block'),
+            ('start_block', 'end_block'),
         )
 
     @staticmethod
@@ -125,7 +275,59 @@ class GeneratorUtils:
         end_block: int,
         blocks_limit: int,
         blocks_limit_divider: int,
+        shards: int = _DEFAULT_SHARDS,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+        resume: bool = False,
+        prefetch: int = _DEFAULT_PREFETCH,
+        open_range: bool = False,
     ) -> BlocksParser:
+        if shards < 1:
+            raise ValueError(f'Invalid shards {shards!r}, must be positive.')
+        if shards > 1:
+            return ShardedBlocksParser(
+                api_method,
+                request_params,
+                start_block,
+                end_block,
+                blocks_limit,
+                blocks_limit_divider,
+                shards,
+                target_rows,
+                cursor,
+                checkpoint,
+                resume,
+                prefetch,
+                open_range,
+            )
         return BlocksParser(
-            api_method, request_params, start_block, end_block, blocks_limit, blocks_limit_divider
+            api_method,
+            request_params,
+            start_block,
+            end_block,
+            blocks_limit,
+            blocks_limit_divider,
+            target_rows,
+            cursor,
+            checkpoint,
+            resume,
+            prefetch,
+            open_range,
+        )
+
+    def _get_checkpoint(
+        self,
+        store: Optional[CheckpointStore],
+        api_method: Callable,
+        request_params: dict[str, Any],
+        start_block: int,
+        end_block: int,
+    ) -> Optional[Checkpoint]:
+        if store is None:
+            return None
+        params = json.dumps(request_params, sort_keys=True, default=str)
+        return Checkpoint(
+            store,
+            f'{self._client.chain}:{get_endpoint(api_method).key}:{params}:{start_block}:{end_block}',
         )
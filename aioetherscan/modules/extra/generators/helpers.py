@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Union
 
 if TYPE_CHECKING:  # pragma: no cover
     from aioetherscan.modules.extra.generators.blocks_parser import Transfer
@@ -15,3 +15,19 @@ def drop_block(transfers: list['Transfer'], block_number: int) -> Iterable['Tran
 def get_max_block_number(transfers: list['Transfer']) -> int:
     tx_with_max_block_number = max(transfers, key=tx_block_number)
     return tx_block_number(tx_with_max_block_number)
+
+
+def hex_to_int(value: str) -> int:
+    return int(value, 16) if value != '0x' else 0
+
+
+def parse_int(value: Union[int, str]) -> int:
+    """Parses block numbers of any generator: ints, decimal strings of txs and hex strings
+    of logs."""
+    if isinstance(value, int):
+        return value
+    return hex_to_int(value) if value.startswith('0x') else int(value)
+
+
+def log_position(log: dict) -> tuple[int, int]:
+    return hex_to_int(log['blockNumber']), hex_to_int(log['logIndex'])
@@ -0,0 +1,86 @@
+import logging
+from typing import AsyncIterator, Any, Callable
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.generators.blocks_parser import Transfer
+from aioetherscan.modules.extra.generators.helpers import log_position
+
+_NO_RESULT_MESSAGES = ('No records found', 'No transactions found')
+
+
+class LogsParser:
+    """Fetches event logs window by window in ``(blockNumber, logIndex)`` order.
+
+    A window which hits the results cap is bisected until it fits, a single block which
+    still hits it is fetched by pages. The window grows back after windows returning
+    less than a half of the cap.
+    """
+
+    _OFFSET: int = 1_000
+
+    def __init__(
+        self,
+        api_method: Callable,
+        request_params: dict[str, Any],
+        start_block: int,
+        end_block: int,
+        blocks_limit: int,
+    ) -> None:
+        self._api_method = api_method
+        self._request_params = request_params
+
+        self._start_block = start_block
+        self._end_block = end_block
+        self._blocks_limit = blocks_limit
+
+        self._logger = logging.getLogger(__name__)
+
+    async def logs_generator(self) -> AsyncIterator[Transfer]:
+        current_block, limit = self._start_block, self._blocks_limit
+        while current_block <= self._end_block:
+            end_block = min(self._end_block, current_block + limit - 1)
+            logs = await self._fetch(current_block, end_block, page=1)
+
+            if len(logs) >= self._OFFSET and end_block > current_block:
+                limit = (end_block - current_block + 1) // 2
+                self._logger.debug(
+                    f'Range {current_block:,}..{end_block:,} hits the cap, bisecting to {limit:,}'
+                )
+                continue
+
+            if len(logs) >= self._OFFSET:
+                logs += await self._fetch_block_pages(current_block)
+
+            for log in sorted(logs, key=log_position):
+                yield log
+
+            self._logger.info(f'Fetched {len(logs):,} logs from {current_block:,}..{end_block:,}')
+            current_block = end_block + 1
+            if len(logs) < self._OFFSET // 2:
+                limit = min(self._blocks_limit, limit * 2)
+
+    async def _fetch_block_pages(self, block: int) -> list[Transfer]:
+        logs, page = [], 2
+        while True:
+            rows = await self._fetch(block, block, page)
+            logs.extend(rows)
+            if len(rows) < self._OFFSET:
+                return logs
+            page += 1
+
+    async def _fetch(self, from_block: int, to_block: int, page: int) -> list[Transfer]:
+        params = self._make_request_params(from_block, to_block, page)
+        try:
+            return await self._api_method(**params)
+        except EtherscanClientApiError as e:
+            if e.message in _NO_RESULT_MESSAGES:
+                return []
+            raise
+
+    def _make_request_params(self, from_block: int, to_block: int, page: int) -> dict[str, Any]:
+        return self._request_params | dict(
+            from_block=from_block,
+            to_block=to_block,
+            page=page,
+            offset=self._OFFSET,
+        )
@@ -0,0 +1,55 @@
+import heapq
+from itertools import count
+from typing import AsyncIterator, Any, Callable
+
+from aioetherscan.modules.extra.generators.background import BackgroundIterator
+from aioetherscan.modules.extra.generators.blocks_parser import Transfer
+
+
+def activity_position(row: Transfer) -> tuple[int, int, int]:
+    """Rows without transaction or log index go first within the block or the transaction."""
+    return (
+        int(row['blockNumber']),
+        int(row.get('transactionIndex') or -1),
+        int(row.get('logIndex') or -1),
+    )
+
+
+async def merge_streams(
+    streams: dict[str, AsyncIterator[Transfer]],
+    key: Callable[[Transfer], Any] = activity_position,
+    depth: int = 1_000,
+) -> AsyncIterator[Transfer]:
+    """Merges sorted streams running concurrently into one sorted stream.
+
+    Every row is tagged with the name of its stream in the ``kind`` field. Each stream
+    runs ahead of the merge by at most ``depth`` rows, ties are resolved in streams order.
+    """
+    iterators = {kind: BackgroundIterator(stream, depth) for kind, stream in streams.items()}
+    order = {kind: i for i, kind in enumerate(iterators)}
+    heap, sequence = [], count()
+
+    async def push(kind: str) -> None:
+        row = await anext_or_none(iterators[kind])
+        if row is not None:
+            row['kind'] = kind
+            heapq.heappush(heap, (key(row), order[kind], next(sequence), kind, row))
+
+    try:
+        for kind in iterators:
+            await push(kind)
+
+        while heap:
+            *_, kind, row = heapq.heappop(heap)
+            yield row
+            await push(kind)
+    finally:
+        for iterator in iterators.values():
+            await iterator.aclose()
+
+
+async def anext_or_none(iterator: AsyncIterator[Transfer]) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
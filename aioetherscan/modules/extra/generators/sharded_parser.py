@@ -0,0 +1,99 @@
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Any, Callable, Iterator, Optional
+
+from aioetherscan.modules.extra.generators.background import BackgroundIterator
+from aioetherscan.modules.extra.generators.blocks_parser import BlocksParser, Window
+from aioetherscan.modules.extra.generators.checkpoint import Checkpoint
+
+
+class ShardedBlocksParser(BlocksParser):
+    """Splits the blocks range into shards which are fetched concurrently.
+
+    Every shard is parsed by its own ``BlocksParser``, so the 10,000 rows handling and
+    the error driven window reducing are done per shard. Windows are yielded in blocks
+    order: at most ``shards`` shards are in flight and each of them may buffer up to
+    ``_SHARD_WINDOWS`` windows, so memory does not depend on the range size.
+    Requests rate is limited by the client's throttler shared between all shards.
+    """
+
+    _SHARD_WINDOWS: int = 8
+
+    def __init__(
+        self,
+        api_method: Callable,
+        request_params: dict[str, Any],
+        start_block: int,
+        end_block: int,
+        blocks_limit: int,
+        blocks_limit_divider: int,
+        shards: int,
+        target_rows: Optional[int] = None,
+        cursor: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+        resume: bool = False,
+        prefetch: int = 0,
+        open_range: bool = False,
+    ) -> None:
+        super().__init__(
+            api_method,
+            request_params,
+            start_block,
+            end_block,
+            blocks_limit,
+            blocks_limit_divider,
+            target_rows,
+            cursor,
+            checkpoint,
+            resume,
+            prefetch,
+            open_range,
+        )
+        self._shards = shards
+        self._blocks_limit = blocks_limit
+        self._blocks_limit_divider = blocks_limit_divider
+        self._target_rows = target_rows
+        self._open_range = open_range
+
+    async def windows_generator(self) -> AsyncIterator[Window]:
+        shard_ranges = self._shard_ranges()
+        active: deque[BackgroundIterator[Window]] = deque(
+            self._start_shard(*shard_range) for shard_range in islice(shard_ranges, self._shards)
+        )
+        try:
+            while active:
+                async for window in active[0]:
+                    self._blocks_range.current_block = window.next_block
+                    self._total_txs += len(window.transfers)
+                    yield window
+                active.popleft()
+
+                next_range = next(shard_ranges, None)
+                if next_range is not None:
+                    active.append(self._start_shard(*next_range))
+        finally:
+            for shard in active:
+                await shard.aclose()
+
+    def _shard_ranges(self) -> Iterator[tuple[int, int]]:
+        shard_size = self._blocks_limit * self._SHARD_WINDOWS
+        start_block = self._blocks_range.current_block
+        while start_block <= self._blocks_range.end_block:
+            end_block = min(self._blocks_range.end_block, start_block + shard_size - 1)
+            yield start_block, end_block
+            start_block = end_block + 1
+
+    def _start_shard(self, start_block: int, end_block: int) -> BackgroundIterator[Window]:
+        self._logger.debug(f'Starting shard {start_block:,}..{end_block:,}')
+        parser = BlocksParser(
+            self._api_method,
+            self._request_params,
+            start_block,
+            end_block,
+            self._blocks_limit,
+            self._blocks_limit_divider,
+            self._target_rows,
+            self._cursor,
+            open_range=self._open_range,
+        )
+        return BackgroundIterator(parser.windows_generator(), self._SHARD_WINDOWS)
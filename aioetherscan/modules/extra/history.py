@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+CacheKey = tuple[Optional[str], Optional[str], int]
+
+
+class Sample(NamedTuple):
+    block: int
+    value: int
+
+
+class HistorySampler:
+    """Samples balance and supply curves by block.
+
+    The blocks range is sampled in ``points`` evenly spaced blocks, then only the intervals
+    whose ends differ are bisected until they are not longer than ``resolution`` blocks.
+    Every round of bisection is requested concurrently under the client's rate limit.
+    Flat periods cost nothing, but a change reverted within a flat interval is missed.
+    Values are cached per ``(address, contract_address, block)``.
+    """
+
+    _DEFAULT_POINTS: int = 16
+
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+        self._cache: dict[CacheKey, int] = {}
+
+        self._logger = logging.getLogger(__name__)
+
+    async def balance(
+        self,
+        address: str,
+        start_block: int,
+        end_block: int,
+        resolution: int = 1,
+        points: int = _DEFAULT_POINTS,
+    ) -> list[Sample]:
+        return await self._sample(address, None, start_block, end_block, resolution, points)
+
+    async def token_balance(
+        self,
+        address: str,
+        contract_address: str,
+        start_block: int,
+        end_block: int,
+        resolution: int = 1,
+        points: int = _DEFAULT_POINTS,
+    ) -> list[Sample]:
+        return await self._sample(
+            address, contract_address, start_block, end_block, resolution, points
+        )
+
+    async def total_supply(
+        self,
+        contract_address: str,
+        start_block: int,
+        end_block: int,
+        resolution: int = 1,
+        points: int = _DEFAULT_POINTS,
+    ) -> list[Sample]:
+        return await self._sample(
+            None, contract_address, start_block, end_block, resolution, points
+        )
+
+    async def _sample(
+        self,
+        address: Optional[str],
+        contract_address: Optional[str],
+        start_block: int,
+        end_block: int,
+        resolution: int,
+        points: int,
+    ) -> list[Sample]:
+        if start_block > end_block:
+            raise ValueError(f'Invalid blocks range {start_block}..{end_block}.')
+        if resolution < 1 or points < 2:
+            raise ValueError(f'Invalid resolution {resolution!r} or points {points!r}.')
+
+        step = (end_block - start_block) / (points - 1)
+        blocks = sorted({start_block + round(i * step) for i in range(points)})
+        values = dict(zip(blocks, await self._get_values(address, contract_address, blocks)))
+
+        while True:
+            ordered = sorted(values)
+            blocks = [
+                (low + high) // 2
+                for low, high in zip(ordered, ordered[1:])
+                if values[low] != values[high] and high - low > resolution
+            ]
+            if not blocks:
+                break
+            self._logger.debug(f'Bisecting {len(blocks):,} intervals')
+            values.update(zip(blocks, await self._get_values(address, contract_address, blocks)))
+
+        return [Sample(block, values[block]) for block in sorted(values)]
+
+    async def _get_values(
+        self, address: Optional[str], contract_address: Optional[str], blocks: list[int]
+    ) -> list[int]:
+        return await asyncio.gather(
+            *(self._get_value(address, contract_address, block) for block in blocks)
+        )
+
+    async def _get_value(
+        self, address: Optional[str], contract_address: Optional[str], block: int
+    ) -> int:
+        key = (address, contract_address, block)
+        if key not in self._cache:
+            self._cache[key] = int(await self._fetch_value(address, contract_address, block))
+        return self._cache[key]
+
+    async def _fetch_value(
+        self, address: Optional[str], contract_address: Optional[str], block: int
+    ) -> str:
+        if contract_address is None:
+            return await self._client.account.account_balance_by_blockno(address, block)
+        if address is None:
+            return await self._client.token.total_supply_by_blockno(contract_address, block)
+        return await self._client.token.account_balance_by_blockno(address, contract_address, block)
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+from aioetherscan.exceptions import EtherscanClientProxyError
+from aioetherscan.modules.extra.abi import (
+    compile_decoder,
+    compile_encoder,
+    compile_sequence,
+    compile_sequence_encoder,
+    function_selector,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+MULTICALL3_ADDRESS = '0xca11bde05977b3631167028862be2a173976ca11'
+
+_AGGREGATE3 = dict(
+    name='aggregate3',
+    inputs=[
+        dict(
+            type='tuple[]',
+            components=[dict(type='address'), dict(type='bool'), dict(type='bytes')],
+        )
+    ],
+    outputs=[dict(type='tuple[]', components=[dict(type='bool'), dict(type='bytes')])],
+)
+_WORD = 32
+
+
+class Call(NamedTuple):
+    to: str
+    data: str
+
+
+class CallResult(NamedTuple):
+    success: bool
+    data: str
+
+
+class Multicall:
+    """Batches ``eth_call`` requests into Multicall3 ``aggregate3`` calls sent via
+    ``Proxy.call`` in POST bodies, so batches are not bound by the URL length.
+
+    Calls are packed into batches of at most ``max_calls`` calls and ``max_size`` bytes of
+    encoded calldata. The defaults fit 500 ``balanceOf`` calls of 224 bytes each, so e.g.
+    balances of 5,000 holders take 10 requests. Every call is allowed to fail, so a
+    reverting call gets an unsuccessful result instead of reverting its batch. A batch
+    rejected as a whole, e.g. running out of gas, is split in halves and retried.
+    """
+
+    _DEFAULT_MAX_CALLS: int = 500
+    _DEFAULT_MAX_SIZE: int = 150_000
+
+    def __init__(
+        self,
+        client: 'Client',
+        address: str = MULTICALL3_ADDRESS,
+        max_calls: int = _DEFAULT_MAX_CALLS,
+        max_size: int = _DEFAULT_MAX_SIZE,
+    ) -> None:
+        self._client = client
+        self._address = address
+        self._max_calls = max_calls
+        self._max_size = max_size
+
+        self._selector = function_selector(_AGGREGATE3)
+        self._encoder = compile_sequence_encoder([compile_encoder(_AGGREGATE3['inputs'][0])])
+        self._decoder = compile_sequence([compile_decoder(_AGGREGATE3['outputs'][0])])
+
+        self._logger = logging.getLogger(__name__)
+
+    async def call(
+        self, calls: Iterable[tuple[str, str]], tag: Union[int, str] = 'latest'
+    ) -> list[CallResult]:
+        """Executes ``(to, data)`` calls, returns their results in the same order."""
+        batches = list(self._pack([Call(to, data) for to, data in calls]))
+        results = await asyncio.gather(*(self._aggregate(batch, tag) for batch in batches))
+        return [result for batch_results in results for result in batch_results]
+
+    async def call_function(
+        self,
+        item: dict[str, Any],
+        calls: Iterable[tuple[str, Iterable[Any]]],
+        tag: Union[int, str] = 'latest',
+    ) -> list[Optional[tuple]]:
+        """Calls ABI function ``item`` with ``(to, args)`` pairs, returns decoded outputs
+        tuples or None for failed calls."""
+        selector = function_selector(item)
+        encoder = compile_sequence_encoder([compile_encoder(p) for p in item['inputs']])
+        decoder = compile_sequence([compile_decoder(p) for p in item.get('outputs', [])])
+
+        results = await self.call(
+            ((to, selector + encoder.encode(args).hex()) for to, args in calls), tag
+        )
+        return [
+            decoder.decode(bytes.fromhex(data[2:]), 0) if success and data != '0x' else None
+            for success, data in results
+        ]
+
+    def _pack(self, calls: list[Call]) -> Iterator[list[Call]]:
+        batch, size = [], 4 + 2 * _WORD
+        for call in calls:
+            call_size = self._get_call_size(call)
+            if batch and (len(batch) >= self._max_calls or size + call_size > self._max_size):
+                yield batch
+                batch, size = [], 4 + 2 * _WORD
+            batch.append(call)
+            size += call_size
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _get_call_size(call: Call) -> int:
+        """Returns size of the encoded ``(target, allowFailure, callData)`` with its head."""
+        data_size = (len(call.data) - 2) // 2
+        return 5 * _WORD + -(-data_size // _WORD) * _WORD
+
+    async def _aggregate(self, batch: list[Call], tag: Union[int, str]) -> list[CallResult]:
+        data = self._selector + self._encoder.encode([[(c.to, True, c.data) for c in batch]]).hex()
+        try:
+            response = await self._client.proxy.call(self._address, data, tag, post=True)
+        except EtherscanClientProxyError as e:
+            if len(batch) == 1:
+                self._logger.info(f'Call to {batch[0].to} failed: {e}')
+                return [CallResult(False, '0x')]
+            self._logger.info(f'Batch of {len(batch)} calls failed, splitting: {e}')
+            middle = len(batch) // 2
+            halves = await asyncio.gather(
+                self._aggregate(batch[:middle], tag), self._aggregate(batch[middle:], tag)
+            )
+            return halves[0] + halves[1]
+
+        (results,) = self._decoder.decode(bytes.fromhex(response[2:]), 0)
+        if len(results) != len(batch):
+            raise ValueError(
+                f'Unexpected aggregate3 response with {len(results)} results for '
+                f'{len(batch)} calls, is Multicall3 deployed at {self._address}?'
+            )
+        return [CallResult(success, data) for success, data in results]
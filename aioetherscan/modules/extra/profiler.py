@@ -0,0 +1,148 @@
+import asyncio
+import sys
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from aioetherscan.exceptions import EtherscanClientApiError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+
+class Bucket(NamedTuple):
+    start_block: int
+    end_block: int
+    rows: int
+    exact: bool  # False when rows is a lower bound
+
+    @property
+    def density(self) -> float:
+        return self.rows / (self.end_block - self.start_block + 1)
+
+
+class ActivityProfile(NamedTuple):
+    first_block: Optional[int]
+    last_block: Optional[int]
+    buckets: list[Bucket]
+
+    @property
+    def max_density(self) -> float:
+        return max((b.density for b in self.buckets), default=0.0)
+
+    def generator_params(self, target_rows: int = 5_000) -> dict[str, Any]:
+        """Returns blocks range and window size for generators."""
+        if self.first_block is None:
+            raise ValueError('Address has no activity.')
+
+        params = dict(start_block=self.first_block, end_block=self.last_block)
+        if self.max_density:
+            params['blocks_limit'] = max(1, int(target_rows / self.max_density))
+        return params
+
+
+class ActivityProfiler:
+    """Finds address activity bounds and density with a few ``offset=1`` probes.
+
+    Empty block ranges are pruned with one call each, so active buckets are found by
+    bisection in O(log N) calls, then rows of every active bucket are counted up to
+    ``_SAMPLE_SIZE``.
+    """
+
+    _KINDS: tuple[str, ...] = ('normal', 'internal', 'erc20', 'erc721', 'erc1155')
+    _BUCKETS: int = 32
+    _SAMPLE_SIZE: int = 1_000
+
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    async def profile(
+        self,
+        address: str,
+        kind: str = 'normal',
+        start_block: int = 0,
+        end_block: int = sys.maxsize,
+        bucket_size: Optional[int] = None,
+    ) -> ActivityProfile:
+        first_block, last_block = await asyncio.gather(
+            self._probe_block(address, kind, start_block, end_block, 'asc'),
+            self._probe_block(address, kind, start_block, end_block, 'desc'),
+        )
+        if first_block is None:
+            return ActivityProfile(None, None, [])
+
+        bucket_size = bucket_size or -(-(last_block - first_block + 1) // self._BUCKETS)
+        buckets = await self._get_buckets(address, kind, first_block, last_block, bucket_size)
+        return ActivityProfile(first_block, last_block, buckets)
+
+    async def profile_all(
+        self,
+        address: str,
+        kinds: tuple[str, ...] = _KINDS,
+        start_block: int = 0,
+        end_block: int = sys.maxsize,
+    ) -> dict[str, ActivityProfile]:
+        profiles = await asyncio.gather(
+            *(self.profile(address, kind, start_block, end_block) for kind in kinds)
+        )
+        return dict(zip(kinds, profiles))
+
+    async def _get_buckets(
+        self, address: str, kind: str, start_block: int, end_block: int, bucket_size: int
+    ) -> list[Bucket]:
+        if end_block - start_block + 1 <= bucket_size:
+            rows = await self._probe(
+                address, kind, start_block, end_block, 'asc', self._SAMPLE_SIZE
+            )
+            if not rows:
+                return []
+            return [Bucket(start_block, end_block, len(rows), len(rows) < self._SAMPLE_SIZE)]
+
+        first_block = await self._probe_block(address, kind, start_block, end_block, 'asc')
+        if first_block is None:
+            return []
+
+        # empty prefix is skipped, the rest is split by bucket boundaries
+        bucket_start = start_block + (first_block - start_block) // bucket_size * bucket_size
+        buckets_count = -(-(end_block - bucket_start + 1) // bucket_size)
+        middle = bucket_start + (buckets_count + 1) // 2 * bucket_size
+        if middle > end_block:
+            return await self._get_buckets(address, kind, bucket_start, end_block, bucket_size)
+
+        halves = await asyncio.gather(
+            self._get_buckets(address, kind, bucket_start, middle - 1, bucket_size),
+            self._get_buckets(address, kind, middle, end_block, bucket_size),
+        )
+        return [bucket for half in halves for bucket in half]
+
+    async def _probe_block(
+        self, address: str, kind: str, start_block: int, end_block: int, sort: str
+    ) -> Optional[int]:
+        rows = await self._probe(address, kind, start_block, end_block, sort, 1)
+        return int(rows[0]['blockNumber']) if rows else None
+
+    async def _probe(
+        self, address: str, kind: str, start_block: int, end_block: int, sort: str, offset: int
+    ) -> list[dict]:
+        try:
+            return await self._get_api_method(kind)(
+                address=address,
+                start_block=start_block,
+                end_block=end_block,
+                sort=sort,
+                page=1,
+                offset=offset,
+            )
+        except EtherscanClientApiError as e:
+            if e.message == 'No transactions found':
+                return []
+            raise
+
+    def _get_api_method(self, kind: str) -> Callable:
+        if kind == 'normal':
+            return self._client.account.normal_txs
+        if kind == 'internal':
+            return self._client.account.internal_txs
+        if kind in self._KINDS:
+            return lambda **params: self._client.account.token_transfers(
+                token_standard=kind, **params
+            )
+        raise ValueError(f'Invalid kind {kind!r}, only {self._KINDS} are supported.')
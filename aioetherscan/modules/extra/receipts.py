@@ -0,0 +1,130 @@
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, Optional
+
+from aioetherscan.modules.extra.generators.checkpoint import CheckpointStore, State
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+from aioetherscan.modules.proxy import Proxy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Receipt = dict[str, Any]
+
+
+class ReceiptFetcher:
+    """Fetches receipts of many transactions with bounded concurrency.
+
+    Receipts at least ``confirmations`` deep are final, so they are cached for good, in
+    ``store`` too when it is passed. The store is read and written in worker threads,
+    receipts are saved in batches. Pending transactions get None receipts.
+    """
+
+    _DEFAULT_CONCURRENCY: int = 8
+    _DEFAULT_CONFIRMATIONS: int = 64
+    _FLUSH_SIZE: int = 100
+    _KEY: str = Proxy.endpoints['tx_receipt'].key
+
+    def __init__(
+        self,
+        client: 'Client',
+        store: Optional[CheckpointStore] = None,
+        confirmations: int = _DEFAULT_CONFIRMATIONS,
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._confirmations = confirmations
+        self._receipts: dict[str, Receipt] = {}
+        self._unsaved: dict[str, State] = {}
+
+    async def fetch(
+        self,
+        txhashes: Iterable[str],
+        ordered: bool = True,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, Optional[Receipt]]]:
+        """Yields ``(txhash, receipt)`` pairs in input order or, unless ``ordered``, as
+        they complete. Repeated hashes are yielded once."""
+        if concurrency < 1:
+            raise ValueError(f'Invalid concurrency {concurrency!r}, must be positive.')
+
+        txhashes = iter(dict.fromkeys(h.lower() for h in txhashes))
+        finalized_block = await self._get_finalized_block()
+        tasks = (self._start(txhash, finalized_block) for txhash in txhashes)
+        results = (
+            self._ordered(tasks, concurrency) if ordered else self._completed(tasks, concurrency)
+        )
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()  # cancels the pending requests on early exit
+            await self._flush()
+
+    @staticmethod
+    async def _ordered(
+        tasks: Iterator['asyncio.Future'], concurrency: int
+    ) -> AsyncIterator[tuple[str, Optional[Receipt]]]:
+        pending = deque(islice(tasks, concurrency))
+        try:
+            while pending:
+                result = await pending.popleft()
+                pending.extend(islice(tasks, 1))
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _completed(
+        tasks: Iterator['asyncio.Future'], concurrency: int
+    ) -> AsyncIterator[tuple[str, Optional[Receipt]]]:
+        pending = set(islice(tasks, concurrency))
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.update(islice(tasks, len(done)))
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _start(self, txhash: str, finalized_block: int) -> 'asyncio.Future':
+        return asyncio.ensure_future(self._get_receipt(txhash, finalized_block))
+
+    async def _get_receipt(
+        self, txhash: str, finalized_block: int
+    ) -> tuple[str, Optional[Receipt]]:
+        receipt = await self._load(txhash)
+        if receipt is None:
+            receipt = await self._client.proxy.tx_receipt(txhash)
+            if receipt is not None and hex_to_int(receipt['blockNumber']) <= finalized_block:
+                await self._save(txhash, receipt)
+        return txhash, receipt
+
+    async def _get_finalized_block(self) -> int:
+        return hex_to_int(await self._client.proxy.block_number()) - self._confirmations
+
+    async def _load(self, txhash: str) -> Optional[Receipt]:
+        if txhash not in self._receipts and self._store is not None:
+            state = await asyncio.to_thread(self._store.load, self._get_key(txhash))
+            if state is not None:
+                self._receipts[txhash] = state['receipt']
+        return self._receipts.get(txhash)
+
+    async def _save(self, txhash: str, receipt: Receipt) -> None:
+        self._receipts[txhash] = receipt
+        if self._store is not None:
+            self._unsaved[self._get_key(txhash)] = dict(receipt=receipt)
+            if len(self._unsaved) >= self._FLUSH_SIZE:
+                await self._flush()
+
+    async def _flush(self) -> None:
+        if self._unsaved:
+            states, self._unsaved = self._unsaved, {}
+            await asyncio.to_thread(self._store.save_many, states)
+
+    def _get_key(self, txhash: str) -> str:
+        return f'{self._KEY}:{txhash}'
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, NamedTuple, Optional
+
+from aioetherscan.exceptions import EtherscanClientError
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+
+class SubscriptionMetrics(NamedTuple):
+    staleness: Optional[float]  # seconds since the last successful refresh
+    latency: Optional[float]  # duration of the last successful refresh in seconds
+    refreshes: int
+    errors: int
+
+
+class Subscription:
+    """Refreshes a value every ``interval`` seconds in one background task shared by
+    any number of consumers.
+
+    Consumers read the latest value with ``get()`` or iterate over its changes. The poller
+    starts on the first read and runs until ``close()`` or an unexpected error, which is
+    raised to the consumers then.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[Any]], interval: float) -> None:
+        self._fetch = fetch
+        self._interval = interval
+
+        self._value: Any = None
+        self._version = 0
+        self._error: Optional[Exception] = None
+        self._failure: Optional[Exception] = None  # stopped the poller, raised to consumers
+        self._changed: Optional[asyncio.Event] = None  # created in the running loop
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._refreshed_at: Optional[float] = None
+        self._latency: Optional[float] = None
+        self._refreshes = self._errors = 0
+
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def value(self) -> Any:
+        """The latest value without waiting, None before the first refresh."""
+        return self._value
+
+    @property
+    def metrics(self) -> SubscriptionMetrics:
+        staleness = None
+        if self._refreshed_at is not None:
+            staleness = time.monotonic() - self._refreshed_at
+        return SubscriptionMetrics(staleness, self._latency, self._refreshes, self._errors)
+
+    async def get(self) -> Any:
+        """Returns the latest value, waiting for the first refresh if needed."""
+        self._start()
+        while not self._version:
+            await self._changed.wait()
+            if self._closed:
+                raise RuntimeError('Subscription is closed.')
+            if self._failure is not None:
+                raise self._failure
+            if not self._version and self._error is not None:
+                raise self._error
+        return self._value
+
+    async def changes(self) -> AsyncIterator[Any]:
+        """Yields the current value and then every new one till the subscription is closed."""
+        self._start()
+        version = 0
+        while not self._closed:
+            if self._failure is not None:
+                raise self._failure
+            if self._version == version:
+                await self._changed.wait()
+                continue
+            version = self._version
+            yield self._value
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.changes()
+
+    async def close(self) -> None:
+        self._closed = True
+        self._notify()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def _start(self) -> None:
+        if self._closed:
+            raise RuntimeError('Subscription is closed.')
+        if self._failure is not None:
+            raise self._failure
+        if self._task is None:
+            self._changed = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._refresh()
+                await asyncio.sleep(self._interval)
+        except Exception as e:
+            self._logger.error(f'Refreshing stopped: {e!r}')
+            self._failure = e
+            self._notify()
+
+    async def _refresh(self) -> None:
+        from aiohttp import ClientError  # imported on the first request, see network.py
+
+        started_at = time.monotonic()
+        try:
+            value = await self._fetch()
+        except (EtherscanClientError, ClientError, OSError, asyncio.TimeoutError) as e:
+            self._errors += 1
+            self._error = e
+            self._logger.info(f'Refresh failed: {e!r}')
+            self._notify()
+            return
+
+        self._refreshed_at = time.monotonic()
+        self._latency = self._refreshed_at - started_at
+        self._refreshes += 1
+        self._error = None
+        if not self._version or value != self._value:
+            self._value = value
+            self._version += 1
+            self._notify()
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+
+class Subscriptions:
+    """Shared subscriptions to the gas oracle and the chain head."""
+
+    _DEFAULT_INTERVAL: float = 5.0
+
+    def __init__(self, client: 'Client', interval: float = _DEFAULT_INTERVAL) -> None:
+        self._client = client
+
+        self.gas_oracle = Subscription(lambda: self._client.gas_tracker.gas_oracle(), interval)
+        self.gas_price = Subscription(self._get_gas_price, interval)
+        self.block_number = Subscription(self._get_block_number, interval)
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            self.gas_oracle.close(), self.gas_price.close(), self.block_number.close()
+        )
+
+    async def _get_gas_price(self) -> int:
+        return hex_to_int(await self._client.proxy.gas_price())
+
+    async def _get_block_number(self) -> int:
+        return hex_to_int(await self._client.proxy.block_number())
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+
+from aioetherscan.exceptions import EtherscanClientError
+from aioetherscan.modules.extra.generators.helpers import hex_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioetherscan import Client
+
+Receipt = dict[str, Any]
+
+
+class _PendingTx:
+    def __init__(self) -> None:
+        self.checked = False
+        self.mined_block: Optional[int] = None
+        self.first_checked_head: Optional[int] = None
+        self.waiters: list[tuple[int, 'asyncio.Future[Receipt]']] = []
+
+
+class ConfirmationWatcher:
+    """Waits for confirmations of many transactions with one poller.
+
+    The poller requests ``eth_blockNumber`` every ``poll_interval`` seconds and every new
+    block once, looking for pending hashes among its transactions. A receipt is requested
+    when a tx is watched, to find txs mined before, and when its confirmations are reached,
+    to make sure it has not been reorganized out. So requests count grows with the blocks
+    rate, not with the pending txs count. The poller stops when nothing is watched.
+    """
+
+    _DEFAULT_POLL_INTERVAL: float = 2.0
+
+    def __init__(
+        self,
+        client: 'Client',
+        confirmations: int = 1,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self._client = client
+        self._confirmations = confirmations
+        self._poll_interval = poll_interval
+
+        self._pending: dict[str, _PendingTx] = {}
+        self._head: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._logger = logging.getLogger(__name__)
+
+    def watch(self, txhash: str, confirmations: Optional[int] = None) -> 'asyncio.Future[Receipt]':
+        """Returns a future resolved with the tx receipt once it has ``confirmations``."""
+        confirmations = self._confirmations if confirmations is None else confirmations
+        if confirmations < 1:
+            raise ValueError(f'Invalid confirmations {confirmations!r}, must be positive.')
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(txhash.lower(), _PendingTx()).waiters.append(
+            (confirmations, future)
+        )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def wait(
+        self, txhash: str, confirmations: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Receipt:
+        return await asyncio.wait_for(self.watch(txhash, confirmations), timeout)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for pending_tx in self._pending.values():
+            for _, future in pending_tx.waiters:
+                future.cancel()
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        from aiohttp import ClientError  # imported on the first request, see network.py
+
+        try:
+            while self._drop_cancelled():
+                try:
+                    await self._poll()
+                except (EtherscanClientError, ClientError, OSError, asyncio.TimeoutError) as e:
+                    self._logger.info(f'Polling failed, retrying: {e!r}')
+                await asyncio.sleep(self._poll_interval)
+        except Exception as e:
+            self._logger.error(f'Polling stopped: {e!r}')
+            self._fail(e)
+        finally:
+            self._head = None
+
+    async def _poll(self) -> None:
+        head = hex_to_int(await self._client.proxy.block_number())
+        if self._head is not None:
+            for number in range(self._head + 1, head + 1):
+                if not await self._scan_block(number):
+                    head = number - 1  # not served yet by the node behind the API
+                    break
+        self._head = head
+
+        to_check = [
+            txhash
+            for txhash, pending_tx in self._pending.items()
+            if not pending_tx.checked
+            or pending_tx.mined_block is not None
+            and any(head - pending_tx.mined_block + 1 >= c for c, _ in pending_tx.waiters)
+        ]
+        await asyncio.gather(*(self._check_receipt(txhash, head) for txhash in to_check))
+
+    async def _scan_block(self, number: int) -> bool:
+        block = await self._client.proxy.block_by_number(full=False, tag=number)
+        if block is None:
+            return False
+        for txhash in block['transactions']:
+            pending_tx = self._pending.get(txhash.lower())
+            if pending_tx is not None:
+                pending_tx.mined_block = number
+        return True
+
+    async def _check_receipt(self, txhash: str, head: int) -> None:
+        """Updates the tx mined block, resolves waiters confirmed at the head."""
+        receipt = await self._client.proxy.tx_receipt(txhash)
+        pending_tx = self._pending.get(txhash)
+        if pending_tx is None:
+            return
+
+        if receipt is None and pending_tx.mined_block is not None:
+            # found in a scanned block but the node serving the receipt lags or the block has
+            # been reorganized, its block won't be scanned again so the receipt is retried
+            pending_tx.checked = False
+            return
+
+        if receipt is None:
+            # mined in a block scanned before the tx was watched if the node serving the
+            # receipt lags, so it is retried till the head moves past the one first checked at
+            if pending_tx.first_checked_head is None:
+                pending_tx.first_checked_head = head
+            if head <= pending_tx.first_checked_head:
+                pending_tx.checked = False
+                return
+
+        pending_tx.checked = True
+        pending_tx.mined_block = hex_to_int(receipt['blockNumber']) if receipt else None
+        if pending_tx.mined_block is None:
+            return
+
+        depth = head - pending_tx.mined_block + 1
+        waiters = []
+        for confirmations, future in pending_tx.waiters:
+            if depth >= confirmations:
+                if not future.done():
+                    future.set_result(receipt)
+            else:
+                waiters.append((confirmations, future))
+        pending_tx.waiters = waiters
+        if not waiters:
+            del self._pending[txhash]
+
+    def _fail(self, exc: Exception) -> None:
+        """Passes an error which stopped the poller to the waiters of all txs."""
+        for pending_tx in self._pending.values():
+            for _, future in pending_tx.waiters:
+                if not future.done():
+                    future.set_exception(exc)
+        self._pending.clear()
+
+    def _drop_cancelled(self) -> bool:
+        """Forgets txs whose waiters have been cancelled, returns whether any are left."""
+        for txhash, pending_tx in list(self._pending.items()):
+            pending_tx.waiters = [(c, f) for c, f in pending_tx.waiters if not f.done()]
+            if not pending_tx.waiters:
+                del self._pending[txhash]
+        return bool(self._pending)
@@ -1,8 +1,8 @@
 from datetime import date
 from typing import Optional
 
-from aioetherscan.common import check_sort_direction
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.common import DAILY_STATS_PARAMS
+from aioetherscan.modules.base import BaseModule, endpoint
 
 
 class GasTracker(BaseModule):
@@ -11,50 +11,30 @@ class GasTracker(BaseModule):
     https://docs.etherscan.io/api-endpoints/gas-tracker
     """
 
-    @property
-    def _module(self) -> str:
-        return 'gastracker'
+    _module = 'gastracker'
 
+    @endpoint('gasestimate', dict(gas_price='gasprice'))
     async def estimation_of_confirmation_time(self, gas_price: int) -> str:
         """Get Estimation of Confirmation Time"""
-        return await self._get(action='gasestimate', gasprice=gas_price)
 
+    @endpoint('gasoracle')
     async def gas_oracle(self) -> dict:
         """Get Gas Oracle"""
-        return await self._get(action='gasoracle')
 
+    @endpoint('dailyavggaslimit', DAILY_STATS_PARAMS, module='stats')
     async def daily_average_gas_limit(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> list[dict]:
         """Get Daily Average Gas Limit"""
-        return await self._get(
-            module='stats',
-            action='dailyavggaslimit',
-            startdate=start_date.isoformat(),
-            enddate=end_date.isoformat(),
-            sort=check_sort_direction(sort),
-        )
 
+    @endpoint('dailygasused', DAILY_STATS_PARAMS, module='stats')
     async def daily_total_gas_used(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Ethereum Daily Total Gas Used"""
-        return await self._get(
-            module='stats',
-            action='dailygasused',
-            startdate=start_date.isoformat(),
-            enddate=end_date.isoformat(),
-            sort=check_sort_direction(sort),
-        )
 
+    @endpoint('dailyavggasprice', DAILY_STATS_PARAMS, module='stats')
     async def daily_average_gas_price(
         self, start_date: date, end_date: date, sort: Optional[str] = None
     ) -> dict:
         """Get Daily Average Gas Price"""
-        return await self._get(
-            module='stats',
-            action='dailyavggasprice',
-            startdate=start_date.isoformat(),
-            enddate=end_date.isoformat(),
-            sort=check_sort_direction(sort),
-        )
@@ -1,6 +1,6 @@
 from typing import Optional, Literal
 
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.modules.base import BaseModule, endpoint
 
 TopicNumber = Literal[0, 1, 2, 3]
 TopicOperator = Literal['and', 'or']
@@ -15,10 +15,14 @@ class Logs(BaseModule):
     https://docs.etherscan.io/api-endpoints/logs
     """
 
-    @property
-    def _module(self) -> str:
-        return 'logs'
+    _module = 'logs'
 
+    @endpoint(
+        'getLogs',
+        dict(topics=None, operators=None, from_block='fromBlock', to_block='toBlock'),
+        extra='_fill_topics',
+        any_of=('address', 'topics'),
+    )
     async def get_logs(
         self,
         address: Optional[str] = None,
@@ -31,19 +35,6 @@ class Logs(BaseModule):
     ) -> list[dict]:
         """Get Event Logs by address and/or topics"""
 
-        if address is None and topics is None:
-            raise ValueError('Either address or topics must be passed.')
-
-        return await self._get(
-            action='getLogs',
-            fromBlock=from_block,
-            toBlock=to_block,
-            address=address,
-            page=page,
-            offset=offset,
-            **self._fill_topics(topics, operators),
-        )
-
     def _fill_topics(
         self, topics: Optional[Topics], operators: Optional[TopicOperators]
     ) -> dict[str, str]:
@@ -51,7 +42,7 @@ class Logs(BaseModule):
             return {}
 
         if len(topics) == 1:
-            topic_number, topic = topics.popitem()
+            ((topic_number, topic),) = topics.items()
             return {f'topic{topic_number}': topic}
 
         if not operators:
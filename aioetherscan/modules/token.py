@@ -1,5 +1,7 @@
 from aioetherscan.common import check_tag
-from aioetherscan.modules.base import BaseModule
+from aioetherscan.modules.base import BaseModule, endpoint
+
+_CONTRACT_PARAMS = dict(contract_address='contractaddress')
 
 
 class Token(BaseModule):
@@ -8,51 +10,29 @@ class Token(BaseModule):
     https://docs.etherscan.io/api-endpoints/tokens
     """
 
-    @property
-    def _module(self) -> str:
-        return 'token'
+    _module = 'token'
 
+    @endpoint('tokensupply', _CONTRACT_PARAMS, module='stats')
     async def total_supply(self, contract_address: str) -> str:
         """Get ERC20-Token TotalSupply by ContractAddress"""
-        return await self._get(
-            module='stats',
-            action='tokensupply',
-            contractaddress=contract_address,
-        )
 
+    @endpoint('tokenbalance', dict(_CONTRACT_PARAMS, tag=check_tag), module='account')
     async def account_balance(
         self, address: str, contract_address: str, tag: str = 'latest'
     ) -> str:
         """Get ERC20-Token Account Balance for TokenContractAddress"""
-        return await self._get(
-            module='account',
-            action='tokenbalance',
-            address=address,
-            contractaddress=contract_address,
-            tag=check_tag(tag),
-        )
 
+    @endpoint('tokensupplyhistory', _CONTRACT_PARAMS, module='stats')
     async def total_supply_by_blockno(self, contract_address: str, blockno: int) -> str:
         """Get Historical ERC20-Token TotalSupply by ContractAddress & BlockNo"""
-        return await self._get(
-            module='stats',
-            action='tokensupplyhistory',
-            contractaddress=contract_address,
-            blockno=blockno,
-        )
 
+    @endpoint('tokenbalancehistory', _CONTRACT_PARAMS, module='account')
     async def account_balance_by_blockno(
         self, address: str, contract_address: str, blockno: int
     ) -> str:
         """Get Historical ERC20-Token Account Balance for TokenContractAddress by BlockNo"""
-        return await self._get(
-            module='account',
-            action='tokenbalancehistory',
-            address=address,
-            contractaddress=contract_address,
-            blockno=blockno,
-        )
 
+    @endpoint('tokenholderlist', _CONTRACT_PARAMS)
     async def token_holder_list(
         self,
         contract_address: str,
@@ -60,20 +40,15 @@ class Token(BaseModule):
         offset: int = None,
     ) -> list[dict]:
         """Get Token Holder list by Contract Address"""
-        return await self._get(
-            action='tokenholderlist', contractaddress=contract_address, page=page, offset=offset
-        )
 
+    @endpoint('tokeninfo', _CONTRACT_PARAMS)
     async def token_info(
         self,
         contract_address: str = None,
     ) -> list[dict]:
         """Get Token Info by ContractAddress"""
-        return await self._get(
-            action='tokeninfo',
-            contractaddress=contract_address,
-        )
 
+    @endpoint('addresstokenbalance', module='account')
     async def token_holding_erc20(
         self,
         address: str,
@@ -81,14 +56,8 @@ class Token(BaseModule):
         offset: int = None,
     ) -> list[dict]:
         """Get Address ERC20 Token Holding"""
-        return await self._get(
-            module='account',
-            action='addresstokenbalance',
-            address=address,
-            page=page,
-            offset=offset,
-        )
 
+    @endpoint('addresstokennftbalance', module='account')
     async def token_holding_erc721(
         self,
         address: str,
@@ -96,14 +65,8 @@ class Token(BaseModule):
         offset: int = None,
     ) -> list[dict]:
         """Get Address ERC721 Token Holding"""
-        return await self._get(
-            module='account',
-            action='addresstokennftbalance',
-            address=address,
-            page=page,
-            offset=offset,
-        )
 
+    @endpoint('addresstokennftinventory', _CONTRACT_PARAMS, module='account')
     async def token_inventory(
         self,
         address: str,
@@ -112,11 +75,3 @@ class Token(BaseModule):
         offset: int = None,
     ) -> list[dict]:
         """Get Address ERC721 Token Inventory By Contract Address"""
-        return await self._get(
-            module='account',
-            action='addresstokennftinventory',
-            address=address,
-            contractaddress=contract_address,
-            page=page,
-            offset=offset,
-        )
@@ -1,14 +1,7 @@
 import asyncio
 import logging
 from asyncio import AbstractEventLoop
-from typing import Union, AsyncContextManager, Optional
-
-import aiohttp
-from aiohttp import ClientTimeout
-from aiohttp.client import ClientSession
-from aiohttp.hdrs import METH_GET, METH_POST
-from aiohttp_retry import RetryOptionsBase, RetryClient
-from asyncio_throttle import Throttler
+from typing import TYPE_CHECKING, Union, AsyncContextManager, Optional
 
 from aioetherscan.exceptions import (
     EtherscanClientContentTypeError,
@@ -18,16 +11,25 @@ from aioetherscan.exceptions import (
 )
 from aioetherscan.url_builder import UrlBuilder
 
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientResponse, ClientSession, ClientTimeout
+    from aiohttp_retry import RetryClient, RetryOptionsBase
+
+# aiohttp takes most of the package import time, so it is imported on the first request,
+# asyncio_throttle only when no throttler is passed
+METH_GET = 'GET'
+METH_POST = 'POST'
+
 
 class Network:
     def __init__(
         self,
         url_builder: UrlBuilder,
         loop: Optional[AbstractEventLoop],
-        timeout: Optional[ClientTimeout],
+        timeout: Optional['ClientTimeout'],
         proxy: Optional[str],
         throttler: Optional[AsyncContextManager],
-        retry_options: Optional[RetryOptionsBase],
+        retry_options: Optional['RetryOptionsBase'],
     ) -> None:
         self._url_builder = url_builder
 
@@ -37,7 +39,11 @@ class Network:
         self._proxy = proxy
 
         # Defaulting to free API key rate limit
-        self._throttler = throttler or Throttler(rate_limit=5, period=1.0)
+        if throttler is None:
+            from asyncio_throttle import Throttler
+
+            throttler = Throttler(rate_limit=5, period=1.0)
+        self._throttler = throttler
 
         self._retry_client = None
         self._retry_options = retry_options
@@ -54,10 +60,14 @@ class Network:
     async def post(self, data: dict = None) -> Union[dict, list, str]:
         return await self._request(METH_POST, data=self._url_builder.filter_and_sign(data))
 
-    def _get_retry_client(self) -> RetryClient:
+    def _get_retry_client(self) -> 'RetryClient':
+        from aiohttp_retry import RetryClient
+
         return RetryClient(client_session=self._get_session(), retry_options=self._retry_options)
 
-    def _get_session(self) -> ClientSession:
+    def _get_session(self) -> 'ClientSession':
+        from aiohttp import ClientSession
+
         if self._timeout is not None:
             return ClientSession(loop=self._loop, timeout=self._timeout)
         return ClientSession(loop=self._loop)
@@ -77,7 +87,9 @@ class Network:
                 )
                 return await self._handle_response(response)
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> Union[dict, list, str]:
+    async def _handle_response(self, response: 'ClientResponse') -> Union[dict, list, str]:
+        import aiohttp
+
         try:
             response_json = await response.json()
         except aiohttp.ContentTypeError:
@@ -51,6 +51,11 @@ class UrlBuilder:
         _, currency = self._API_KINDS[self.api_kind]
         return currency
 
+    @property
+    def chain(self) -> str:
+        """Identifies the explorer in cache and checkpoint keys, e.g. ``eth:main``."""
+        return f'{self.api_kind}:{self._network}'
+
     def get_link(self, path: str) -> str:
         return urljoin(self.BASE_URL, path)
 
@@ -0,0 +1,49 @@
+"""Measures cold import time of the package and ``Client`` construction time.
+
+Every import is timed in a fresh interpreter: ``python -m benchmarks.startup [runs]``.
+"""
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+_IMPORT_SCRIPT = (
+    'import time; t = time.perf_counter(); import aioetherscan; print(time.perf_counter() - t)'
+)
+
+
+def measure_import(runs: int) -> list[float]:
+    return [
+        float(subprocess.check_output([sys.executable, '-c', _IMPORT_SCRIPT])) for _ in range(runs)
+    ]
+
+
+async def measure_construction(runs: int) -> list[float]:
+    from aioetherscan import Client
+
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        client = Client('api_key')
+        timings.append(time.perf_counter() - started_at)
+        await client.close()
+    return timings
+
+
+def report(title: str, timings: list[float]) -> None:
+    print(
+        f'{title}: median {statistics.median(timings) * 1e3:.3f} ms, '
+        f'min {min(timings) * 1e3:.3f} ms over {len(timings)} runs'
+    )
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    report('import aioetherscan', measure_import(runs))
+    report('Client()', asyncio.run(measure_construction(runs * 100)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from aioetherscan.modules.extra.generators.background import BackgroundIterator
+
+
+async def numbers(count: int, produced: list):
+    for i in range(count):
+        produced.append(i)
+        yield i
+
+
+async def test_iterate():
+    assert [i async for i in BackgroundIterator(numbers(5, []), 2)] == list(range(5))
+
+
+async def test_depth_bounded():
+    produced = []
+    iterator = BackgroundIterator(numbers(100, produced), 3)
+    await asyncio.sleep(0.01)
+
+    # queue is full plus one item waiting to be put
+    assert len(produced) == 4
+
+    await iterator.aclose()
+    assert iterator._task.cancelled()
+
+
+async def test_error_reraised():
+    async def failing():
+        yield 1
+        raise ValueError('error')
+
+    iterator = BackgroundIterator(failing(), 2)
+    assert await iterator.__anext__() == 1
+    with pytest.raises(ValueError):
+        await iterator.__anext__()
+
+
+async def test_aclose_closes_source():
+    closed = asyncio.Event()
+
+    async def source():
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    iterator = BackgroundIterator(source(), 1)
+    await iterator.__anext__()
+    await iterator.aclose()
+
+    assert closed.is_set()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from unittest.mock import AsyncMock, Mock
 
@@ -6,6 +7,7 @@ import pytest
 from aioetherscan.exceptions import EtherscanClientApiError
 from aioetherscan.modules.extra.generators.blocks_parser import BlocksParser
 from aioetherscan.modules.extra.generators.blocks_range import BlocksRange
+from aioetherscan.modules.extra.generators.checkpoint import Checkpoint, MemoryCheckpointStore
 
 
 @pytest.fixture()
@@ -138,3 +140,256 @@ async def test_txs_generator(blocks_parser, api_method):
     blocks_parser._blocks_range.limit.restore.assert_called_once()
 
     assert transfers == [{'blockNumber': 200, 'transfers': [{'value': 100}]}]
+
+
+async def test_windows_generator_covers_end_block(blocks_parser, api_method):
+    api_method.return_value = []
+
+    windows = [w async for w in blocks_parser.windows_generator()]
+
+    last_call = api_method.call_args_list[-1].kwargs
+    assert last_call['end_block'] == 200
+    assert windows[-1].next_block == 201
+    assert all(w.transfers == [] for w in windows)
+
+
+async def test_windows_generator_observes_density(blocks_parser, api_method):
+    api_method.return_value = [{'blockNumber': 105}]
+    blocks_parser._blocks_range.limit.observe = Mock()
+
+    async for _ in blocks_parser.windows_generator():
+        break
+
+    blocks_parser._blocks_range.limit.observe.assert_called_once_with(1, 6)
+
+
+@pytest.fixture
+def cursor_parser(api_method, request_params, start_block, end_block, blocks_limit):
+    return BlocksParser(
+        api_method, request_params, start_block, end_block, blocks_limit, 2, cursor=True
+    )
+
+
+async def test_fetch_blocks_range_cursor_complete(cursor_parser, api_method):
+    api_method.return_value = [{'blockNumber': 100}]
+    max_block, transfers = await cursor_parser._fetch_blocks_range(range(100, 109))
+
+    assert max_block == 109
+    assert transfers == [{'blockNumber': 100}]
+
+
+async def test_fetch_blocks_range_cursor_full_page(cursor_parser, api_method):
+    page = [{'blockNumber': 100}] * 6_000 + [{'blockNumber': 101}] * 4_000
+    tail = [{'blockNumber': 101, 'tail': True}] * 1_000
+    api_method.side_effect = [page, tail]
+
+    max_block, transfers = await cursor_parser._fetch_blocks_range(range(100, 109))
+
+    assert max_block == 101
+    assert transfers == page + tail
+    api_method.assert_called_with(
+        start_block=101, end_block=101, page=2, offset=4_000, **cursor_parser._request_params
+    )
+
+
+async def test_fetch_block_tail_whole_page_in_block(cursor_parser, api_method):
+    assert await cursor_parser._fetch_block_tail(100, BlocksParser._OFFSET) == []
+    api_method.assert_not_called()
+
+
+async def test_fetch_block_tail_refetch(cursor_parser, api_method):
+    fetched = 9_973  # prime, so only 1 row pages would fit
+    api_method.return_value = [{'i': i} for i in range(10_000)]
+
+    tail = await cursor_parser._fetch_block_tail(100, fetched)
+
+    assert tail == [{'i': i} for i in range(fetched, 10_000)]
+    api_method.assert_called_once_with(
+        start_block=100, end_block=100, page=1, offset=10_000, **cursor_parser._request_params
+    )
+
+
+@pytest.mark.parametrize(
+    'fetched, expected',
+    [(6_000, 3_000), (5_000, 5_000), (2_000, 2_000), (1, None), (9_973, None)],
+)
+def test_get_tail_offset(cursor_parser, fetched, expected):
+    assert cursor_parser._get_tail_offset(fetched) == expected
+
+
+async def test_fetch_block_pages(cursor_parser, api_method):
+    api_method.side_effect = [[{'i': 1}] * 2, [{'i': 2}] * 2, [{'i': 3}]]
+
+    transfers = await cursor_parser._fetch_block_pages(100, 2)
+
+    assert transfers == [{'i': 1}] * 2 + [{'i': 2}] * 2 + [{'i': 3}]
+    assert api_method.call_count == 3
+
+
+async def test_fetch_block_pages_no_txs(cursor_parser, api_method):
+    api_method.side_effect = [[{'i': 1}] * 2, EtherscanClientApiError('No transactions found', '')]
+    assert await cursor_parser._fetch_block_pages(100, 2) == [{'i': 1}] * 2
+
+
+async def test_fetch_block_pages_window_cap(cursor_parser, api_method):
+    api_method.return_value = [{'i': 1}] * 5_000
+    transfers = await cursor_parser._fetch_block_pages(100, 5_000)
+
+    assert len(transfers) == 10_000
+    assert api_method.call_count == 2
+
+
+async def test_fetch_window_single_block_error(cursor_parser, api_method):
+    api_method.side_effect = [EtherscanClientApiError('Timeout', ''), [{'blockNumber': 100}]]
+
+    assert await cursor_parser._fetch_window(range(100, 100)) == (100, [{'blockNumber': 100}])
+    api_method.assert_called_with(
+        start_block=100, end_block=100, page=1, offset=1_000, **cursor_parser._request_params
+    )
+
+
+async def test_fetch_window_error(cursor_parser, blocks_parser, api_method):
+    api_method.side_effect = EtherscanClientApiError('Timeout', '')
+
+    with pytest.raises(EtherscanClientApiError):
+        await cursor_parser._fetch_window(range(100, 101))
+    with pytest.raises(EtherscanClientApiError):
+        await blocks_parser._fetch_window(range(100, 100))
+
+
+async def test_txs_generator_cursor_huge_block(cursor_parser, api_method):
+    cursor_parser._blocks_range.end_block = 100
+    api_method.return_value = [{'blockNumber': 100}] * BlocksParser._OFFSET
+
+    transfers = [t async for t in cursor_parser.txs_generator()]
+
+    assert len(transfers) == BlocksParser._OFFSET
+    api_method.assert_called_once()
+
+
+async def test_txs_generator_saves_checkpoint(api_method, request_params):
+    store = MemoryCheckpointStore()
+    parser = BlocksParser(
+        api_method,
+        request_params,
+        100,
+        119,
+        10,
+        2,
+        cursor=True,
+        checkpoint=Checkpoint(store, 'key'),
+    )
+    api_method.side_effect = [[{'blockNumber': 105}], [{'blockNumber': 115}]]
+
+    generator = parser.txs_generator()
+    assert await generator.__anext__() == {'blockNumber': 105}
+    assert store.load('key') is None  # window is not fully consumed yet
+
+    assert await generator.__anext__() == {'blockNumber': 115}
+    assert store.load('key') == {'current_block': 110, 'total_txs': 1, 'limit': 10}
+
+    with pytest.raises(StopAsyncIteration):
+        await generator.__anext__()
+    assert store.load('key') == {'current_block': 120, 'total_txs': 2, 'limit': 10}
+
+
+async def test_txs_generator_enrich(api_method, request_params):
+    store = MemoryCheckpointStore()
+    parser = BlocksParser(
+        api_method,
+        request_params,
+        100,
+        119,
+        10,
+        2,
+        cursor=True,
+        checkpoint=Checkpoint(store, 'key'),
+    )
+    api_method.side_effect = [[{'blockNumber': 105}, {'blockNumber': 106}], [{'blockNumber': 115}]]
+    enrich = AsyncMock(side_effect=lambda transfers: [dict(t, method='m') for t in transfers])
+
+    generator = parser.txs_generator(enrich)
+    assert await generator.__anext__() == {'blockNumber': 105, 'method': 'm'}
+    assert store.load('key') is None  # enriched window is not consumed yet
+
+    assert await generator.__anext__() == {'blockNumber': 106, 'method': 'm'}
+    assert store.load('key') is None
+
+    assert await generator.__anext__() == {'blockNumber': 115, 'method': 'm'}
+    assert store.load('key')['current_block'] == 110
+    assert enrich.await_count == 2
+
+
+async def test_resume_from_checkpoint(api_method, request_params):
+    store = MemoryCheckpointStore()
+    store.save('key', {'current_block': 110, 'total_txs': 1, 'limit': 5})
+    parser = BlocksParser(
+        api_method,
+        request_params,
+        100,
+        119,
+        10,
+        2,
+        checkpoint=Checkpoint(store, 'key'),
+        resume=True,
+    )
+
+    assert parser._blocks_range.current_block == 110
+    assert parser._blocks_range.limit.get() == 5
+    assert parser._total_txs == 1
+
+
+async def test_resume_without_checkpoint(api_method, request_params):
+    parser = BlocksParser(
+        api_method,
+        request_params,
+        100,
+        119,
+        10,
+        2,
+        checkpoint=Checkpoint(MemoryCheckpointStore(), 'key'),
+        resume=True,
+    )
+    assert parser._blocks_range.current_block == 100
+
+
+async def test_txs_generator_prefetch(api_method, request_params):
+    parser = BlocksParser(api_method, request_params, 100, 149, 10, 2, cursor=True, prefetch=2)
+    api_method.return_value = [{'blockNumber': 100}]
+
+    generator = parser.txs_generator()
+    await generator.__anext__()
+    await asyncio.sleep(0.01)
+
+    # first window is consumed, two are buffered and one is waiting to be put
+    assert api_method.call_count == 4
+
+    assert len([t async for t in generator]) == 4
+    assert api_method.call_count == 5
+
+
+async def test_txs_generator_prefetch_cancelled_on_close(api_method, request_params):
+    parser = BlocksParser(api_method, request_params, 100, 10**6, 10, 2, cursor=True, prefetch=2)
+    api_method.return_value = [{'blockNumber': 100}]
+
+    generator = parser.txs_generator()
+    await generator.__anext__()
+    await generator.aclose()
+    calls = api_method.call_count
+    await asyncio.sleep(0.01)
+
+    assert api_method.call_count == calls
+
+
+async def test_txs_generator_open_range_sparse(api_method, request_params):
+    parser = BlocksParser(
+        api_method, request_params, 0, 20_000_000, 2048, 2, cursor=True, open_range=True
+    )
+    api_method.return_value = [{'blockNumber': 100}, {'blockNumber': 19_000_000}]
+
+    transfers = [t async for t in parser.txs_generator()]
+
+    assert len(transfers) == 2
+    api_method.assert_called_once_with(
+        start_block=0, end_block=20_000_000, page=1, offset=10_000, **request_params
+    )
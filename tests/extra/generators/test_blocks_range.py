@@ -1,8 +1,14 @@
+import sys
 from logging import Logger
 
 import pytest
 
-from aioetherscan.modules.extra.generators.blocks_range import Limit, BlocksRange
+from aioetherscan.modules.extra.generators.blocks_range import (
+    AdaptiveLimit,
+    BlocksRange,
+    Limit,
+    OpenRangeLimit,
+)
 
 INITIAL_LIMIT = 2**4
 BLOCKS_RANGE_DIVIDER = 2
@@ -73,3 +79,168 @@ def test_br_init(br: BlocksRange):
 
     assert isinstance(br.limit, Limit)
     assert isinstance(br._logger, Logger)
+
+
+def test_br_blocks_left(br: BlocksRange):
+    assert br.blocks_left == END_BLOCK - START_BLOCK + 1
+
+    br.current_block = END_BLOCK
+    assert br.blocks_left == 1
+
+    br.current_block = END_BLOCK + 100
+    assert br.current_block == END_BLOCK + 1
+    assert br.blocks_left == 0
+
+
+# ############################### adaptive limit ################################
+
+TARGET_ROWS = 100
+
+
+@pytest.fixture
+def adaptive_limit() -> AdaptiveLimit:
+    yield AdaptiveLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS)
+
+
+def test_limit_observe_noop(limit: Limit):
+    limit.observe(10_000, 1)
+    assert limit.get() == INITIAL_LIMIT
+
+
+def test_adaptive_limit_grows_on_sparse(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(0, INITIAL_LIMIT)
+    assert adaptive_limit.get() == INITIAL_LIMIT * AdaptiveLimit._MAX_GROWTH
+
+    adaptive_limit.observe(1, INITIAL_LIMIT)
+    assert adaptive_limit.get() == INITIAL_LIMIT * AdaptiveLimit._MAX_GROWTH**2
+
+
+def test_adaptive_limit_shrinks_on_dense(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(TARGET_ROWS * 2, 1)
+    assert adaptive_limit.density == TARGET_ROWS * 2
+    assert adaptive_limit.get() == 1
+
+
+def test_adaptive_limit_targets_rows(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(TARGET_ROWS // 2, INITIAL_LIMIT)
+    assert adaptive_limit.get() == INITIAL_LIMIT * 2
+
+    adaptive_limit.observe(TARGET_ROWS // 2, INITIAL_LIMIT * 2)
+    assert adaptive_limit.density == pytest.approx(TARGET_ROWS / 2 / INITIAL_LIMIT * 0.75)
+
+
+def test_adaptive_limit_restore_keeps_limit(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(TARGET_ROWS, INITIAL_LIMIT // 2)
+    adaptive_limit.restore()
+    assert adaptive_limit.get() == INITIAL_LIMIT // 2
+
+
+def test_adaptive_limit_reduce_scales_density(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(TARGET_ROWS, INITIAL_LIMIT)
+    adaptive_limit.reduce()
+
+    assert adaptive_limit.get() == INITIAL_LIMIT // BLOCKS_RANGE_DIVIDER
+    assert adaptive_limit.density == TARGET_ROWS / INITIAL_LIMIT * BLOCKS_RANGE_DIVIDER
+
+
+def test_adaptive_limit_initial_density():
+    limit = AdaptiveLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS, density=25.0)
+    assert limit.get() == TARGET_ROWS // 25
+
+
+def test_adaptive_limit_invalid_target_rows():
+    with pytest.raises(ValueError):
+        AdaptiveLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, 0)
+
+
+def test_br_adaptive_limit():
+    br = BlocksRange(START_BLOCK, END_BLOCK, INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS)
+    assert isinstance(br.limit, AdaptiveLimit)
+
+
+def test_limit_state(limit: Limit):
+    limit.reduce()
+    state = limit.get_state()
+    assert state == {'limit': INITIAL_LIMIT // BLOCKS_RANGE_DIVIDER}
+
+    new_limit = Limit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER)
+    new_limit.set_state(state)
+    assert new_limit.get() == INITIAL_LIMIT // BLOCKS_RANGE_DIVIDER
+
+
+def test_adaptive_limit_state(adaptive_limit: AdaptiveLimit):
+    adaptive_limit.observe(TARGET_ROWS, INITIAL_LIMIT * 2)
+    state = adaptive_limit.get_state()
+    assert state == {'limit': INITIAL_LIMIT * 2, 'density': TARGET_ROWS / INITIAL_LIMIT / 2}
+
+    new_limit = AdaptiveLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS)
+    new_limit.set_state(state)
+    assert new_limit.get_state() == state
+
+
+# ############################### open range limit ################################
+
+
+@pytest.fixture
+def open_limit() -> OpenRangeLimit:
+    yield OpenRangeLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS)
+
+
+def test_open_limit_init(open_limit: OpenRangeLimit):
+    assert open_limit.is_open
+    assert open_limit.get() == sys.maxsize
+    assert OpenRangeLimit(INITIAL_LIMIT, 2)._target_rows == OpenRangeLimit._DEFAULT_TARGET_ROWS
+
+
+def test_open_limit_stays_open_on_sparse(open_limit: OpenRangeLimit):
+    open_limit.observe(TARGET_ROWS, INITIAL_LIMIT * OpenRangeLimit._OPEN_GROWTH * 10)
+    assert open_limit.is_open
+
+
+def test_open_limit_switches_to_windows_on_dense(open_limit: OpenRangeLimit):
+    open_limit.observe(TARGET_ROWS * 10, INITIAL_LIMIT * 10)
+
+    assert not open_limit.is_open
+    assert open_limit.get() == INITIAL_LIMIT
+
+
+def test_open_limit_switches_back_to_open(open_limit: OpenRangeLimit):
+    open_limit.observe(TARGET_ROWS * 10, INITIAL_LIMIT * 10)
+    while not open_limit.is_open:
+        open_limit.observe(0, open_limit.get())
+
+    assert open_limit.get() == sys.maxsize
+
+
+def test_open_limit_reduce(open_limit: OpenRangeLimit):
+    open_limit.reduce()
+    assert not open_limit.is_open
+    assert open_limit.get() == INITIAL_LIMIT
+
+    open_limit.reduce()
+    assert open_limit.get() == INITIAL_LIMIT // BLOCKS_RANGE_DIVIDER
+
+
+def test_open_limit_initial_density():
+    dense = OpenRangeLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS, density=1.0)
+    assert not dense.is_open
+    assert dense.get() == TARGET_ROWS
+
+    sparse = OpenRangeLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS, density=1e-9)
+    assert sparse.is_open
+
+
+def test_open_limit_state(open_limit: OpenRangeLimit):
+    open_limit.reduce()
+    state = open_limit.get_state()
+    assert state['is_open'] is False
+
+    new_limit = OpenRangeLimit(INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, TARGET_ROWS)
+    new_limit.set_state(state)
+    assert not new_limit.is_open
+
+
+def test_br_open_range():
+    br = BlocksRange(START_BLOCK, END_BLOCK, INITIAL_LIMIT, BLOCKS_RANGE_DIVIDER, open_range=True)
+    assert isinstance(br.limit, OpenRangeLimit)
+    assert br.get_blocks_range() == range(START_BLOCK, END_BLOCK)
@@ -0,0 +1,57 @@
+import pytest
+
+from aioetherscan.modules.extra.generators.checkpoint import (
+    Checkpoint,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SqliteCheckpointStore,
+)
+
+
+@pytest.fixture(params=['memory', 'file', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        yield MemoryCheckpointStore()
+    elif request.param == 'file':
+        yield FileCheckpointStore(str(tmp_path / 'checkpoints.json'))
+    else:
+        store = SqliteCheckpointStore(str(tmp_path / 'checkpoints.db'))
+        yield store
+        store.close()
+
+
+def test_load_missing(store):
+    assert store.load('key') is None
+
+
+def test_save_load(store):
+    store.save('key1', {'current_block': 1})
+    store.save('key2', {'current_block': 2})
+    store.save('key1', {'current_block': 3})
+
+    assert store.load('key1') == {'current_block': 3}
+    assert store.load('key2') == {'current_block': 2}
+
+
+def test_save_many(store):
+    store.save('key1', {'current_block': 1})
+    store.save_many({'key1': {'current_block': 3}, 'key2': {'current_block': 2}})
+
+    assert store.load('key1') == {'current_block': 3}
+    assert store.load('key2') == {'current_block': 2}
+
+
+@pytest.mark.parametrize('store_class', [FileCheckpointStore, SqliteCheckpointStore])
+def test_persistent(tmp_path, store_class):
+    path = str(tmp_path / 'checkpoints')
+    store_class(path).save('key', {'current_block': 1})
+    assert store_class(path).load('key') == {'current_block': 1}
+
+
+def test_checkpoint(store):
+    checkpoint = Checkpoint(store, 'key')
+    assert checkpoint.load() is None
+
+    checkpoint.save({'current_block': 1})
+    assert store.load('key') == {'current_block': 1}
+    assert checkpoint.load() == {'current_block': 1}
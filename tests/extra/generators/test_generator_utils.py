@@ -1,10 +1,14 @@
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from datetime import datetime
+from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 
 import pytest
 
 from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.account import Account
 from aioetherscan.modules.extra.generators.blocks_parser import BlocksParser
+from aioetherscan.modules.extra.generators.checkpoint import Checkpoint, MemoryCheckpointStore
 from aioetherscan.modules.extra.generators.generator_utils import GeneratorUtils
+from aioetherscan.modules.extra.generators.sharded_parser import ShardedBlocksParser
 
 
 @pytest.fixture
@@ -42,6 +46,26 @@ def test_get_blocks_parser(generator_utils):
         blocks_limit_divider=2,
     )
     assert isinstance(blocks_parser, BlocksParser)
+    assert not isinstance(blocks_parser, ShardedBlocksParser)
+
+
+def test_get_blocks_parser_sharded(generator_utils):
+    blocks_parser = generator_utils._get_blocks_parser(
+        api_method=None,
+        request_params={'param': 'value'},
+        start_block=100,
+        end_block=200,
+        blocks_limit=1000,
+        blocks_limit_divider=2,
+        shards=4,
+    )
+    assert isinstance(blocks_parser, ShardedBlocksParser)
+    assert blocks_parser._shards == 4
+
+
+def test_get_blocks_parser_invalid_shards(generator_utils):
+    with pytest.raises(ValueError):
+        generator_utils._get_blocks_parser(None, {}, 100, 200, 1000, 2, shards=0)
 
 
 @pytest.mark.asyncio
@@ -64,10 +88,18 @@ async def test_token_transfers(generator_utils):
                 'self': generator_utils,
                 'contract_address': 'c1',
                 'address': 'a1',
+                'token_standard': 'erc20',
                 'start_block': 0,
                 'end_block': 20,
                 'blocks_limit': 2048,
                 'blocks_limit_divider': 2,
+                'shards': 1,
+                'target_rows': None,
+                'cursor': False,
+                'checkpoint': None,
+                'resume': False,
+                'prefetch': 0,
+                'open_range': False,
             },
         )
 
@@ -95,6 +127,14 @@ async def test_normal_txs(generator_utils):
                 'end_block': 20,
                 'blocks_limit': 2048,
                 'blocks_limit_divider': 2,
+                'shards': 1,
+                'target_rows': None,
+                'cursor': False,
+                'checkpoint': None,
+                'resume': False,
+                'prefetch': 0,
+                'open_range': False,
+                'decode_input': False,
             },
         )
 
@@ -125,6 +165,13 @@ async def test_internal_txs(generator_utils):
                 'end_block': 20,
                 'blocks_limit': 2048,
                 'blocks_limit_divider': 2,
+                'shards': 1,
+                'target_rows': None,
+                'cursor': False,
+                'checkpoint': None,
+                'resume': False,
+                'prefetch': 0,
+                'open_range': False,
             },
         )
 
@@ -169,7 +216,45 @@ async def test_parse_by_blocks(generator_utils):
         transfers.append(transfer)
     assert transfers == transfers_for_test()
 
-    blocks_parser_mock.assert_called_once_with(None, {'param': 'value'}, 100, 200, 1000, 2)
+    blocks_parser_mock.assert_called_once_with(
+        None, {'param': 'value'}, 100, 200, 1000, 2, 1, None, False, None, False, 0, False
+    )
+
+
+async def test_parse_by_blocks_datetime_bounds(generator_utils):
+    blocks_parser_mock = Mock()
+    blocks_parser_mock.return_value.txs_generator = MagicMock(side_effect=transfers_mock)
+    generator_utils._get_blocks_parser = blocks_parser_mock
+    get_block = AsyncMock(side_effect=[150, 180])
+    generator_utils._client.extra.block_time.get_block = get_block
+
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    async for _ in generator_utils._parse_by_blocks(None, {}, start, end, 1000, 2):
+        pass
+
+    get_block.assert_has_awaits([call(start, 'after'), call(end, 'before')])
+    assert blocks_parser_mock.call_args.args[2:4] == (150, 180)
+
+
+async def test_parse_by_blocks_decode_input(generator_utils):
+    blocks_parser_mock = Mock()
+    blocks_parser_mock.return_value.txs_generator = MagicMock(side_effect=transfers_mock)
+    generator_utils._get_blocks_parser = blocks_parser_mock
+
+    transfers = [
+        t async for t in generator_utils._parse_by_blocks(None, {}, 1, 2, 10, 2, decode_input=True)
+    ]
+
+    assert transfers == transfers_for_test()
+    blocks_parser_mock.return_value.txs_generator.assert_called_once_with(
+        generator_utils._client.extra.calldata.enrich_batch
+    )
+
+
+async def test_resolve_blocks_int(generator_utils):
+    generator_utils._client.extra.block_time.get_block = AsyncMock()
+    assert await generator_utils._resolve_blocks(1, 2) == (1, 2)
+    generator_utils._client.extra.block_time.get_block.assert_not_awaited()
 
 
 async def test_parse_by_blocks_end_block_is_none(generator_utils):
@@ -189,7 +274,9 @@ async def test_parse_by_blocks_end_block_is_none(generator_utils):
         transfers.append(transfer)
     assert transfers == transfers_for_test()
 
-    blocks_parser_mock.assert_called_once_with(None, {'param': 'value'}, 100, 200, 1000, 2)
+    blocks_parser_mock.assert_called_once_with(
+        None, {'param': 'value'}, 100, 200, 1000, 2, 1, None, False, None, False, 0, False
+    )
 
 
 async def test_parse_by_pages_ok(generator_utils):
@@ -206,6 +293,16 @@ async def test_parse_by_pages_ok(generator_utils):
     assert result == api_method.return_value
 
 
+async def test_parse_by_pages_last_page(generator_utils):
+    api_method = AsyncMock(side_effect=[['row1', 'row2'], ['row3'], ['row4']])
+    rows = [row async for row in generator_utils._parse_by_pages(api_method, {'offset': 2})]
+    assert rows == ['row1', 'row2', 'row3']
+
+    api_method = AsyncMock(side_effect=[['row1'], [], ['row2']])
+    rows = [row async for row in generator_utils._parse_by_pages(api_method, {})]
+    assert rows == ['row1']
+
+
 async def test_parse_by_pages_error(generator_utils):
     api_method = AsyncMock(side_effect=EtherscanClientApiError('test error', 'result'))
     params = {'param': 'value'}
@@ -232,22 +329,24 @@ def test_without_keys(generator_utils, params, excluded, expected):
 
 
 def test_get_request_params(generator_utils):
-    api_method = object()
+    async def api_method(self, param1, param3, start_block, end_block): ...
 
-    generator_utils._without_keys = Mock(return_value={'param1': 'value1', 'param2': 'value2'})
+    result = generator_utils._get_request_params(
+        api_method, {'param1': 'value1', 'param2': 'value2', 'start_block': 1, 'end_block': 2}
+    )
+
+    assert result == {'param1': 'value1'}
 
-    with patch('inspect.getfullargspec') as getfullargspec_mock:
-        getfullargspec_mock.return_value.args = ['self', 'param1', 'param3']
 
+def test_get_request_params_endpoint(generator_utils):
+    with patch('inspect.getfullargspec') as getfullargspec_mock:
         result = generator_utils._get_request_params(
-            api_method, {'param1': 'value1', 'param2': 'value2'}
+            Account(Mock()).normal_txs,
+            {'address': 'addr', 'sort': 'asc', 'start_block': 1, 'blocks_limit': 10},
         )
 
-        getfullargspec_mock.assert_called_once_with(api_method)
-        generator_utils._without_keys.assert_called_once_with(
-            {'param1': 'value1'}, ('self', 'start_block', 'end_block')
-        )
-        assert result == generator_utils._without_keys.return_value
+        getfullargspec_mock.assert_not_called()
+        assert result == {'address': 'addr', 'sort': 'asc'}
 
 
 def test_get_parser_params(generator_utils):
@@ -264,3 +363,140 @@ def test_get_parser_params(generator_utils):
         request_params=generator_utils._get_request_params.return_value,
         **{'param2': 'value2', 'param3': 'value3'},
     )
+
+
+async def test_pages(generator_utils):
+    api_method = AsyncMock()
+    with patch(
+        'aioetherscan.modules.extra.generators.generator_utils.GeneratorUtils._parse_by_pages',
+        new=MagicMock(side_effect=transfers_mock),
+    ) as mock:
+        result = [row async for row in generator_utils.pages(api_method, address='a1')]
+
+        mock.assert_called_once_with(api_method, {'address': 'a1'})
+        assert result == transfers_for_test()
+
+
+def test_get_checkpoint(generator_utils):
+    api_method = Account(Mock()).normal_txs
+    store = MemoryCheckpointStore()
+    generator_utils._client.chain = 'eth:main'
+    assert generator_utils._get_checkpoint(None, api_method, {}, 1, 2) is None
+
+    checkpoint = generator_utils._get_checkpoint(store, api_method, {'b': 2, 'a': 1}, 1, 2)
+    assert isinstance(checkpoint, Checkpoint)
+    assert checkpoint.key == 'eth:main:account:txlist:{"a": 1, "b": 2}:1:2'
+
+
+async def test_logs(generator_utils):
+    generator_utils._get_parser_params = Mock(return_value={'param': 'value'})
+
+    with patch(
+        'aioetherscan.modules.extra.generators.generator_utils.GeneratorUtils._parse_logs',
+        new=MagicMock(side_effect=parse_mock),
+    ) as mock:
+        async for _ in generator_utils.logs(address='a1', start_block=0, end_block=20):
+            break
+
+        generator_utils._get_parser_params.assert_called_once_with(
+            generator_utils._client.logs.get_logs,
+            {
+                'self': generator_utils,
+                'address': 'a1',
+                'topics': None,
+                'operators': None,
+                'start_block': 0,
+                'end_block': 20,
+                'blocks_limit': 2048,
+            },
+        )
+        mock.assert_called_once_with(param='value')
+
+        generator_utils._get_parser_params.reset_mock()
+        async for _ in generator_utils.logs(address='a1'):
+            break
+        assert generator_utils._get_parser_params.call_args.args[1]['end_block'] is None
+
+
+async def test_logs_no_filter(generator_utils):
+    with pytest.raises(ValueError):
+        async for _ in generator_utils.logs():
+            pass  # pragma: no cover
+
+
+async def test_parse_logs(generator_utils):
+    with patch(
+        'aioetherscan.modules.extra.generators.logs_parser.LogsParser.logs_generator',
+        new=MagicMock(side_effect=transfers_mock),
+    ):
+        logs = [
+            log async for log in generator_utils._parse_logs(None, {'address': 'a1'}, 0, 20, 100)
+        ]
+    assert logs == transfers_for_test()
+
+
+async def test_parse_logs_to_head(generator_utils):
+    generator_utils._client.proxy.block_number = AsyncMock(return_value='0x64')
+
+    with patch(
+        'aioetherscan.modules.extra.generators.generator_utils.LogsParser',
+    ) as parser_mock:
+        parser_mock.return_value.logs_generator = MagicMock(side_effect=transfers_mock)
+        logs = [
+            log async for log in generator_utils._parse_logs(None, {'address': 'a1'}, 0, None, 10)
+        ]
+
+    parser_mock.assert_called_once_with(None, {'address': 'a1'}, 0, 100, 10)
+    assert logs == transfers_for_test()
+
+
+async def test_account_activity(generator_utils):
+    generator_utils.normal_txs = MagicMock(side_effect=transfers_mock)
+    generator_utils.token_transfers = MagicMock(side_effect=transfers_mock)
+
+    with patch(
+        'aioetherscan.modules.extra.generators.generator_utils.merge_streams',
+        new=MagicMock(side_effect=transfers_mock),
+    ) as merge_mock:
+        rows = [
+            row
+            async for row in generator_utils.account_activity(
+                'a1', start_block=1, end_block=2, kinds=('normal', 'erc721')
+            )
+        ]
+
+    assert rows == transfers_for_test()
+    params = dict(
+        address='a1',
+        start_block=1,
+        end_block=2,
+        blocks_limit=2048,
+        blocks_limit_divider=2,
+        target_rows=None,
+        cursor=False,
+        open_range=False,
+    )
+    generator_utils.normal_txs.assert_called_once_with(**params)
+    generator_utils.token_transfers.assert_called_once_with(token_standard='erc721', **params)
+    assert list(merge_mock.call_args.args[0]) == ['normal', 'erc721']
+
+
+@pytest.mark.parametrize('kinds', [(), ('normal', 'unknown')])
+async def test_account_activity_invalid_kinds(generator_utils, kinds):
+    with pytest.raises(ValueError):
+        async for _ in generator_utils.account_activity('a1', kinds=kinds):
+            pass  # pragma: no cover
+
+
+def test_get_activity_stream(generator_utils):
+    generator_utils.normal_txs = Mock()
+    generator_utils.internal_txs = Mock()
+    generator_utils.token_transfers = Mock()
+
+    generator_utils._get_activity_stream('normal', {'address': 'a1'})
+    generator_utils._get_activity_stream('internal', {'address': 'a1'})
+    generator_utils._get_activity_stream('erc1155', {'address': 'a1'})
+
+    generator_utils.normal_txs.assert_called_once_with(address='a1')
+    generator_utils.internal_txs.assert_called_once_with(address='a1')
+    generator_utils.token_transfers.assert_called_once_with(token_standard='erc1155', address='a1')
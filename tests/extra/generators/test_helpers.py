@@ -2,6 +2,9 @@ from aioetherscan.modules.extra.generators.helpers import (
     tx_block_number,
     drop_block,
     get_max_block_number,
+    hex_to_int,
+    log_position,
+    parse_int,
 )
 
 
@@ -40,3 +43,19 @@ def test_get_max_block_number():
     ]
 
     assert get_max_block_number(transfers) == max_block_number
+
+
+def test_hex_to_int():
+    assert hex_to_int('0x1f') == 31
+    assert hex_to_int('0x') == 0
+
+
+def test_parse_int():
+    assert parse_int(31) == 31
+    assert parse_int('31') == 31
+    assert parse_int('0x1f') == 31
+
+
+def test_log_position():
+    assert log_position({'blockNumber': '0x10', 'logIndex': '0x'}) == (16, 0)
+    assert log_position({'blockNumber': '0x10', 'logIndex': '0x2'}) == (16, 2)
@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.generators.helpers import log_position
+from aioetherscan.modules.extra.generators.logs_parser import LogsParser
+
+OFFSET = 10
+
+
+def make_logs(block: int, count: int) -> list[dict]:
+    return [{'blockNumber': hex(block), 'logIndex': hex(i) if i else '0x'} for i in range(count)]
+
+
+# block -> logs count
+CHAIN = {1: 3, 2: 4, 5: 8, 6: 25, 9: 1}
+ALL_LOGS = [log for block, count in CHAIN.items() for log in make_logs(block, count)]
+
+
+async def get_logs(from_block, to_block, page, offset, **kwargs):
+    logs = [log for log in ALL_LOGS if from_block <= log_position(log)[0] <= to_block]
+    # emulate unordered API output
+    result = list(reversed(logs[(page - 1) * offset : page * offset]))
+    if not result:
+        raise EtherscanClientApiError('No records found', [])
+    return result
+
+
+@pytest.fixture
+def parser() -> LogsParser:
+    parser = LogsParser(AsyncMock(side_effect=get_logs), {'address': '0x1'}, 0, 12, 8)
+    parser._OFFSET = OFFSET
+    return parser
+
+
+async def test_logs_generator(parser):
+    logs = [log async for log in parser.logs_generator()]
+
+    assert logs == ALL_LOGS
+    assert logs == sorted(logs, key=log_position)
+
+
+async def test_logs_generator_bisects(parser):
+    _ = [log async for log in parser.logs_generator()]
+
+    ranges = [(c.kwargs['from_block'], c.kwargs['to_block']) for c in parser._api_method.mock_calls]
+    assert ranges[:3] == [(0, 7), (0, 3), (4, 7)]
+    assert all(c.kwargs['address'] == '0x1' for c in parser._api_method.mock_calls)
+
+
+async def test_logs_generator_pages_dense_block(parser):
+    parser._start_block = parser._end_block = 6
+
+    logs = [log async for log in parser.logs_generator()]
+
+    assert logs == make_logs(6, 25)
+    assert [c.kwargs['page'] for c in parser._api_method.mock_calls] == [1, 2, 3]
+
+
+async def test_fetch_error(parser):
+    parser._api_method.side_effect = EtherscanClientApiError('Error', 'result')
+    with pytest.raises(EtherscanClientApiError):
+        await parser._fetch(0, 1, 1)
+
+
+def test_make_request_params(parser):
+    assert parser._make_request_params(1, 2, 3) == {
+        'address': '0x1',
+        'from_block': 1,
+        'to_block': 2,
+        'page': 3,
+        'offset': OFFSET,
+    }
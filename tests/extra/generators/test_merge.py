@@ -0,0 +1,73 @@
+import pytest
+
+from aioetherscan.modules.extra.generators.merge import (
+    activity_position,
+    anext_or_none,
+    merge_streams,
+)
+
+
+async def stream(*rows):
+    for row in rows:
+        yield dict(row)
+
+
+def test_activity_position():
+    assert activity_position({'blockNumber': '5'}) == (5, -1, -1)
+    assert activity_position({'blockNumber': '5', 'transactionIndex': '0', 'logIndex': ''}) == (
+        5,
+        0,
+        -1,
+    )
+    assert activity_position({'blockNumber': '5', 'transactionIndex': '2', 'logIndex': '7'}) == (
+        5,
+        2,
+        7,
+    )
+
+
+async def test_merge_streams():
+    streams = {
+        'normal': stream(
+            {'blockNumber': '1', 'transactionIndex': '3'},
+            {'blockNumber': '4', 'transactionIndex': '1'},
+        ),
+        'internal': stream({'blockNumber': '1'}, {'blockNumber': '5'}),
+        'erc20': stream(
+            {'blockNumber': '1', 'transactionIndex': '3', 'logIndex': '2'},
+            {'blockNumber': '4', 'transactionIndex': '1', 'logIndex': '0'},
+        ),
+        'erc721': stream(),
+    }
+
+    rows = [row async for row in merge_streams(streams, depth=1)]
+
+    assert [(r['kind'], r['blockNumber']) for r in rows] == [
+        ('internal', '1'),
+        ('normal', '1'),
+        ('erc20', '1'),
+        ('normal', '4'),
+        ('erc20', '4'),
+        ('internal', '5'),
+    ]
+
+
+async def test_merge_streams_ties_in_streams_order():
+    streams = {'b': stream({'blockNumber': '1'}), 'a': stream({'blockNumber': '1'})}
+    assert [r['kind'] async for r in merge_streams(streams)] == ['b', 'a']
+
+
+async def test_merge_streams_error():
+    async def failing():
+        yield {'blockNumber': '1'}
+        raise RuntimeError('error')
+
+    with pytest.raises(RuntimeError):
+        async for _ in merge_streams({'a': failing(), 'b': stream({'blockNumber': '2'})}):
+            pass
+
+
+async def test_anext_or_none():
+    iterator = stream({'a': 1})
+    assert await anext_or_none(iterator) == {'a': 1}
+    assert await anext_or_none(iterator) is None
@@ -0,0 +1,68 @@
+import asyncio
+import random
+
+import pytest
+
+from aioetherscan.modules.extra.generators.blocks_parser import BlocksParser
+from aioetherscan.modules.extra.generators.sharded_parser import ShardedBlocksParser
+
+TXS_BLOCKS = [1, 5, 5, 17, 18, 40, 41, 42, 63, 64, 99, 100]
+
+
+async def api_method(start_block, end_block, page, offset, **kwargs):
+    await asyncio.sleep(random.random() / 1000)
+    return [{'blockNumber': str(b)} for b in TXS_BLOCKS if start_block <= b <= end_block]
+
+
+@pytest.fixture
+def parser() -> ShardedBlocksParser:
+    parser = ShardedBlocksParser(api_method, {}, 0, 100, 4, 2, shards=3)
+    parser._SHARD_WINDOWS = 2
+    return parser
+
+
+def test_shard_ranges(parser):
+    assert list(parser._shard_ranges()) == [
+        (start, min(start + 7, 100)) for start in range(0, 101, 8)
+    ]
+
+
+async def test_windows_ordered(parser):
+    transfers = [int(t['blockNumber']) async for t in parser.txs_generator()]
+    assert transfers == TXS_BLOCKS
+    assert parser._blocks_range.blocks_left == 0
+
+
+async def test_same_as_sequential(parser):
+    sequential = BlocksParser(api_method, {}, 0, 100, 4, 2)
+    assert [t async for t in parser.txs_generator()] == [
+        t async for t in sequential.txs_generator()
+    ]
+
+
+async def test_active_shards_bounded(parser):
+    started = []
+    start_shard = parser._start_shard
+
+    def start_shard_mock(start_block, end_block):
+        started.append(start_block)
+        return start_shard(start_block, end_block)
+
+    parser._start_shard = start_shard_mock
+
+    async for _ in parser.windows_generator():
+        assert len(started) == 3
+        break
+
+
+async def test_shard_error_propagated(parser):
+    async def failing_api_method(start_block, **kwargs):
+        if start_block >= 16:
+            raise RuntimeError('shard failed')
+        return []
+
+    parser._api_method = failing_api_method
+
+    with pytest.raises(RuntimeError):
+        async for _ in parser.txs_generator():
+            pass
@@ -0,0 +1,231 @@
+import pytest
+
+from aioetherscan.modules.extra.abi import (
+    canonical_type,
+    compile_decoder,
+    compile_encoder,
+    compile_sequence,
+    compile_sequence_encoder,
+    compile_topic_decoder,
+    encode_call,
+    event_topic,
+    function_selector,
+    keccak256,
+    param_names,
+    signature,
+)
+
+
+def word(value: int) -> bytes:
+    return value.to_bytes(32, 'big', signed=value < 0)
+
+
+@pytest.mark.parametrize(
+    'data,expected',
+    [
+        (b'', 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'),
+        (b'abc', '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'),
+        (
+            b'The quick brown fox jumps over the lazy dog',
+            '4d741b6f1eb29cb2a9b9911c82f56fa8d73b04959d3d9d222895df6c0b28aa15',
+        ),
+    ],
+)
+def test_keccak256(data, expected):
+    assert keccak256(data).hex() == expected
+
+
+def test_signatures():
+    transfer = {
+        'name': 'Transfer',
+        'inputs': [{'type': 'address'}, {'type': 'address'}, {'type': 'uint256'}],
+    }
+    assert signature(transfer) == 'Transfer(address,address,uint256)'
+    assert event_topic(transfer) == (
+        '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+    )
+    assert function_selector({'name': 'transfer', 'inputs': transfer['inputs'][1:]}) == (
+        '0xa9059cbb'
+    )
+
+
+def test_canonical_type_tuple():
+    param = {
+        'type': 'tuple[]',
+        'components': [{'type': 'address'}, {'type': 'tuple', 'components': [{'type': 'bool'}]}],
+    }
+    assert canonical_type(param) == '(address,(bool))[]'
+
+
+def test_param_names():
+    assert param_names([{'name': 'to'}, {'name': ''}, {}]) == ['to', 'arg1', 'arg2']
+
+
+def test_decode_static():
+    decoder = compile_sequence(
+        [
+            compile_decoder({'type': 'address'}),
+            compile_decoder({'type': 'uint256'}),
+            compile_decoder({'type': 'int24'}),
+            compile_decoder({'type': 'bool'}),
+            compile_decoder({'type': 'bytes4'}),
+            compile_decoder({'type': 'uint8[2]'}),
+        ]
+    )
+    data = (
+        word(0xABCD)
+        + word(10**18)
+        + word(-5)
+        + word(1)
+        + bytes.fromhex('a9059cbb').ljust(32, b'\x00')
+        + word(1)
+        + word(2)
+    )
+
+    assert not decoder.dynamic
+    assert decoder.size == 7 * 32
+    assert decoder.decode(data, 0) == (
+        '0x' + 'abcd'.rjust(40, '0'),
+        10**18,
+        -5,
+        True,
+        '0xa9059cbb',
+        [1, 2],
+    )
+
+
+def test_decode_dynamic():
+    decoder = compile_sequence(
+        [
+            compile_decoder({'type': 'string'}),
+            compile_decoder({'type': 'uint256[]'}),
+            compile_decoder({'type': 'bytes'}),
+            compile_decoder(
+                {'type': 'tuple', 'components': [{'type': 'uint256'}, {'type': 'string'}]}
+            ),
+        ]
+    )
+    data = (
+        word(128)
+        + word(192)
+        + word(288)
+        + word(352)
+        # string
+        + word(5)
+        + b'hello'.ljust(32, b'\x00')
+        # uint256[]
+        + word(2)
+        + word(7)
+        + word(8)
+        # bytes
+        + word(2)
+        + b'\x12\x34'.ljust(32, b'\x00')
+        # tuple
+        + word(9)
+        + word(64)
+        + word(2)
+        + b'hi'.ljust(32, b'\x00')
+    )
+
+    assert decoder.dynamic
+    assert decoder.decode(data, 0) == ('hello', [7, 8], '0x1234', (9, 'hi'))
+
+
+def test_decode_truncated():
+    decoder = compile_sequence(
+        [compile_decoder({'type': 'bool'}), compile_decoder({'type': 'uint256[]'})]
+    )
+
+    with pytest.raises(ValueError, match='too short'):
+        decoder.decode(word(1), 0)
+    with pytest.raises(ValueError, match='too short'):
+        decoder.decode(word(1) + word(2**64), 0)
+    with pytest.raises(ValueError, match='array length'):
+        decoder.decode(word(1) + word(64) + word(2**64), 0)
+    with pytest.raises(ValueError, match='bytes length'):
+        compile_decoder({'type': 'bytes'}).decode(word(33) + word(0), 0)
+
+
+def test_decode_unsupported():
+    with pytest.raises(ValueError):
+        compile_decoder({'type': 'fixed128x18'})
+    with pytest.raises(ValueError):
+        compile_topic_decoder({'type': 'fixed128x18'})
+
+
+@pytest.mark.parametrize(
+    'type_,expected',
+    [
+        ('address', '0x' + '12' * 20),
+        ('uint256', int('12' * 20, 16)),
+        ('int256', int('12' * 20, 16)),
+        ('bool', False),
+        ('bytes4', '0x00000000'),
+        ('string', '0x' + '0' * 24 + '12' * 20),
+        ('uint256[]', '0x' + '0' * 24 + '12' * 20),
+    ],
+)
+def test_topic_decoder(type_, expected):
+    assert compile_topic_decoder({'type': type_})('0x' + '0' * 24 + '12' * 20) == expected
+
+
+def test_topic_decoder_negative_int():
+    assert compile_topic_decoder({'type': 'int24'})('0x' + 'f' * 64) == -1
+
+
+def test_encode_dynamic():
+    params = [
+        {'type': 'string'},
+        {'type': 'uint256[]'},
+        {'type': 'bytes'},
+        {'type': 'tuple', 'components': [{'type': 'uint256'}, {'type': 'string'}]},
+    ]
+    values = ('hello', [7, 8], '0x1234', (9, 'hi'))
+    encoder = compile_sequence_encoder([compile_encoder(p) for p in params])
+    decoder = compile_sequence([compile_decoder(p) for p in params])
+
+    assert encoder.dynamic
+    assert decoder.decode(encoder.encode(values), 0) == values
+
+
+def test_encode_static():
+    params = [
+        {'type': 'address'},
+        {'type': 'bool'},
+        {'type': 'int8'},
+        {'type': 'bytes2'},
+        {'type': 'uint8[2]'},
+    ]
+    values = ('0x' + '12' * 20, True, -1, '0xabcd', [1, 2])
+    encoder = compile_sequence_encoder([compile_encoder(p) for p in params])
+
+    assert not encoder.dynamic
+    assert encoder.encode(values) == (
+        word(int('12' * 20, 16))
+        + word(1)
+        + word(-1)
+        + b'\xab\xcd'.ljust(32, b'\x00')
+        + word(1)
+        + word(2)
+    )
+
+
+def test_encode_invalid():
+    with pytest.raises(ValueError):
+        compile_encoder({'type': 'fixed128x18'})
+    with pytest.raises(ValueError):
+        compile_encoder({'type': 'address'}).encode('0x1234')
+    with pytest.raises(ValueError):
+        compile_encoder({'type': 'uint256'}).encode(-1)
+    with pytest.raises(ValueError):
+        compile_sequence_encoder([compile_encoder({'type': 'bool'})]).encode([])
+
+
+def test_encode_call():
+    item = {
+        'name': 'transfer',
+        'inputs': [{'type': 'address', 'name': 'to'}, {'type': 'uint256', 'name': 'value'}],
+    }
+    assert encode_call(item, ['0x' + '12' * 20, 1]) == (
+        '0xa9059cbb' + '0' * 24 + '12' * 20 + '0' * 63 + '1'
+    )
@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.modules.extra.block_time import BlockTimeIndex, to_timestamp
+from aioetherscan.modules.extra.generators.checkpoint import MemoryCheckpointStore
+
+GENESIS_TS = 1_000
+LATEST = 10_000
+
+
+def block_ts(block: int) -> int:
+    # 12 seconds blocks with a slower first half
+    return GENESIS_TS + block * 20 if block < 5_000 else GENESIS_TS + 100_000 + (block - 5_000) * 12
+
+
+async def block_by_number_mock(full, tag):
+    block = LATEST if tag == 'latest' else tag
+    return {'number': hex(block), 'timestamp': hex(block_ts(block))}
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.proxy.block_by_number = AsyncMock(side_effect=block_by_number_mock)
+    return client
+
+
+@pytest.fixture
+def index(client) -> BlockTimeIndex:
+    return BlockTimeIndex(client)
+
+
+def test_to_timestamp():
+    assert to_timestamp(100) == 100
+    assert to_timestamp(datetime(2024, 1, 1)) == 1704067200
+    assert to_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc)) == 1704067200
+
+
+@pytest.mark.parametrize('block', [1, 777, 4_999, 5_000, 5_001, 9_999])
+async def test_get_block_exact(index, block):
+    assert await index.get_block(block_ts(block), 'before') == block
+    assert await index.get_block(block_ts(block), 'after') == block
+
+
+@pytest.mark.parametrize('block', [1, 777, 4_999, 5_000, 9_998])
+async def test_get_block_between(index, block):
+    timestamp = block_ts(block) + 5
+    assert await index.get_block(timestamp, 'before') == block
+    assert await index.get_block(timestamp, 'after') == block + 1
+
+
+async def test_get_block_calls(index, client):
+    await index.get_block(block_ts(7_000) + 1)
+    calls = client.proxy.block_by_number.call_count
+    assert calls < 20
+
+    # resolved between known adjacent anchors
+    assert await index.get_block(block_ts(7_000) + 2) == 7_000
+    assert client.proxy.block_by_number.call_count == calls
+
+
+async def test_get_block_bounds(index):
+    assert await index.get_block(0, 'after') == 0
+    with pytest.raises(ValueError):
+        await index.get_block(0, 'before')
+
+    assert await index.get_block(block_ts(LATEST) + 100, 'before') == LATEST
+    with pytest.raises(ValueError):
+        await index.get_block(block_ts(LATEST) + 100, 'after')
+
+
+async def test_get_block_invalid_closest(index):
+    with pytest.raises(ValueError):
+        await index.get_block(100, 'nearest')
+
+
+async def test_get_blocks(index):
+    timestamps = [block_ts(300), block_ts(20) + 1, block_ts(300)]
+    assert await index.get_blocks(timestamps) == [300, 20, 300]
+
+
+async def test_estimate_timestamp(index, client):
+    assert await index.estimate_timestamp(0) == GENESIS_TS
+    assert await index.estimate_timestamp(LATEST) == block_ts(LATEST)
+    assert await index.estimate_timestamp(5_000) == (GENESIS_TS + block_ts(LATEST)) // 2
+    assert client.proxy.block_by_number.call_count == 2
+
+    await index.get_block(block_ts(5_000))
+    assert await index.estimate_timestamp(5_000) == block_ts(5_000)
+
+    with pytest.raises(ValueError):
+        await index.estimate_timestamp(-1)
+
+
+async def test_estimate_timestamp_extrapolation(index, client):
+    client.proxy.block_by_number.side_effect = [
+        {'number': '0x0', 'timestamp': '0x0'},
+        {'number': '0xa', 'timestamp': '0x64'},
+    ]
+    assert await index.estimate_timestamp(20) == 200
+
+
+async def test_anchors_are_persisted(client):
+    store = MemoryCheckpointStore()
+    await BlockTimeIndex(client, store, 'eth').get_block(block_ts(1_234))
+    calls = client.proxy.block_by_number.call_count
+    assert len(store.load('eth')['anchors']) > 2
+
+    index = BlockTimeIndex(client, store, 'eth')
+    assert await index.get_block(block_ts(1_234)) == 1_234
+    assert client.proxy.block_by_number.call_count == calls
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.modules.extra.blocks import BlockFetcher, FileBlockStore, decode_block
+
+LATEST = 200
+
+
+async def block_by_number_mock(full, tag):
+    await asyncio.sleep(0.001 * (tag % 3))  # out of order completion
+    if tag > LATEST:
+        return None
+    tx = {'hash': f'0x{tag:064x}', 'value': '0x10', 'blockNumber': hex(tag)}
+    return {
+        'number': hex(tag),
+        'hash': f'0x{tag:064x}',
+        'timestamp': hex(1_000 + tag),
+        'gasUsed': '0x0',
+        'transactions': [tx if full else tx['hash']],
+    }
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.proxy.block_by_number = AsyncMock(side_effect=block_by_number_mock)
+    client.proxy.block_number = AsyncMock(return_value=hex(LATEST))
+    return client
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FileBlockStore(str(tmp_path / 'blocks.jsonl'))
+    yield store
+    store.close()
+
+
+def test_decode_block():
+    block = {
+        'number': '0x10',
+        'hash': '0xab',
+        'nonce': '0x0000000000000000',
+        'transactions': [{'hash': '0xcd', 'value': '0x', 'input': '0x12', 'type': '0x2'}],
+    }
+
+    assert decode_block(block) == {
+        'number': 16,
+        'hash': '0xab',
+        'nonce': '0x0000000000000000',
+        'transactions': [{'hash': '0xcd', 'value': 0, 'input': '0x12', 'type': 2}],
+    }
+    assert block['number'] == '0x10'
+    assert decode_block({'number': '0x1', 'transactions': ['0xcd']})['transactions'] == ['0xcd']
+
+
+async def test_fetch(client):
+    fetcher = BlockFetcher(client)
+    blocks = [b async for b in fetcher.fetch(10, 30, concurrency=4)]
+
+    assert [b['number'] for b in blocks] == list(range(10, 31))
+    assert blocks[0]['timestamp'] == 1_010
+    assert blocks[0]['transactions'] == [f'0x{10:064x}']
+    client.proxy.block_number.assert_not_awaited()
+
+
+async def test_fetch_full(client):
+    blocks = [b async for b in BlockFetcher(client).fetch(1, 2, full=True)]
+    assert blocks[1]['transactions'][0]['value'] == 16
+
+
+async def test_fetch_concurrency(client):
+    running = max_running = 0
+
+    async def block_by_number(full, tag):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return await block_by_number_mock(full, tag)
+
+    client.proxy.block_by_number.side_effect = block_by_number
+    _ = [b async for b in BlockFetcher(client).fetch(0, 20, concurrency=3)]
+    assert max_running == 3
+
+    with pytest.raises(ValueError):
+        _ = [b async for b in BlockFetcher(client).fetch(0, 20, concurrency=0)]
+
+
+async def test_fetch_not_mined(client):
+    with pytest.raises(ValueError):
+        _ = [b async for b in BlockFetcher(client).fetch(LATEST - 1, LATEST + 1)]
+
+
+async def test_fetch_store(client, store):
+    fetcher = BlockFetcher(client, store, confirmations=50)
+    first = [b async for b in fetcher.fetch(100, 200)]
+
+    assert (150, False) in store
+    assert (151, False) not in store
+    assert (150, True) not in store
+
+    client.proxy.block_by_number.reset_mock()
+    second = [b async for b in fetcher.fetch(100, 200)]
+
+    assert second == first
+    assert client.proxy.block_by_number.await_count == 50
+
+
+async def test_store_reopen(client, store, tmp_path):
+    _ = [b async for b in BlockFetcher(client, store).fetch(0, 10, full=True)]
+
+    path = tmp_path / 'blocks.jsonl'
+    with open(path, 'ab') as f:
+        f.write(b'11\t1\t{"number": 11')  # interrupted write
+
+    reopened = FileBlockStore(str(path))
+    assert (10, True) in reopened
+    assert reopened.get(10, True)['transactions'][0]['value'] == 16
+    assert reopened.get(11, True) is None
+    assert reopened.get(10, False) is None
+
+    reopened.append([decode_block(await block_by_number_mock(True, 11))], True)
+    assert FileBlockStore(str(path)).get(11, True)['number'] == 11
+    reopened.close()
+
+
+async def test_fetch_early_exit(client, store):
+    fetcher = BlockFetcher(client, store, confirmations=0)
+    blocks = fetcher.fetch(0, 100)
+    async for block in blocks:
+        if block['number'] == 5:
+            break
+    await blocks.aclose()
+
+    assert (5, False) in store
+    assert (6, False) not in store
+
+
+async def test_store_off_loop(client, store):
+    threads = set()
+    append, get = store.append, store.get
+
+    def record(method):
+        def wrapper(*args):
+            threads.add(threading.current_thread())
+            return method(*args)
+
+        return wrapper
+
+    store.append, store.get = record(append), record(get)
+    fetcher = BlockFetcher(client, store, confirmations=0)
+    _ = [b async for b in fetcher.fetch(0, 5)]
+    _ = [b async for b in fetcher.fetch(0, 5)]
+
+    assert threads and threading.current_thread() not in threads
@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, call
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientProxyError
+from aioetherscan.modules.extra.broadcast import BroadcastQueue, NonceManager
+
+ADDRESS = '0x' + '12' * 20
+
+
+class Node:
+    """Accepts txs with unused nonces, raw tx is the nonce hex."""
+
+    def __init__(self, count=5):
+        self.count = count
+        self.used = set(range(count))
+
+    async def tx_count(self, address, tag):
+        assert tag == 'pending'
+        return hex(self.count)
+
+    async def send_raw_tx(self, raw_hex):
+        await asyncio.sleep(0)
+        nonce = int(raw_hex, 16)
+        if nonce in self.used:
+            raise EtherscanClientProxyError(-32000, 'nonce too low')
+        self.used.add(nonce)
+        self.count = max(self.count, nonce + 1)
+        return f'0x{nonce:064x}'
+
+
+@pytest.fixture()
+def node():
+    return Node()
+
+
+@pytest.fixture()
+def client(node):
+    client = Mock()
+    client.proxy.tx_count = AsyncMock(side_effect=node.tx_count)
+    client.proxy.send_raw_tx = AsyncMock(side_effect=node.send_raw_tx)
+    return client
+
+
+async def test_nonces(client):
+    nonces = NonceManager(client)
+
+    assert await asyncio.gather(*(nonces.get(ADDRESS) for _ in range(3))) == [5, 6, 7]
+    assert await nonces.get(ADDRESS.upper().replace('0X', '0x')) == 8
+    client.proxy.tx_count.assert_awaited_once_with(ADDRESS, 'pending')
+
+
+async def test_nonces_release(client):
+    nonces = NonceManager(client)
+    assert [await nonces.get(ADDRESS) for _ in range(4)] == [5, 6, 7, 8]
+
+    nonces.release(ADDRESS, 8)
+    nonces.release(ADDRESS, 6)
+    nonces.release(ADDRESS, 10)
+
+    assert [await nonces.get(ADDRESS) for _ in range(3)] == [6, 8, 9]
+
+
+async def test_nonces_resync(client, node):
+    nonces = NonceManager(client)
+    assert await nonces.get(ADDRESS) == 5
+    assert await nonces.get(ADDRESS) == 6
+    nonces.release(ADDRESS, 5)
+
+    node.count = 10
+    await nonces.resync(ADDRESS)
+    assert await nonces.get(ADDRESS) == 10
+
+    nonces.reset(ADDRESS)
+    assert await nonces.get(ADDRESS) == 10
+    assert client.proxy.tx_count.await_count == 3
+
+
+async def test_broadcast(client, node):
+    broadcast = BroadcastQueue(client, NonceManager(client), concurrency=2)
+
+    txhashes = await asyncio.gather(*(broadcast.send(ADDRESS, hex) for _ in range(5)))
+
+    assert txhashes == [f'0x{n:064x}' for n in range(5, 10)]
+    assert client.proxy.send_raw_tx.await_count == 5
+    client.proxy.tx_count.assert_awaited_once()
+    assert not broadcast._workers
+
+
+async def test_broadcast_nonce_too_low(client, node):
+    nonces = NonceManager(client)
+    broadcast = BroadcastQueue(client, nonces)
+    assert await broadcast.send(ADDRESS, hex) == f'0x{5:064x}'
+
+    node.used |= {6, 7}  # sent elsewhere
+    node.count = 8
+
+    assert await broadcast.send(ADDRESS, hex) == f'0x{8:064x}'
+    assert client.proxy.tx_count.await_count == 2
+
+
+async def test_broadcast_retries_exhausted(client, node):
+    node.used = set(range(100))
+    broadcast = BroadcastQueue(client, NonceManager(client), retries=1)
+
+    with pytest.raises(EtherscanClientProxyError):
+        await broadcast.send(ADDRESS, hex)
+    assert client.proxy.send_raw_tx.await_count == 2
+
+
+async def test_broadcast_failed_nonce_reused(client):
+    sign = Mock(side_effect=[ValueError('signing failed'), '0x5'])
+    broadcast = BroadcastQueue(client, NonceManager(client))
+
+    with pytest.raises(ValueError):
+        await broadcast.send(ADDRESS, sign)
+    assert await broadcast.send(ADDRESS, sign) == f'0x{5:064x}'
+    sign.assert_has_calls([call(5), call(5)])
+
+
+async def test_broadcast_rejected(client):
+    client.proxy.send_raw_tx.side_effect = EtherscanClientProxyError(-32000, 'insufficient funds')
+    nonces = NonceManager(client)
+    broadcast = BroadcastQueue(client, nonces)
+
+    with pytest.raises(EtherscanClientProxyError):
+        await broadcast.send(ADDRESS, hex)
+    assert await nonces.get(ADDRESS) == 5
+
+
+async def test_broadcast_close(client):
+    broadcast = BroadcastQueue(client, NonceManager(client), concurrency=1)
+    futures = [broadcast.submit(ADDRESS, hex) for _ in range(3)]
+
+    await broadcast.close()
+
+    assert all(f.cancelled() for f in futures)
+    assert not broadcast._workers
+
+
+async def test_broadcast_submit_from_callback(client, node):
+    broadcast = BroadcastQueue(client, NonceManager(client), concurrency=1)
+    second = []
+
+    first = broadcast.submit(ADDRESS, hex)
+    first.add_done_callback(lambda _: second.append(broadcast.submit(ADDRESS, hex)))
+    await first
+
+    assert await asyncio.wait_for(second[0], timeout=1) == f'0x{6:064x}'
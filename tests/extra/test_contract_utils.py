@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch, AsyncMock
 
 import pytest
@@ -5,6 +6,7 @@ import pytest_asyncio
 
 from aioetherscan import Client
 from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.contract import AddressInfo
 
 
 @pytest_asyncio.fixture
@@ -118,3 +120,103 @@ async def test_get_contract_creator_internal_none(contract_utils):
             result = await contract_utils.get_contract_creator(contract_address='addr')
             mock.assert_called_once_with(address='addr', start_block=1, page=1, offset=1)
             assert result is None
+
+
+CREATIONS = {
+    f'0x{i:040x}': {
+        'contractAddress': f'0x{i:040x}',
+        'contractCreator': f'0xC{i:039x}',
+        'txHash': f'0x{i:064x}',
+    }
+    for i in range(0, 30, 3)
+}
+GENESIS_CONTRACT = f'0x{1:040x}'
+
+
+async def contract_creation_mock(addresses):
+    rows = [CREATIONS[a] for a in addresses if a in CREATIONS]
+    if not rows:
+        raise EtherscanClientApiError('No data found', [])
+    return rows
+
+
+async def code_mock(address):
+    return '0x6080' if address == GENESIS_CONTRACT else '0x'
+
+
+@pytest.fixture
+def bulk_contract_utils(contract_utils):
+    contract_utils._client.contract.contract_creation = AsyncMock(
+        side_effect=contract_creation_mock
+    )
+    contract_utils._client.proxy.code = AsyncMock(side_effect=code_mock)
+    return contract_utils
+
+
+async def test_classify_addresses(bulk_contract_utils):
+    addresses = [f'0x{i:040X}'.replace('0X', '0x') for i in range(30)]
+    infos = [i async for i in bulk_contract_utils.classify_addresses(addresses + addresses[:3])]
+
+    assert sorted(i.address for i in infos) == [a.lower() for a in addresses]
+    by_address = {i.address: i for i in infos}
+    assert by_address[f'0x{3:040x}'] == AddressInfo(
+        f'0x{3:040x}', True, f'0xc{3:039x}', f'0x{3:064x}'
+    )
+    assert by_address[GENESIS_CONTRACT] == AddressInfo(GENESIS_CONTRACT, True)
+    assert by_address[f'0x{2:040x}'] == AddressInfo(f'0x{2:040x}', False)
+
+    creation_mock = bulk_contract_utils._client.contract.contract_creation
+    assert creation_mock.await_count == 6
+    assert all(len(c.args[0]) <= 5 for c in creation_mock.await_args_list)
+    assert bulk_contract_utils._client.proxy.code.await_count == 20
+
+
+async def test_classify_addresses_cache(bulk_contract_utils):
+    addresses = [f'0x{i:040x}' for i in range(10)]
+    _ = [i async for i in bulk_contract_utils.classify_addresses(addresses)]
+    bulk_contract_utils._client.contract.contract_creation.reset_mock()
+    bulk_contract_utils._client.proxy.code.reset_mock()
+
+    infos = [i async for i in bulk_contract_utils.classify_addresses(addresses)]
+
+    assert len(infos) == 10
+    bulk_contract_utils._client.contract.contract_creation.assert_not_awaited()
+    bulk_contract_utils._client.proxy.code.assert_not_awaited()
+
+
+async def test_classify_addresses_concurrency(bulk_contract_utils):
+    running = max_running = 0
+
+    async def contract_creation(addresses):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return await contract_creation_mock(addresses)
+
+    bulk_contract_utils._client.contract.contract_creation.side_effect = contract_creation
+    addresses = [f'0x{i:040x}' for i in range(30)]
+    _ = [i async for i in bulk_contract_utils.classify_addresses(addresses, concurrency=2)]
+
+    assert max_running == 2
+
+    with pytest.raises(ValueError):
+        _ = [i async for i in bulk_contract_utils.classify_addresses(addresses, concurrency=0)]
+
+
+async def test_classify_addresses_error(bulk_contract_utils):
+    bulk_contract_utils._client.contract.contract_creation.side_effect = EtherscanClientApiError(
+        'NOTOK', 'Invalid API Key'
+    )
+    with pytest.raises(EtherscanClientApiError):
+        _ = [i async for i in bulk_contract_utils.classify_addresses(['0x1'])]
+
+
+async def test_get_contract_creators(bulk_contract_utils):
+    addresses = [f'0x{i:040x}' for i in range(4)]
+    assert await bulk_contract_utils.get_contract_creators(addresses) == {
+        f'0x{0:040x}': f'0xc{0:039x}',
+        GENESIS_CONTRACT: None,
+        f'0x{3:040x}': f'0xc{3:039x}',
+    }
@@ -0,0 +1,137 @@
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aioetherscan.modules.extra.daily_stats import DailySeries, DailyStats, date_range
+from aioetherscan.modules.extra.generators.checkpoint import MemoryCheckpointStore
+from aioetherscan.modules.stats import Stats
+
+TODAY = date(2024, 3, 31)
+MISSING_DAY = date(2024, 1, 10)
+
+
+async def daily_tx_count(start_date, end_date, sort, **params):
+    return [
+        {'UTCDate': d.isoformat(), 'unixTimeStamp': str(d.toordinal()), 'transactionCount': 1}
+        for d in date_range(start_date, end_date)
+        if d != MISSING_DAY and d <= TODAY
+    ]
+
+
+@pytest.fixture
+def api_method():
+    return AsyncMock(side_effect=daily_tx_count, __name__='daily_transaction_count')
+
+
+@pytest.fixture
+def daily_stats():
+    with patch.object(DailyStats, '_today', return_value=TODAY):
+        yield DailyStats(None)
+
+
+def test_date_range():
+    assert list(date_range(date(2024, 1, 30), date(2024, 2, 1))) == [
+        date(2024, 1, 30),
+        date(2024, 1, 31),
+        date(2024, 2, 1),
+    ]
+
+
+async def test_fetch(daily_stats, api_method):
+    series = await daily_stats.fetch(api_method, date(2024, 1, 9), date(2024, 1, 11))
+
+    assert series == DailySeries(
+        [date(2024, 1, 9), MISSING_DAY, date(2024, 1, 11)],
+        {
+            'unixTimeStamp': ['738894', None, '738896'],
+            'transactionCount': [1, None, 1],
+        },
+    )
+
+
+async def test_fetch_chunks(daily_stats, api_method):
+    series = await daily_stats.fetch(api_method, date(2023, 1, 1), date(2023, 12, 31))
+
+    assert len(series.dates) == len(series.columns['transactionCount']) == 365
+    assert api_method.await_count == 5
+    assert all(
+        (c.kwargs['end_date'] - c.kwargs['start_date']).days < DailyStats._CHUNK_DAYS
+        for c in api_method.await_args_list
+    )
+
+
+async def test_fetch_missing_days_only(daily_stats, api_method):
+    await daily_stats.fetch(api_method, date(2024, 1, 1), date(2024, 1, 31))
+    api_method.reset_mock()
+
+    series = await daily_stats.fetch(api_method, date(2024, 1, 1), date(2024, 3, 31))
+
+    # missing settled day is cached too, today is refetched
+    api_method.assert_awaited_once_with(
+        start_date=date(2024, 2, 1), end_date=date(2024, 3, 31), sort='asc'
+    )
+    assert series.columns['transactionCount'].count(1) == 90
+
+    api_method.reset_mock()
+    await daily_stats.fetch(api_method, date(2024, 1, 1), date(2024, 3, 31))
+    api_method.assert_awaited_once_with(start_date=TODAY, end_date=TODAY, sort='asc')
+
+
+async def test_fetch_unsettled_days(daily_stats, api_method):
+    api_method.side_effect = None
+    api_method.return_value = []
+
+    await daily_stats.fetch(api_method, TODAY - timedelta(days=3), TODAY)
+    api_method.reset_mock()
+    await daily_stats.fetch(api_method, TODAY - timedelta(days=3), TODAY)
+
+    api_method.assert_awaited_once_with(
+        start_date=TODAY - timedelta(days=2), end_date=TODAY, sort='asc'
+    )
+
+
+async def test_fetch_params(daily_stats, api_method):
+    await daily_stats.fetch(api_method, TODAY, TODAY, client_type='geth')
+    await daily_stats.fetch(api_method, TODAY, TODAY, client_type='parity')
+
+    assert [c.kwargs['client_type'] for c in api_method.await_args_list] == ['geth', 'parity']
+
+
+async def test_fetch_nodes_size(daily_stats):
+    client = Mock()
+    client._http.get = AsyncMock(
+        return_value=[
+            {'blockNumber': '1', 'chainTimeStamp': d.isoformat(), 'chainSize': '10'}
+            for d in date_range(date(2024, 1, 1), date(2024, 1, 2))
+        ]
+    )
+
+    series = await daily_stats.fetch(
+        Stats(client).eth_nodes_size,
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+        client_type='geth',
+        sync_mode='default',
+    )
+
+    assert series.columns == {'blockNumber': ['1', '1'], 'chainSize': ['10', '10']}
+
+
+async def test_fetch_invalid_range(daily_stats, api_method):
+    with pytest.raises(ValueError):
+        await daily_stats.fetch(api_method, date(2024, 1, 2), date(2024, 1, 1))
+
+
+async def test_store(api_method):
+    store = MemoryCheckpointStore()
+    with patch.object(DailyStats, '_today', return_value=TODAY):
+        await DailyStats(None, store).fetch(api_method, date(2024, 1, 1), date(2024, 1, 31))
+        api_method.reset_mock()
+
+        series = await DailyStats(None, store).fetch(
+            api_method, date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+    api_method.assert_not_awaited()
+    assert series.columns['transactionCount'][MISSING_DAY.day - 1] is None
@@ -0,0 +1,225 @@
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.decoder import (
+    AbiStore,
+    CalldataDecoder,
+    Event,
+    EventDecoder,
+    Function,
+)
+from aioetherscan.modules.extra.generators.checkpoint import MemoryCheckpointStore
+
+TRANSFER_TOPIC = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+ERC20_ABI = [
+    {
+        'type': 'event',
+        'name': 'Transfer',
+        'anonymous': False,
+        'inputs': [
+            {'type': 'address', 'name': 'from', 'indexed': True},
+            {'type': 'address', 'name': 'to', 'indexed': True},
+            {'type': 'uint256', 'name': 'value', 'indexed': False},
+        ],
+    },
+    {'type': 'function', 'name': 'transfer', 'inputs': []},
+]
+ERC721_ABI = [
+    {
+        'type': 'event',
+        'name': 'Transfer',
+        'inputs': [
+            {'type': 'address', 'name': 'from', 'indexed': True},
+            {'type': 'address', 'name': 'to', 'indexed': True},
+            {'type': 'uint256', 'name': 'tokenId', 'indexed': True},
+        ],
+    },
+]
+TOKEN, NFT, UNVERIFIED = '0x' + '1' * 40, '0x' + '2' * 40, '0x' + '3' * 40
+
+
+def topic(value: int) -> str:
+    return '0x' + f'{value:x}'.rjust(64, '0')
+
+
+def log(address: str, topics: list[str], data: str = '0x', index: int = 0) -> dict:
+    return {
+        'address': address,
+        'topics': topics,
+        'data': data,
+        'blockNumber': '0x10',
+        'logIndex': hex(index),
+        'transactionHash': '0xhash',
+    }
+
+
+async def contract_abi_mock(address):
+    if address == UNVERIFIED:
+        raise EtherscanClientApiError('NOTOK', 'Contract source code not verified')
+    return json.dumps(ERC20_ABI if address == TOKEN else ERC721_ABI)
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.contract.contract_abi = AsyncMock(side_effect=contract_abi_mock)
+    return client
+
+
+@pytest.fixture
+def decoder(client) -> EventDecoder:
+    return EventDecoder(AbiStore(client))
+
+
+async def test_abi_store(client):
+    store = MemoryCheckpointStore()
+    abi_store = AbiStore(client, store)
+
+    assert await abi_store.get(TOKEN.upper().replace('0X', '0x')) == ERC20_ABI
+    assert await abi_store.get(UNVERIFIED) is None
+    assert await abi_store.get_many([TOKEN, UNVERIFIED]) == {TOKEN: ERC20_ABI, UNVERIFIED: None}
+    assert client.contract.contract_abi.await_count == 2
+
+    assert await AbiStore(client, store).get(UNVERIFIED) is None
+    assert client.contract.contract_abi.await_count == 2
+
+
+async def test_abi_store_error(client):
+    client.contract.contract_abi.side_effect = EtherscanClientApiError('NOTOK', 'Invalid API Key')
+    with pytest.raises(EtherscanClientApiError):
+        await AbiStore(client).get(TOKEN)
+
+
+def test_event():
+    event = Event(ERC20_ABI[0])
+
+    assert event.topic == TRANSFER_TOPIC
+    assert event.topics_count == 3
+    assert event.signature == 'Transfer(address indexed from, address indexed to, uint256 value)'
+    assert event.fields == ['from', 'to', 'value']
+    assert event.decode_data(topic(5)) == (5,)
+
+
+def test_event_reserved_names():
+    event = Event(
+        {'name': 'Deposit', 'inputs': [{'type': 'address', 'name': 'address', 'indexed': True}]}
+    )
+    assert event.fields == ['address_']
+    assert event.decode_data('0x') == ()
+
+
+async def test_decode_logs(decoder, client):
+    logs = [
+        log(TOKEN, [TRANSFER_TOPIC, topic(0xA), topic(0xB)], topic(100), 0),
+        log(NFT, [TRANSFER_TOPIC, topic(0xA), topic(0xB), topic(7)], '0x', 1),
+        log(UNVERIFIED, ['0x' + 'f' * 64], '0x', 2),
+        log(TOKEN, [], '0x', 3),
+        log(TOKEN, [TRANSFER_TOPIC, topic(0xB), topic(0xC)], topic(200), 4),
+    ]
+    columns = await decoder.decode_logs(logs)
+
+    assert columns == {
+        'Transfer(address indexed from, address indexed to, uint256 value)': {
+            'address': [TOKEN, TOKEN],
+            'blockNumber': [16, 16],
+            'logIndex': [0, 4],
+            'transactionHash': ['0xhash', '0xhash'],
+            'from': ['0x' + 'a'.rjust(40, '0'), '0x' + 'b'.rjust(40, '0')],
+            'to': ['0x' + 'b'.rjust(40, '0'), '0x' + 'c'.rjust(40, '0')],
+            'value': [100, 200],
+        },
+        'Transfer(address indexed from, address indexed to, uint256 indexed tokenId)': {
+            'address': [NFT],
+            'blockNumber': [16],
+            'logIndex': [1],
+            'transactionHash': ['0xhash'],
+            'from': ['0x' + 'a'.rjust(40, '0')],
+            'to': ['0x' + 'b'.rjust(40, '0')],
+            'tokenId': [7],
+        },
+    }
+
+    await decoder.decode_logs(logs)
+    assert client.contract.contract_abi.await_count == 3
+
+
+def test_decode_batch_registered(decoder, client):
+    decoder.register(ERC20_ABI)
+    columns = decoder.decode_batch([log(TOKEN, [TRANSFER_TOPIC, topic(1), topic(2)], topic(3))])
+
+    assert list(columns) == ['Transfer(address indexed from, address indexed to, uint256 value)']
+    client.contract.contract_abi.assert_not_awaited()
+
+
+def test_decode_batch_malformed(decoder):
+    decoder.register(ERC20_ABI)
+    columns = decoder.decode_batch(
+        [
+            log(TOKEN, [TRANSFER_TOPIC, topic(1), topic(2)], '0x12', index=0),
+            log(TOKEN, [TRANSFER_TOPIC, topic(1), topic(2)], topic(3), index=1),
+        ]
+    )
+
+    (event_columns,) = columns.values()
+    assert event_columns['logIndex'] == [1]
+    assert event_columns['value'] == [3]
+
+
+TRANSFER_FUNCTION = {
+    'type': 'function',
+    'name': 'transfer',
+    'inputs': [{'type': 'address', 'name': 'to'}, {'type': 'uint256', 'name': 'amount'}],
+}
+TRANSFER_CALLDATA = '0xa9059cbb' + topic(0xA)[2:] + topic(5)[2:]
+
+
+async def txs(rows):
+    for row in rows:
+        yield row
+
+
+@pytest.fixture
+def calldata_decoder(client) -> CalldataDecoder:
+    client.contract.contract_abi.side_effect = lambda address: json.dumps(
+        [TRANSFER_FUNCTION] if address == TOKEN else []
+    )
+    return CalldataDecoder(AbiStore(client))
+
+
+def test_function():
+    function = Function(TRANSFER_FUNCTION)
+
+    assert function.selector == '0xa9059cbb'
+    assert function.signature == 'transfer(address,uint256)'
+    assert function.decode_args(TRANSFER_CALLDATA) == {'to': '0x' + 'a'.rjust(40, '0'), 'amount': 5}
+
+
+def test_decode_batch(calldata_decoder):
+    calldata_decoder.register([TRANSFER_FUNCTION, ERC20_ABI[0]])
+
+    methods, args = calldata_decoder.decode_batch(
+        [TRANSFER_CALLDATA, '0x', '0x12345678', '0xa9059cbbz', TRANSFER_CALLDATA[:-2]]
+    )
+
+    assert methods == ['transfer', None, None, None, None]
+    assert args == [{'to': '0x' + 'a'.rjust(40, '0'), 'amount': 5}, None, None, None, None]
+
+
+async def test_enrich(calldata_decoder, client):
+    calldata_decoder._BATCH_SIZE = 2
+    rows = [
+        {'to': TOKEN, 'input': TRANSFER_CALLDATA},
+        {'to': '', 'input': '0x6080'},
+        {'to': NFT, 'input': '0x'},
+        {'to': NFT, 'input': '0xdeadbeef'},
+        {'to': TOKEN, 'input': TRANSFER_CALLDATA},
+    ]
+
+    enriched = [tx async for tx in calldata_decoder.enrich(txs(rows))]
+
+    assert [tx['method'] for tx in enriched] == ['transfer', None, None, None, 'transfer']
+    assert enriched[4]['args'] == {'to': '0x' + 'a'.rjust(40, '0'), 'amount': 5}
+    assert client.contract.contract_abi.await_count == 2
@@ -0,0 +1,146 @@
+import csv
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from aioetherscan.modules.extra.export import CsvSink, JsonlSink, ParquetSink, export
+
+
+async def rows_mock(count: int, start_block: int = 0):
+    for i in range(count):
+        yield {'blockNumber': str(start_block + i), 'hash': f'0x{i:x}'}
+
+
+def read_jsonl(path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+async def test_export_jsonl(tmp_path):
+    path = str(tmp_path / 'txs.jsonl')
+    sink = JsonlSink(path, batch_size=3)
+
+    assert await export(rows_mock(10), sink) == 10
+    assert sink.paths == [path]
+    assert read_jsonl(path) == [row async for row in rows_mock(10)]
+
+
+async def test_export_csv(tmp_path):
+    path = str(tmp_path / 'txs.csv')
+    await export(rows_mock(5), CsvSink(path, batch_size=2))
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [row async for row in rows_mock(5)]
+
+
+async def test_export_csv_fields(tmp_path):
+    path = str(tmp_path / 'txs.csv')
+    await export(rows_mock(2), CsvSink(path, fields=['hash']))
+
+    with open(path) as f:
+        assert f.read().split() == ['hash', '0x0', '0x1']
+
+
+async def test_append(tmp_path):
+    jsonl_path, csv_path = str(tmp_path / 'txs.jsonl'), str(tmp_path / 'txs.csv')
+    for append in (False, True):
+        await export(rows_mock(2), JsonlSink(jsonl_path, append=append))
+        await export(rows_mock(2), CsvSink(csv_path, append=append))
+
+    assert read_jsonl(jsonl_path) == [row async for row in rows_mock(2)] * 2
+    with open(csv_path) as f:
+        assert list(csv.DictReader(f)) == [row async for row in rows_mock(2)] * 2
+
+
+async def test_append_rotated(tmp_path):
+    path = str(tmp_path / 'txs-{part}.jsonl')
+    await export(rows_mock(3), JsonlSink(path, batch_size=2, max_file_size=60))
+    sink = JsonlSink(path, batch_size=2, max_file_size=60, append=True)
+    await export(rows_mock(2, start_block=3), sink)
+
+    assert sink.paths == [path.format(part=0), path.format(part=1)]
+    assert [r['blockNumber'] for r in read_jsonl(path.format(part=1))] == ['2', '3', '4']
+
+
+async def test_position_and_discard(tmp_path):
+    path = str(tmp_path / 'txs.jsonl')
+    async with JsonlSink(path) as sink:
+        assert sink.position == (0, 0)
+        await sink.write({'hash': '0x0'})
+        await sink.flush()
+        assert sink.position == (0, 16)
+        await sink.write({'hash': '0x1'})
+        sink.discard()
+
+    assert read_jsonl(path) == [{'hash': '0x0'}]
+
+
+async def test_batching_keeps_buffer_bounded(tmp_path):
+    sink = JsonlSink(str(tmp_path / 'txs.jsonl'), batch_size=4)
+    async with sink:
+        async for row in rows_mock(9):
+            await sink.write(row)
+            assert len(sink._buffer) < 4
+    assert sink.rows_written == 9
+
+
+async def test_rotation_by_size(tmp_path):
+    sink = JsonlSink(str(tmp_path / 'txs-{part}.jsonl'), batch_size=2, max_file_size=60)
+    await export(rows_mock(5), sink)
+
+    assert sink.paths == [str(tmp_path / f'txs-{i}.jsonl') for i in range(3)]
+    assert [len(read_jsonl(p)) for p in sink.paths] == [2, 2, 1]
+
+
+async def test_rotation_by_blocks(tmp_path):
+    sink = JsonlSink(str(tmp_path / 'txs-{block}.jsonl'), batch_size=100, blocks_per_file=4)
+    await export(rows_mock(10, start_block=2), sink)
+
+    assert sink.paths == [str(tmp_path / f'txs-{b}.jsonl') for b in (0, 4, 8)]
+    assert [len(read_jsonl(p)) for p in sink.paths] == [2, 4, 4]
+
+
+async def test_rotation_by_hex_blocks(tmp_path):
+    async def logs_mock():
+        for block in range(2, 12):
+            yield {'blockNumber': hex(block), 'logIndex': '0x0'}
+
+    sink = JsonlSink(str(tmp_path / 'logs-{block}.jsonl'), batch_size=100, blocks_per_file=4)
+    await export(logs_mock(), sink)
+
+    assert [len(read_jsonl(p)) for p in sink.paths] == [2, 4, 4]
+
+
+def test_rotation_requires_placeholder(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlSink(str(tmp_path / 'txs.jsonl'), max_file_size=1)
+
+
+def test_invalid_batch_size(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlSink(str(tmp_path / 'txs.jsonl'), batch_size=0)
+
+
+async def test_export_parquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    path = str(tmp_path / 'txs.parquet')
+    await export(rows_mock(5), ParquetSink(path, batch_size=2))
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().to_pylist() == [row async for row in rows_mock(5)]
+
+
+def test_parquet_append(tmp_path):
+    with pytest.raises(ValueError):
+        ParquetSink(str(tmp_path / 'txs.parquet'), append=True)
+
+
+def test_parquet_without_pyarrow(tmp_path):
+    with patch.dict(sys.modules, {'pyarrow': None, 'pyarrow.parquet': None}):
+        with pytest.raises(ImportError):
+            ParquetSink(str(tmp_path / 'txs.parquet'))
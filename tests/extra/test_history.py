@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.modules.extra.history import HistorySampler, Sample
+
+CHANGES = {1_234: 10, 5_000: 25, 5_001: 30}
+
+
+def value_at(block: int) -> str:
+    return str(sum(v for b, v in CHANGES.items() if b <= block))
+
+
+@pytest.fixture
+def sampler() -> HistorySampler:
+    client = Mock()
+    client.account.account_balance_by_blockno = AsyncMock(
+        side_effect=lambda address, block: value_at(block)
+    )
+    client.token.account_balance_by_blockno = AsyncMock(
+        side_effect=lambda address, contract_address, block: value_at(block)
+    )
+    client.token.total_supply_by_blockno = AsyncMock(
+        side_effect=lambda contract_address, block: value_at(block)
+    )
+    return HistorySampler(client)
+
+
+async def test_balance(sampler):
+    samples = await sampler.balance('addr', 0, 10_000)
+
+    assert samples[0] == Sample(0, 0)
+    assert samples[-1] == Sample(10_000, 65)
+    # every change is located exactly
+    assert Sample(1_233, 0) in samples and Sample(1_234, 10) in samples
+    assert Sample(4_999, 10) in samples and Sample(5_000, 35) in samples
+    assert Sample(5_001, 65) in samples
+    assert sampler._client.account.account_balance_by_blockno.await_count < 100
+
+
+async def test_balance_resolution(sampler):
+    samples = await sampler.balance('addr', 0, 10_000, resolution=100, points=3)
+
+    changes = [(a, b) for a, b in zip(samples, samples[1:]) if a.value != b.value]
+    assert all(b.block - a.block <= 100 for a, b in changes)
+    assert sampler._client.account.account_balance_by_blockno.await_count < 30
+
+
+async def test_flat_range(sampler):
+    samples = await sampler.balance('addr', 6_000, 100_000)
+
+    assert len(samples) == HistorySampler._DEFAULT_POINTS
+    assert {s.value for s in samples} == {65}
+
+
+async def test_cache(sampler):
+    await sampler.balance('addr', 0, 10_000)
+    calls = sampler._client.account.account_balance_by_blockno.await_count
+
+    await sampler.balance('addr', 0, 10_000)
+    assert sampler._client.account.account_balance_by_blockno.await_count == calls
+
+    await sampler.balance('other', 0, 10_000, points=2)
+    assert sampler._client.account.account_balance_by_blockno.await_count > calls
+
+
+async def test_token_balance(sampler):
+    samples = await sampler.token_balance('addr', 'token', 1_000, 2_000, points=2)
+
+    assert samples[-1] == Sample(2_000, 10)
+    sampler._client.token.account_balance_by_blockno.assert_any_await('addr', 'token', 1_000)
+
+
+async def test_total_supply(sampler):
+    samples = await sampler.total_supply('token', 0, 0)
+
+    assert samples == [Sample(0, 0)]
+    sampler._client.token.total_supply_by_blockno.assert_awaited_once_with('token', 0)
+
+
+@pytest.mark.parametrize(
+    'start_block,end_block,resolution,points',
+    [(10, 5, 1, 16), (0, 10, 0, 16), (0, 10, 1, 1)],
+)
+async def test_invalid_params(sampler, start_block, end_block, resolution, points):
+    with pytest.raises(ValueError):
+        await sampler.balance('addr', start_block, end_block, resolution, points)
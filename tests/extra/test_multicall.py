@@ -0,0 +1,135 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientProxyError
+from aioetherscan.modules.extra.abi import (
+    compile_decoder,
+    compile_encoder,
+    compile_sequence,
+    compile_sequence_encoder,
+)
+from aioetherscan.modules.extra.multicall import MULTICALL3_ADDRESS, CallResult, Multicall
+
+CALL3 = {
+    'type': 'tuple[]',
+    'components': [{'type': 'address'}, {'type': 'bool'}, {'type': 'bytes'}],
+}
+RESULT = {'type': 'tuple[]', 'components': [{'type': 'bool'}, {'type': 'bytes'}]}
+BALANCE_OF = {
+    'name': 'balanceOf',
+    'inputs': [{'type': 'address', 'name': 'owner'}],
+    'outputs': [{'type': 'uint256', 'name': ''}],
+}
+
+FAILING = '0x' + 'ff' * 20
+GREEDY = '0x' + 'ee' * 20
+
+
+def aggregate3(calls):
+    """Emulates Multicall3: echoes calldata, reverts calls to FAILING, runs out of gas
+    when GREEDY is called along with other calls."""
+    if any(to == GREEDY for to, _, _ in calls) and len(calls) > 1:
+        raise EtherscanClientProxyError(-32000, 'out of gas')
+    results = [(to != FAILING, data if to != FAILING else '0x') for to, _, data in calls]
+    encoder = compile_sequence_encoder([compile_encoder(RESULT)])
+    return '0x' + encoder.encode([results]).hex()
+
+
+@pytest.fixture()
+def client():
+    async def call_mock(to, data, tag, post=False):
+        assert to == MULTICALL3_ADDRESS
+        assert post
+        assert data[:10] == '0x82ad56cb'
+        (calls,) = compile_sequence([compile_decoder(CALL3)]).decode(bytes.fromhex(data[10:]), 0)
+        assert all(allow_failure for _, allow_failure, _ in calls)
+        return aggregate3(calls)
+
+    client = Mock()
+    client.proxy.call = AsyncMock(side_effect=call_mock)
+    return client
+
+
+def make_calls(count, data='0x1234'):
+    return [(f'0x{i:040x}', data) for i in range(count)]
+
+
+async def test_call(client):
+    calls = make_calls(10) + [(FAILING, '0x1234')]
+
+    results = await Multicall(client).call(calls)
+
+    assert results == [CallResult(True, '0x1234')] * 10 + [CallResult(False, '0x')]
+    client.proxy.call.assert_awaited_once()
+
+
+async def test_pack_balance_of_defaults(client):
+    calls = [(f'0x{i:040x}', (f'0x{i:040x}',)) for i in range(1_000)]
+
+    results = await Multicall(client).call_function(BALANCE_OF, calls)
+
+    assert len(results) == 1_000
+    assert client.proxy.call.await_count == 2
+
+
+async def test_pack_by_count(client):
+    results = await Multicall(client, max_calls=4).call(make_calls(10))
+
+    assert len(results) == 10
+    assert client.proxy.call.await_count == 3
+
+
+async def test_pack_by_size(client):
+    data = '0x' + 'ab' * 100  # 4 words
+    # batch overhead of 68 bytes, 288 bytes per call
+    results = await Multicall(client, max_size=68 + 3 * 288).call(make_calls(10, data))
+
+    assert results == [CallResult(True, data)] * 10
+    assert client.proxy.call.await_count == 4
+
+
+async def test_split_failed_batch(client):
+    calls = make_calls(3) + [(GREEDY, '0x12')] + make_calls(4)
+
+    results = await Multicall(client).call(calls)
+
+    assert (
+        results
+        == [CallResult(True, '0x1234')] * 3
+        + [CallResult(True, '0x12')]
+        + [CallResult(True, '0x1234')] * 4
+    )
+    assert client.proxy.call.await_count == 7
+
+
+async def test_single_call_failed(client):
+    client.proxy.call.side_effect = EtherscanClientProxyError(-32000, 'execution reverted')
+
+    assert await Multicall(client).call(make_calls(2)) == [CallResult(False, '0x')] * 2
+
+
+async def test_unexpected_response(client):
+    client.proxy.call.side_effect = None
+    client.proxy.call.return_value = '0x'
+
+    with pytest.raises(ValueError):
+        await Multicall(client).call(make_calls(2))
+
+
+async def test_call_function(client):
+    async def call_mock(to, data, tag, post=False):
+        (calls,) = compile_sequence([compile_decoder(CALL3)]).decode(bytes.fromhex(data[10:]), 0)
+        assert {data[:10] for _, _, data in calls} == {'0x70a08231'}
+        # balance is the owner address number
+        results = [
+            (to != FAILING, '0x' + data[10:] if to != FAILING else '0x') for to, _, data in calls
+        ]
+        return '0x' + compile_sequence_encoder([compile_encoder(RESULT)]).encode([results]).hex()
+
+    client.proxy.call.side_effect = call_mock
+    calls = [('0x' + '11' * 20, [f'0x{i:040x}']) for i in range(3)] + [
+        (FAILING, ['0x' + '22' * 20])
+    ]
+
+    assert await Multicall(client).call_function(BALANCE_OF, calls) == [(0,), (1,), (2,), None]
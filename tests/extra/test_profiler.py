@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.profiler import ActivityProfile, ActivityProfiler, Bucket
+
+TXS_BLOCKS = [105, 106, 106, 180, 990] + [500] * 30
+
+
+async def txs_mock(address, start_block, end_block, sort, page, offset, token_standard=None):
+    blocks = sorted(b for b in TXS_BLOCKS if start_block <= b <= end_block)
+    if sort == 'desc':
+        blocks.reverse()
+    if not blocks:
+        raise EtherscanClientApiError('No transactions found', [])
+    return [{'blockNumber': str(b)} for b in blocks[:offset]]
+
+
+@pytest.fixture
+def profiler() -> ActivityProfiler:
+    client = Mock()
+    client.account.normal_txs = AsyncMock(side_effect=txs_mock)
+    client.account.internal_txs = AsyncMock(side_effect=txs_mock)
+    client.account.token_transfers = AsyncMock(side_effect=txs_mock)
+    profiler = ActivityProfiler(client)
+    profiler._SAMPLE_SIZE = 10
+    return profiler
+
+
+async def test_profile(profiler):
+    profile = await profiler.profile('addr', bucket_size=100)
+
+    assert profile.first_block == 105
+    assert profile.last_block == 990
+    assert profile.buckets == [
+        Bucket(105, 204, 4, True),
+        Bucket(405, 504, 10, False),
+        Bucket(905, 990, 1, True),
+    ]
+
+
+async def test_profile_default_bucket_size(profiler):
+    profile = await profiler.profile('addr', start_block=100, end_block=200)
+
+    assert (profile.first_block, profile.last_block) == (105, 180)
+    assert sum(b.rows for b in profile.buckets) == 4
+    assert all(b.end_block - b.start_block + 1 == 3 for b in profile.buckets[:-1])
+
+
+async def test_profile_no_activity(profiler):
+    profile = await profiler.profile('addr', start_block=1_000)
+    assert profile == ActivityProfile(None, None, [])
+
+
+async def test_profile_prunes_empty_ranges(profiler):
+    await profiler.profile('addr', bucket_size=100)
+    # 2 bounds probes, bisection probes and 3 active buckets counts
+    assert profiler._client.account.normal_txs.call_count < 15
+
+
+async def test_profile_all(profiler):
+    profiles = await profiler.profile_all('addr', kinds=('internal', 'erc721'))
+
+    assert list(profiles) == ['internal', 'erc721']
+    assert profiles['erc721'].first_block == 105
+    assert all(
+        c.kwargs['token_standard'] == 'erc721'
+        for c in profiler._client.account.token_transfers.mock_calls
+    )
+
+
+async def test_probe_error(profiler):
+    profiler._client.account.normal_txs.side_effect = EtherscanClientApiError('error', '')
+    with pytest.raises(EtherscanClientApiError):
+        await profiler.profile('addr')
+
+
+def test_invalid_kind(profiler):
+    with pytest.raises(ValueError):
+        profiler._get_api_method('unknown')
+
+
+def test_generator_params():
+    profile = ActivityProfile(100, 299, [Bucket(100, 199, 10, True), Bucket(200, 299, 50, True)])
+
+    assert profile.max_density == 0.5
+    assert profile.generator_params(target_rows=100) == dict(
+        start_block=100, end_block=299, blocks_limit=200
+    )
+
+
+def test_generator_params_no_activity():
+    with pytest.raises(ValueError):
+        ActivityProfile(None, None, []).generator_params()
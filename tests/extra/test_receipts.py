@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.modules.extra.generators.checkpoint import MemoryCheckpointStore
+from aioetherscan.modules.extra.receipts import ReceiptFetcher
+
+LATEST = 1_000
+PENDING = '0x' + 'f' * 64
+
+
+def txhash(i: int) -> str:
+    return f'0x{i:064x}'
+
+
+async def tx_receipt_mock(txhash):
+    i = int(txhash, 16)
+    await asyncio.sleep(0.001 * max(0, 10 - i))  # later hashes complete first
+    if txhash == PENDING:
+        return None
+    return {'transactionHash': txhash, 'blockNumber': hex(i * 100), 'status': '0x1'}
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.proxy.tx_receipt = AsyncMock(side_effect=tx_receipt_mock)
+    client.proxy.block_number = AsyncMock(return_value=hex(LATEST))
+    return client
+
+
+async def test_fetch_ordered(client):
+    hashes = [txhash(i) for i in range(1, 8)] + [PENDING, txhash(1)]
+    results = [r async for r in ReceiptFetcher(client).fetch(hashes, concurrency=3)]
+
+    assert [h for h, _ in results] == hashes[:-1]
+    assert results[0][1]['status'] == '0x1'
+    assert results[-1] == (PENDING, None)
+    assert client.proxy.tx_receipt.await_count == 8
+
+
+async def test_fetch_completed(client):
+    hashes = [txhash(i) for i in range(1, 4)]
+    released = {h: asyncio.Event() for h in hashes}
+
+    async def tx_receipt(txhash):
+        await released[txhash].wait()
+        return {'transactionHash': txhash, 'blockNumber': '0x1'}
+
+    client.proxy.tx_receipt.side_effect = tx_receipt
+    results = ReceiptFetcher(client).fetch(hashes, ordered=False)
+    for h in reversed(hashes):
+        released[h].set()
+        assert (await results.__anext__())[0] == h
+    await results.aclose()
+
+
+async def test_fetch_concurrency(client):
+    running = max_running = 0
+
+    async def tx_receipt(txhash):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return await tx_receipt_mock(txhash)
+
+    client.proxy.tx_receipt.side_effect = tx_receipt
+    fetcher = ReceiptFetcher(client)
+    for ordered in (True, False):
+        max_running = 0
+        _ = [r async for r in fetcher.fetch([txhash(i) for i in range(20)], ordered, 2)]
+        assert max_running == 2
+
+    with pytest.raises(ValueError):
+        _ = [r async for r in fetcher.fetch([txhash(1)], concurrency=0)]
+
+
+async def test_fetch_cache(client):
+    store = Mock(wraps=MemoryCheckpointStore())
+    hashes = [txhash(i) for i in range(1, 11)]
+    _ = [r async for r in ReceiptFetcher(client, store, confirmations=100).fetch(hashes)]
+    client.proxy.tx_receipt.reset_mock()
+    store.save_many.assert_called_once()  # final receipts are saved in a batch
+
+    fetcher = ReceiptFetcher(client, store, confirmations=100)
+    results = [r async for r in fetcher.fetch([h.upper().replace('0X', '0x') for h in hashes])]
+
+    # receipts younger than 100 blocks are not final
+    assert [c.args[0] for c in client.proxy.tx_receipt.await_args_list] == [txhash(10)]
+    assert len(results) == 10
+    assert store.load(f'proxy:eth_getTransactionReceipt:{txhash(9)}')['receipt'][
+        'blockNumber'
+    ] == hex(900)
+    assert store.load(f'proxy:eth_getTransactionReceipt:{txhash(10)}') is None
+
+
+async def test_fetch_early_exit(client):
+    fetcher = ReceiptFetcher(client)
+    results = fetcher.fetch([txhash(i) for i in range(100)], concurrency=4)
+    async for _ in results:
+        break
+    await results.aclose()
+
+    assert client.proxy.tx_receipt.await_count <= 5
@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.subscriptions import Subscription, Subscriptions
+
+
+def values_fetch(*values):
+    return AsyncMock(side_effect=[*values] + [values[-1]] * 1_000)
+
+
+async def test_get():
+    fetch = values_fetch(1, 2)
+    subscription = Subscription(fetch, interval=10)
+
+    assert subscription.value is None
+    assert subscription.metrics.staleness is None
+    assert await subscription.get() == 1
+    assert await asyncio.gather(*(subscription.get() for _ in range(10))) == [1] * 10
+
+    metrics = subscription.metrics
+    assert metrics.refreshes == 1 and metrics.errors == 0
+    assert metrics.staleness >= 0 and metrics.latency >= 0
+    await subscription.close()
+
+
+async def test_changes_fan_out():
+    subscription = Subscription(values_fetch(1, 1, 2, 2, 3), interval=0)
+
+    async def consume():
+        values = []
+        async for value in subscription:
+            values.append(value)
+            if value == 3:
+                return values
+
+    consumers = await asyncio.gather(consume(), consume(), consume())
+
+    assert consumers == [[1, 2, 3]] * 3
+    await subscription.close()
+
+
+async def test_single_poller():
+    fetch = values_fetch(1)
+    subscription = Subscription(fetch, interval=10)
+
+    await asyncio.gather(*(subscription.get() for _ in range(10)))
+
+    fetch.assert_awaited_once()
+    await subscription.close()
+
+
+async def test_errors():
+    fetch = AsyncMock(
+        side_effect=[EtherscanClientApiError('NOTOK', 'error'), ConnectionResetError(), 5, 5]
+    )
+    subscription = Subscription(fetch, interval=0)
+
+    with pytest.raises(EtherscanClientApiError):
+        await subscription.get()
+    with pytest.raises(ConnectionResetError):
+        await subscription.get()
+    assert await subscription.get() == 5
+    assert subscription.metrics.errors == 2
+    await subscription.close()
+
+
+async def test_failure():
+    subscription = Subscription(AsyncMock(side_effect=[1, KeyError('result')]), interval=0)
+    changes = subscription.changes()
+    assert await changes.__anext__() == 1
+
+    with pytest.raises(KeyError):
+        await changes.__anext__()
+    with pytest.raises(KeyError):
+        await subscription.get()
+    await subscription.close()
+
+
+async def test_close():
+    subscription = Subscription(values_fetch(1), interval=0)
+    changes = subscription.changes()
+    assert await changes.__anext__() == 1
+
+    waiting = asyncio.ensure_future(changes.__anext__())
+    await asyncio.sleep(0)
+    await subscription.close()
+
+    with pytest.raises(StopAsyncIteration):
+        await waiting
+    with pytest.raises(RuntimeError):
+        await subscription.get()
+
+
+async def test_close_while_waiting_first_value():
+    async def fetch():
+        await asyncio.sleep(10)
+
+    subscription = Subscription(fetch, interval=0)
+    waiting = asyncio.ensure_future(subscription.get())
+    await asyncio.sleep(0)
+    await subscription.close()
+
+    with pytest.raises(RuntimeError):
+        await waiting
+
+
+async def test_subscriptions():
+    client = Mock()
+    client.gas_tracker.gas_oracle = AsyncMock(return_value={'SafeGasPrice': '10'})
+    client.proxy.gas_price = AsyncMock(return_value='0x3b9aca00')
+    client.proxy.block_number = AsyncMock(return_value='0x10')
+    subscriptions = Subscriptions(client, interval=10)
+
+    assert await subscriptions.gas_oracle.get() == {'SafeGasPrice': '10'}
+    assert await subscriptions.gas_price.get() == 10**9
+    assert await subscriptions.block_number.get() == 16
+    await subscriptions.close()
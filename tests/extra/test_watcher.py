@@ -0,0 +1,181 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.watcher import ConfirmationWatcher
+
+OLD_TX, NEW_TX, REORGED_TX = '0x' + 'a' * 64, '0x' + 'b' * 64, '0x' + 'c' * 64
+
+
+class Chain:
+    def __init__(self, head: int) -> None:
+        self.head = head
+        self.txs = {OLD_TX: 90}  # mined before watching
+
+    async def block_number(self):
+        self.head += 1
+        if self.head == 102:
+            self.txs[NEW_TX] = 102
+            self.txs[REORGED_TX] = 102
+        if self.head == 104:
+            del self.txs[REORGED_TX]
+        if self.head == 106:
+            self.txs[REORGED_TX] = 106
+        return hex(self.head)
+
+    async def block_by_number(self, full, tag):
+        return {'transactions': [h.upper() for h, b in self.txs.items() if b == tag]}
+
+    async def tx_receipt(self, txhash):
+        block = self.txs.get(txhash)
+        return {'transactionHash': txhash, 'blockNumber': hex(block)} if block else None
+
+
+@pytest.fixture
+def chain():
+    return Chain(100)
+
+
+@pytest.fixture
+async def watcher(chain):
+    client = Mock()
+    client.proxy.block_number = AsyncMock(side_effect=chain.block_number)
+    client.proxy.block_by_number = AsyncMock(side_effect=chain.block_by_number)
+    client.proxy.tx_receipt = AsyncMock(side_effect=chain.tx_receipt)
+    watcher = ConfirmationWatcher(client, poll_interval=0)
+    yield watcher
+    await watcher.close()
+
+
+async def test_wait_mined_before(watcher):
+    receipt = await watcher.wait(OLD_TX, confirmations=5, timeout=1)
+
+    assert receipt['blockNumber'] == hex(90)
+    assert watcher._client.proxy.tx_receipt.await_count == 1
+
+
+async def test_wait_new_tx(watcher, chain):
+    receipt = await watcher.wait(NEW_TX, confirmations=3, timeout=1)
+
+    assert receipt['blockNumber'] == hex(102)
+    assert chain.head == 104
+
+
+async def test_wait_many_txs_calls(watcher, chain):
+    futures = [watcher.watch(NEW_TX, 3)] + [watcher.watch(f'0x{i:064x}') for i in range(100)]
+    assert (await asyncio.wait_for(futures[0], 1))['blockNumber'] == hex(102)
+
+    # a receipt per tx when watched, again once the head moves and per confirmation,
+    # blocks are fetched once
+    client = watcher._client
+    assert client.proxy.tx_receipt.await_count == 203
+    assert client.proxy.block_by_number.await_count == chain.head - 101
+    assert not any(f.done() for f in futures[1:])
+
+
+async def test_wait_reorged(watcher, chain):
+    receipt = await watcher.wait(REORGED_TX, confirmations=3, timeout=1)
+    assert receipt['blockNumber'] == hex(106)
+
+
+async def test_wait_receipt_lagging(watcher, chain):
+    lagging = True
+
+    async def tx_receipt(txhash):
+        nonlocal lagging
+        receipt = await chain.tx_receipt(txhash)
+        if receipt is not None and lagging:
+            lagging = False
+            return None
+        return receipt
+
+    watcher._client.proxy.tx_receipt.side_effect = tx_receipt
+    receipt = await watcher.wait(NEW_TX, timeout=1)
+
+    assert receipt['blockNumber'] == hex(102)
+    assert watcher._client.proxy.tx_receipt.await_count == 3
+
+
+async def test_wait_mined_before_receipt_lagging(watcher, chain):
+    lagging = True
+
+    async def tx_receipt(txhash):
+        nonlocal lagging
+        if lagging:
+            lagging = False
+            return None
+        return await chain.tx_receipt(txhash)
+
+    watcher._client.proxy.tx_receipt.side_effect = tx_receipt
+    receipt = await watcher.wait(OLD_TX, timeout=1)
+
+    assert receipt['blockNumber'] == hex(90)
+    assert watcher._client.proxy.tx_receipt.await_count == 2
+
+
+async def test_watch_several_depths(watcher):
+    shallow, deep = watcher.watch(NEW_TX, 1), watcher.watch(NEW_TX.upper(), 4)
+
+    assert (await asyncio.wait_for(shallow, 1))['blockNumber'] == hex(102)
+    assert not deep.done()
+    assert (await asyncio.wait_for(deep, 1))['blockNumber'] == hex(102)
+
+
+async def test_poller_stops(watcher):
+    with pytest.raises(asyncio.TimeoutError):
+        await watcher.wait('0x' + 'd' * 64, timeout=0.01)
+    await asyncio.sleep(0.01)
+
+    assert watcher._task.done()
+    assert not watcher._pending
+
+
+async def test_poll_errors(watcher, chain):
+    calls = 0
+
+    async def flaky_block_number():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise EtherscanClientApiError('NOTOK', 'Max rate limit reached')
+        if calls == 2:
+            raise ConnectionResetError()
+        return await chain.block_number()
+
+    watcher._client.proxy.block_number.side_effect = flaky_block_number
+    assert await watcher.wait(OLD_TX, timeout=1)
+    assert calls == 3
+
+
+async def test_block_not_served(watcher, chain):
+    block_by_number = chain.block_by_number
+    calls = 0
+
+    async def flaky_block_by_number(full, tag):
+        nonlocal calls
+        calls += 1
+        return None if calls == 1 else await block_by_number(full, tag)
+
+    watcher._client.proxy.block_by_number.side_effect = flaky_block_by_number
+    assert (await watcher.wait(NEW_TX, timeout=1))['blockNumber'] == hex(102)
+
+
+async def test_close(watcher):
+    future = watcher.watch(NEW_TX, confirmations=100)
+    await watcher.close()
+
+    assert future.cancelled()
+    with pytest.raises(ValueError):
+        watcher.watch(NEW_TX, confirmations=0)
+
+
+async def test_poller_failed(watcher):
+    watcher._client.proxy.block_number.side_effect = KeyError('result')
+    futures = [watcher.watch(OLD_TX), watcher.watch(NEW_TX, 3)]
+
+    for future in futures:
+        with pytest.raises(KeyError):
+            await asyncio.wait_for(future, 1)
+    assert not watcher._pending
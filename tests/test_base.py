@@ -0,0 +1,87 @@
+import inspect
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aioetherscan.common import check_tag
+from aioetherscan.modules.account import Account
+from aioetherscan.modules.base import BaseModule, Endpoint, Param, endpoint, get_endpoint
+from aioetherscan.modules.proxy import Proxy
+from aioetherscan.modules.stats import Stats
+from aioetherscan.modules.token import Token
+
+
+def test_endpoints():
+    assert Account.endpoints['balance'] == Endpoint(
+        'Account.balance',
+        frozenset({'address', 'tag'}),
+        'account',
+        'balance',
+        (Param('address', 'address'), Param('tag', 'tag', check_tag)),
+    )
+    assert Token.endpoints['total_supply'].key == 'stats:tokensupply'
+    assert Account.endpoints['token_transfers'].key == 'Account.token_transfers'
+    assert 'eth_supply' in Stats.endpoints
+    assert '_get' not in Account.endpoints
+    assert Account.endpoints is not Stats.endpoints
+
+
+def test_generated_method():
+    assert Account.balance.__name__ == 'balance'
+    assert Account.balance.__doc__ == 'Get Ether Balance for a single Address.'
+    assert str(inspect.signature(Account.balance)) == (
+        "(self, address: str, tag: str = 'latest') -> str"
+    )
+    assert inspect.iscoroutinefunction(Account.balance)
+
+
+async def test_request():
+    client = Mock()
+    client._http.get = AsyncMock()
+    client._http.post = AsyncMock()
+    proxy = Proxy(client)
+
+    await proxy.call('0x1', '0x2', 3)
+    client._http.get.assert_awaited_once_with(
+        params=dict(module='proxy', action='eth_call', to='0x1', data='0x2', tag='0x3')
+    )
+    await proxy.call('0x1', '0x2', post=True)
+    client._http.post.assert_awaited_once_with(
+        data=dict(module='proxy', action='eth_call', to='0x1', data='0x2', tag='latest')
+    )
+
+
+def test_declaration_errors():
+    with pytest.raises(TypeError):
+
+        class NotDeclared(BaseModule):
+            _module = 'test'
+
+            async def method(self, a): ...
+
+    with pytest.raises(TypeError):
+
+        class UnknownArgument(BaseModule):
+            _module = 'test'
+
+            @endpoint('action', dict(b='c'))
+            async def method(self, a): ...
+
+
+def test_get_endpoint():
+    account = Account(Mock())
+    with patch('inspect.getfullargspec') as getfullargspec_mock:
+        assert get_endpoint(account.balance) is Account.endpoints['balance']
+        getfullargspec_mock.assert_not_called()
+
+
+def test_get_endpoint_callable():
+    async def api_method(address, page=None): ...
+
+    assert get_endpoint(api_method) == Endpoint(
+        api_method.__qualname__, frozenset({'address', 'page'})
+    )
+    assert get_endpoint(api_method).key == api_method.__qualname__
+    with patch('inspect.getfullargspec') as getfullargspec_mock:
+        get_endpoint(api_method)
+        getfullargspec_mock.assert_not_called()
@@ -0,0 +1,229 @@
+import csv
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aioetherscan.cli import main, parse_block
+from aioetherscan.exceptions import EtherscanClientApiError
+from aioetherscan.modules.extra.generators.checkpoint import SqliteCheckpointStore
+
+A1, A2 = '0x' + '1' * 40, '0x' + '2' * 40
+HEAD = 1000
+
+
+def read_jsonl(path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def client_mock(fail_at=None):
+    """Client which yields 6 txs per address saving a checkpoint every 2 txs."""
+
+    async def normal_txs(address, checkpoint=None, resume=False, **kwargs):
+        state = checkpoint.load(address) if checkpoint is not None and resume else None
+        for i in range(state['n'] if state else 0, 6):
+            if i == fail_at:
+                raise EtherscanClientApiError('NOTOK', 'error')
+            yield {'address': address, 'blockNumber': str(i)}
+            if checkpoint is not None and i % 2:
+                checkpoint.save(address, dict(n=i + 1))
+
+    client = MagicMock()
+    client.extra.generators.normal_txs = MagicMock(side_effect=normal_txs)
+    client.proxy.block_number = AsyncMock(return_value=hex(HEAD))
+    client.close = AsyncMock()
+    return client
+
+
+def run(*args) -> int:
+    return main(['export', 'normal', *args, '--api-key', 'key'])
+
+
+def test_export(tmp_path, capsys):
+    output = str(tmp_path / '{kind}-{address}.jsonl')
+    with patch('aioetherscan.cli.Client', return_value=client_mock()) as client_cls:
+        assert run(A1, A2.upper().replace('0X', '0x'), '-o', output) == 0
+
+    for address in (A1, A2):
+        rows = read_jsonl(output.format(kind='normal', address=address))
+        assert rows == [{'address': address, 'blockNumber': str(i)} for i in range(6)]
+    client_cls.return_value.close.assert_awaited_once()
+    assert '2/2 jobs (0 skipped, 0 failed), 12 rows' in capsys.readouterr().err
+
+
+def test_export_addresses_file_and_key_pool(tmp_path):
+    addresses_file = tmp_path / 'addresses.txt'
+    addresses_file.write_text(f'{A1}  # first\n\n{A2}\n{A1}\n')
+    output = str(tmp_path / '{address}.csv')
+    clients = [client_mock(), client_mock()]
+
+    with patch('aioetherscan.cli.Client', side_effect=clients):
+        args = ['--addresses-file', str(addresses_file), '--api-key', 'key2', '--format', 'csv']
+        assert run(*args, '-o', output) == 0
+
+    for client in clients:
+        client.extra.generators.normal_txs.assert_called_once()
+    with open(output.format(address=A2)) as f:
+        assert len(list(csv.DictReader(f))) == 6
+
+
+def test_export_resume(tmp_path, capsys):
+    output = str(tmp_path / '{address}.jsonl')
+    checkpoint = str(tmp_path / 'checkpoint.sqlite')
+
+    with patch('aioetherscan.cli.Client', return_value=client_mock(fail_at=4)):
+        assert run(A1, '-o', output, '--checkpoint', checkpoint) == 1
+    assert '0/1 jobs (0 skipped, 1 failed)' in capsys.readouterr().err
+    assert len(read_jsonl(output.format(address=A1))) == 4
+
+    with patch('aioetherscan.cli.Client', return_value=client_mock()):
+        assert run(A1, '-o', output, '--checkpoint', checkpoint, '--resume') == 0
+    assert [r['blockNumber'] for r in read_jsonl(output.format(address=A1))] == [
+        str(i) for i in range(6)
+    ]
+
+    client = client_mock()
+    with patch('aioetherscan.cli.Client', return_value=client):
+        assert run(A1, '-o', output, '--checkpoint', checkpoint, '--resume') == 0
+    client.extra.generators.normal_txs.assert_not_called()
+    assert '1/1 jobs (1 skipped, 0 failed)' in capsys.readouterr().err
+
+    client = client_mock()
+    with patch('aioetherscan.cli.Client', return_value=client):
+        args = ['--checkpoint', checkpoint, '--resume', '--api-kind', 'bsc']
+        assert run(A1, '-o', output, *args) == 0
+    client.extra.generators.normal_txs.assert_called_once()  # progress of another chain
+
+
+@pytest.mark.parametrize('max_file_size', [None, 1])
+def test_export_resume_flushed_window(tmp_path, max_file_size):
+    output = str(tmp_path / '{address}-{part}.jsonl')
+    args = ['-o', output, '--checkpoint', str(tmp_path / 'checkpoint.sqlite'), '--batch-size', '1']
+    if max_file_size:
+        args += ['--max-file-size', str(max_file_size)]
+
+    with patch('aioetherscan.cli.Client', return_value=client_mock(fail_at=3)):
+        assert run(A1, *args) == 1
+    with patch('aioetherscan.cli.Client', return_value=client_mock()):
+        assert run(A1, *args, '--resume') == 0
+
+    rows = [r for path in sorted(tmp_path.glob('*.jsonl')) for r in read_jsonl(path)]
+    assert [r['blockNumber'] for r in rows] == [str(i) for i in range(6)]
+
+
+def test_export_end_block_head(tmp_path):
+    output, checkpoint = str(tmp_path / '{address}.jsonl'), str(tmp_path / 'checkpoint.sqlite')
+    client = client_mock()
+    with patch('aioetherscan.cli.Client', return_value=client):
+        assert run(A1, A2, '-o', output, '--checkpoint', checkpoint) == 0
+
+    client.proxy.block_number.assert_awaited_once()
+    for call_ in client.extra.generators.normal_txs.call_args_list:
+        assert call_.kwargs['end_block'] == HEAD
+
+    client = client_mock()
+    client.proxy.block_number.return_value = hex(HEAD + 10)
+    with patch('aioetherscan.cli.Client', return_value=client):
+        assert run(A1, A2, '-o', output, '--checkpoint', checkpoint, '--resume') == 0
+    client.proxy.block_number.assert_not_awaited()
+    client.extra.generators.normal_txs.assert_not_called()  # same range is done
+
+
+def test_export_workers_per_key(tmp_path):
+    clients = [client_mock() for _ in range(3)]
+    with patch('aioetherscan.cli.Client', side_effect=clients):
+        args = ['--api-key', 'key2', '--api-key', 'key3', '--concurrency', '1']
+        assert run(A1, A2, '0x' + '3' * 40, *args, '-o', str(tmp_path / '{address}.jsonl')) == 0
+
+    for client in clients:
+        client.extra.generators.normal_txs.assert_called_once()
+
+
+def test_export_generator_params(tmp_path):
+    client = client_mock()
+    with patch('aioetherscan.cli.Client', return_value=client):
+        args = ['--start-block', '2020-01-01', '--end-block', '100', '--target-rows', '500']
+        assert run(A1, '-o', str(tmp_path / '{address}.jsonl'), *args, '--cursor') == 0
+
+    client.extra.generators.normal_txs.assert_called_once_with(
+        A1,
+        start_block=datetime(2020, 1, 1),
+        end_block=100,
+        blocks_limit=2048,
+        target_rows=500,
+        cursor=True,
+        open_range=False,
+        shards=1,
+        prefetch=0,
+        checkpoint=None,
+        resume=False,
+    )
+
+
+def test_export_invalid_args(tmp_path, monkeypatch):
+    monkeypatch.delenv('ETHERSCAN_API_KEY', raising=False)
+    output = str(tmp_path / '{address}.jsonl')
+
+    with pytest.raises(SystemExit):
+        main(['export', 'normal', A1, '-o', output])
+    with pytest.raises(SystemExit):
+        run('-o', output)
+    with pytest.raises(SystemExit):
+        run(A1, '-o', output, '--resume')
+    with pytest.raises(SystemExit):
+        main(['export', 'activity', A1, '--api-key', 'key', '-o', output, '--format', 'csv'])
+    with pytest.raises(SystemExit):
+        run(A1, '-o', output, '--format', 'parquet', '--checkpoint', str(tmp_path / 'db'))
+    with pytest.raises(SystemExit):
+        run(A1, A2, '-o', str(tmp_path / 'out.jsonl'))
+
+
+def test_daily_stats(tmp_path):
+    client = MagicMock()
+    client.stats.daily_transaction_count = AsyncMock(
+        return_value=[
+            {'UTCDate': '2020-01-01', 'transactionCount': 1},
+            {'UTCDate': '2020-01-02', 'transactionCount': 2},
+        ],
+        __name__='daily_transaction_count',
+    )
+    client.close = AsyncMock()
+    output = str(tmp_path / 'stats.csv')
+
+    with patch('aioetherscan.cli.Client', return_value=client):
+        args = ['--start-date', '2020-01-01', '--end-date', '2020-01-02', '--format', 'csv']
+        assert (
+            main(['daily-stats', 'daily_transaction_count', '--api-key', 'k', *args, '-o', output])
+            == 0
+        )
+
+    with open(output) as f:
+        rows = list(csv.DictReader(f))
+    assert [(r['date'], r['transactionCount']) for r in rows] == [
+        ('2020-01-01', '1'),
+        ('2020-01-02', '2'),
+    ]
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('123', 123),
+        ('2020-01-02', datetime(2020, 1, 2)),
+        ('2020-01-02T03:04', datetime(2020, 1, 2, 3, 4)),
+    ],
+)
+def test_parse_block(value, expected):
+    assert parse_block(value) == expected
+
+
+def test_export_done_marker(tmp_path):
+    checkpoint = str(tmp_path / 'checkpoint.sqlite')
+    with patch('aioetherscan.cli.Client', return_value=client_mock()):
+        run(A1, '-o', str(tmp_path / '{address}.jsonl'), '--checkpoint', checkpoint)
+
+    store = SqliteCheckpointStore(checkpoint)
+    assert store.load(f'export:eth:main:normal:{A1}:0:{HEAD}') is not None
+    store.close()
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import patch, AsyncMock, PropertyMock, Mock
 
 import pytest
@@ -8,8 +10,19 @@ from aioetherscan.modules.account import Account
 from aioetherscan.modules.block import Block
 from aioetherscan.modules.contract import Contract
 from aioetherscan.modules.extra import ExtraModules, ContractUtils
+from aioetherscan.modules.extra.block_time import BlockTimeIndex
+from aioetherscan.modules.extra.blocks import BlockFetcher
+from aioetherscan.modules.extra.broadcast import BroadcastQueue, NonceManager
+from aioetherscan.modules.extra.daily_stats import DailyStats
+from aioetherscan.modules.extra.decoder import AbiStore, CalldataDecoder, EventDecoder
 from aioetherscan.modules.extra.generators.generator_utils import GeneratorUtils
+from aioetherscan.modules.extra.history import HistorySampler
 from aioetherscan.modules.extra.link import LinkUtils
+from aioetherscan.modules.extra.multicall import Multicall
+from aioetherscan.modules.extra.profiler import ActivityProfiler
+from aioetherscan.modules.extra.receipts import ReceiptFetcher
+from aioetherscan.modules.extra.subscriptions import Subscriptions
+from aioetherscan.modules.extra.watcher import ConfirmationWatcher
 from aioetherscan.modules.logs import Logs
 from aioetherscan.modules.proxy import Proxy
 from aioetherscan.modules.stats import Stats
@@ -47,6 +60,20 @@ def test_init(client):
     assert isinstance(client.extra.link, LinkUtils)
     assert isinstance(client.extra.contract, ContractUtils)
     assert isinstance(client.extra.generators, GeneratorUtils)
+    assert isinstance(client.extra.profiler, ActivityProfiler)
+    assert isinstance(client.extra.block_time, BlockTimeIndex)
+    assert isinstance(client.extra.daily_stats, DailyStats)
+    assert isinstance(client.extra.history, HistorySampler)
+    assert isinstance(client.extra.abi, AbiStore)
+    assert isinstance(client.extra.events, EventDecoder)
+    assert isinstance(client.extra.calldata, CalldataDecoder)
+    assert isinstance(client.extra.blocks, BlockFetcher)
+    assert isinstance(client.extra.receipts, ReceiptFetcher)
+    assert isinstance(client.extra.watcher, ConfirmationWatcher)
+    assert isinstance(client.extra.subscriptions, Subscriptions)
+    assert isinstance(client.extra.multicall, Multicall)
+    assert isinstance(client.extra.nonces, NonceManager)
+    assert isinstance(client.extra.broadcast, BroadcastQueue)
 
     assert isinstance(client.account._client, Client)
     assert isinstance(client.block._client, Client)
@@ -59,9 +86,43 @@ def test_init(client):
     assert isinstance(client.extra._client, Client)
     assert isinstance(client.extra.contract._client, Client)
     assert isinstance(client.extra.generators._client, Client)
+    assert isinstance(client.extra.profiler._client, Client)
+    assert isinstance(client.extra.block_time._client, Client)
+    assert isinstance(client.extra.daily_stats._client, Client)
+    assert isinstance(client.extra.history._client, Client)
+    assert isinstance(client.extra.abi._client, Client)
+    assert client.extra.events._abi_store is client.extra.abi
+    assert client.extra.calldata._abi_store is client.extra.abi
+    assert isinstance(client.extra.blocks._client, Client)
+    assert isinstance(client.extra.receipts._client, Client)
+    assert isinstance(client.extra.watcher._client, Client)
+    assert isinstance(client.extra.subscriptions._client, Client)
+    assert isinstance(client.extra.multicall._client, Client)
+    assert isinstance(client.extra.nonces._client, Client)
+    assert isinstance(client.extra.broadcast._client, Client)
+    assert client.extra.broadcast._nonces is client.extra.nonces
     assert isinstance(client.extra.link._url_builder, UrlBuilder)
 
 
+def test_lazy_modules(client):
+    assert 'account' not in vars(client)
+    assert 'extra' not in vars(client)
+
+    assert client.account is client.account
+    assert client.extra.abi is client.extra.events._abi_store
+    assert 'account' in vars(client)
+    assert 'multicall' not in vars(client.extra)
+
+
+def test_lazy_imports():
+    script = (
+        'import sys, aioetherscan.cli; '
+        'aioetherscan.Client("key", loop=object(), throttler=object()).extra.watcher; '
+        'print(any(m in sys.modules for m in ("aiohttp", "asyncio_throttle")))'
+    )
+    assert subprocess.check_output([sys.executable, '-c', script]).strip() == b'False'
+
+
 @pytest.mark.asyncio
 async def test_close_session(client):
     with patch('aioetherscan.network.Network.close', new_callable=AsyncMock) as m:
@@ -88,6 +149,10 @@ def test_api_kind(client):
     client._url_builder.api_kind.title.assert_called_once()
 
 
+def test_chain(client):
+    assert client.chain == client._url_builder.chain
+
+
 def test_scaner_url(client):
     url = 'some_url'
     client._url_builder.BASE_URL = url
@@ -132,3 +132,9 @@ def test_fill_topic_operators_exception(logs, topic_operators):
         str(exc_info.value)
         == 'Topic operators must be used with 2 different topics without duplicates.'
     )
+
+
+def test_fill_topics_does_not_mutate(logs):
+    topics = {0: '0x123'}
+    logs._fill_topics(topics, None)
+    assert topics == {0: '0x123'}
@@ -179,6 +179,12 @@ async def test_call(proxy):
                 tag_mock.assert_called_once_with('0x789')
                 mock.assert_called_once()
 
+    with patch('aioetherscan.network.Network.post', new=AsyncMock()) as mock:
+        await proxy.call('0x123', '0x456', post=True)
+        mock.assert_called_once_with(
+            data=dict(module='proxy', action='eth_call', to='0x123', data='0x456', tag='latest')
+        )
+
 
 @pytest.mark.asyncio
 async def test_code(proxy):
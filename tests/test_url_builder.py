@@ -125,6 +125,10 @@ def test_currency(api_kind, expected):
     assert ub.currency == expected
 
 
+def test_chain():
+    assert UrlBuilder(apikey(), 'BSC', 'Testnet').chain == 'bsc:testnet'
+
+
 def test_get_link(ub):
     with patch('aioetherscan.url_builder.urljoin') as join_mock:
         path = 'some_path'